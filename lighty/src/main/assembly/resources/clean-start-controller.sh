@@ -8,4 +8,4 @@ rm -rf cache
 rm -rf target
 
 #start controller
-java -ms128m -mx512m -XX:MaxMetaspaceSize=128m -jar tpce.jar
+java -ms128m -mx512m -XX:MaxMetaspaceSize=128m -jar tpce.jar "$@"
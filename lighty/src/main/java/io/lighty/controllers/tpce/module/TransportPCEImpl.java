@@ -46,8 +46,9 @@ import org.opendaylight.transportpce.olm.service.OlmPowerServiceImpl;
 import org.opendaylight.transportpce.pce.gnpy.consumer.GnpyConsumer;
 import org.opendaylight.transportpce.pce.gnpy.consumer.GnpyConsumerImpl;
 import org.opendaylight.transportpce.pce.impl.PceProvider;
-import org.opendaylight.transportpce.pce.service.PathComputationService;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNetworkCache;
 import org.opendaylight.transportpce.pce.service.PathComputationServiceImpl;
+import org.opendaylight.transportpce.pce.service.PceResultCache;
 import org.opendaylight.transportpce.renderer.RendererProvider;
 import org.opendaylight.transportpce.renderer.openroadminterface.OpenRoadmInterface121;
 import org.opendaylight.transportpce.renderer.openroadminterface.OpenRoadmInterface221;
@@ -90,6 +91,9 @@ public class TransportPCEImpl extends AbstractLightyModule implements TransportP
     private final NetworkTransactionService networkTransaction;
     // pce beans
     private final PceProvider pceProvider;
+    private final PathComputationServiceImpl pathComputationService;
+    private final PceNetworkCache pceNetworkCache;
+    private final PceResultCache pceResultCache;
     // network model beans
     private final NetworkModelProvider networkModelProvider;
     // OLM beans
@@ -112,10 +116,16 @@ public class TransportPCEImpl extends AbstractLightyModule implements TransportP
         // TODO: pass those parameters through command line
         GnpyConsumer gnpyConsumer = new GnpyConsumerImpl("http://127.0.0.1:8008",
                 "gnpy", "gnpy", lightyServices.getAdapterContext().currentSerializer());
-        PathComputationService pathComputationService = new PathComputationServiceImpl(
+        // -Dtransportpce.pce.network-cache-enabled=false reads the networks for each path computation
+        pceNetworkCache = new PceNetworkCache(lightyServices.getBindingDataBroker(),
+                Boolean.parseBoolean(System.getProperty("transportpce.pce.network-cache-enabled", "true")));
+        pceResultCache = new PceResultCache(lightyServices.getBindingDataBroker(), pceNetworkCache);
+        pathComputationService = new PathComputationServiceImpl(
                 networkTransaction,
                 lightyServices.getBindingNotificationPublishService(),
-                gnpyConsumer
+                gnpyConsumer,
+                pceNetworkCache,
+                pceResultCache
                 );
         pceProvider = new PceProvider(lightyServices.getRpcProviderService(), pathComputationService);
 
@@ -188,6 +198,8 @@ public class TransportPCEImpl extends AbstractLightyModule implements TransportP
     @Override
     protected boolean initProcedure() {
         LOG.info("Initializing PCE provider ...");
+        pceNetworkCache.init();
+        pceResultCache.init();
         pceProvider.init();
         LOG.info("Initializing network-model provider ...");
         networkModelProvider.init();
@@ -216,6 +228,9 @@ public class TransportPCEImpl extends AbstractLightyModule implements TransportP
         networkModelProvider.close();
         LOG.info("Shutting down PCE provider ...");
         pceProvider.close();
+        pathComputationService.close();
+        pceResultCache.close();
+        pceNetworkCache.close();
         LOG.info("Shutting down transaction providers ...");
         networkTransaction.close();
         deviceTransactionManager.preDestroy();
@@ -8,6 +8,8 @@
 
 package org.opendaylight.transportpce.pce;
 
+import java.util.List;
+import java.util.concurrent.Executor;
 import org.opendaylight.transportpce.common.ResponseCodes;
 import org.opendaylight.transportpce.common.network.NetworkTransactionService;
 import org.opendaylight.transportpce.pce.constraints.PceConstraints;
@@ -17,7 +19,10 @@ import org.opendaylight.transportpce.pce.gnpy.GnpyResult;
 import org.opendaylight.transportpce.pce.gnpy.GnpyUtilitiesImpl;
 import org.opendaylight.transportpce.pce.gnpy.consumer.GnpyConsumer;
 import org.opendaylight.transportpce.pce.graph.PceGraph;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceBatchContext;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceCalculation;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceLink;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNetworkCache;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceResult;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInputBuilder;
@@ -59,17 +64,44 @@ public class PceSendingPceRPCs {
     private String message;
     private String responseCode;
     private final GnpyConsumer gnpyConsumer;
+    private final PceNetworkCache networkCache;
+    private final PceBatchContext batchContext;
+    private final Executor validationExecutor;
+    private List<PceLink> pathAtoZ;
 
     public PceSendingPceRPCs(GnpyConsumer gnpyConsumer) {
         setPathDescription(null);
         this.input = null;
         this.networkTransaction = null;
         this.gnpyConsumer = gnpyConsumer;
+        this.networkCache = null;
+        this.batchContext = null;
+        this.validationExecutor = null;
     }
 
     public PceSendingPceRPCs(PathComputationRequestInput input,
         NetworkTransactionService networkTransaction, GnpyConsumer gnpyConsumer) {
+        this(input, networkTransaction, gnpyConsumer, null);
+    }
+
+    public PceSendingPceRPCs(PathComputationRequestInput input,
+        NetworkTransactionService networkTransaction, GnpyConsumer gnpyConsumer, PceNetworkCache networkCache) {
+        this(input, networkTransaction, gnpyConsumer, networkCache, null);
+    }
+
+    public PceSendingPceRPCs(PathComputationRequestInput input,
+        NetworkTransactionService networkTransaction, GnpyConsumer gnpyConsumer, PceNetworkCache networkCache,
+        PceBatchContext batchContext) {
+        this(input, networkTransaction, gnpyConsumer, networkCache, batchContext, null);
+    }
+
+    public PceSendingPceRPCs(PathComputationRequestInput input,
+        NetworkTransactionService networkTransaction, GnpyConsumer gnpyConsumer, PceNetworkCache networkCache,
+        PceBatchContext batchContext, Executor validationExecutor) {
         this.gnpyConsumer = gnpyConsumer;
+        this.networkCache = networkCache;
+        this.batchContext = batchContext;
+        this.validationExecutor = validationExecutor;
         setPathDescription(null);
 
         // TODO compliance check to check that input is not empty
@@ -92,8 +124,10 @@ public class PceSendingPceRPCs {
 
     public void pathComputationWithConstraints(PceConstraints hardConstraints, PceConstraints softConstraints) {
 
+        pathAtoZ = null;
         PceCalculation nwAnalizer =
-            new PceCalculation(input, networkTransaction, hardConstraints, softConstraints, rc);
+            new PceCalculation(input, networkTransaction, hardConstraints, softConstraints, rc, networkCache,
+                batchContext);
         nwAnalizer.retrievePceNetwork();
         rc = nwAnalizer.getReturnStructure();
         String serviceType = nwAnalizer.getServiceType();
@@ -104,7 +138,8 @@ public class PceSendingPceRPCs {
         LOG.info("PceGraph ...");
         PceGraph graph = new PceGraph(nwAnalizer.getaendPceNode(),
                 nwAnalizer.getzendPceNode(), nwAnalizer.getAllPceNodes(),
-                hardConstraints, softConstraints, rc, serviceType);
+                hardConstraints, softConstraints, rc, serviceType, validationExecutor);
+        graph.setPathComputationLimits(input);
         graph.calcPath();
         rc = graph.getReturnStructure();
         if (!rc.getStatus()) {
@@ -133,7 +168,9 @@ public class PceSendingPceRPCs {
         rc = description.getReturnStructure();
         if (!rc.getStatus()) {
             LOG.error("In pathComputationWithConstraints, description: result = {}", rc);
+            return;
         }
+        pathAtoZ = graph.getPathAtoZ();
     }
 
     public void pathComputation() throws Exception {
@@ -263,4 +300,12 @@ public class PceSendingPceRPCs {
     public GnpyResult getGnpyZtoA() {
         return gnpyZtoA;
     }
+
+    public List<PceLink> getPathAtoZ() {
+        return pathAtoZ;
+    }
+
+    public PceResult getReturnStructure() {
+        return rc;
+    }
 }
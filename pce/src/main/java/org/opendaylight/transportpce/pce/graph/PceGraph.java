@@ -8,11 +8,18 @@
 
 package org.opendaylight.transportpce.pce.graph;
 
+import com.google.common.base.Throwables;
+import com.google.common.util.concurrent.Futures;
+import com.google.common.util.concurrent.MoreExecutors;
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.Iterator;
 import java.util.List;
 import java.util.Map;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.Executor;
+import java.util.concurrent.Future;
 import org.jgrapht.GraphPath;
 import org.jgrapht.alg.shortestpath.KShortestSimplePaths;
 import org.jgrapht.alg.shortestpath.PathValidator;
@@ -24,6 +31,7 @@ import org.opendaylight.transportpce.pce.networkanalyzer.PceLink;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceNode;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceResult;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceResult.LocalCause;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationLimits;
 import org.opendaylight.yang.gen.v1.http.org.openroadm.common.state.types.rev191129.State;
 import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NodeId;
 import org.slf4j.Logger;
@@ -45,6 +53,8 @@ public class PceGraph {
     private PceNode apceNode = null;
     private PceNode zpceNode = null;
     private String serviceType = "";
+    // candidate paths validation, inline when null
+    private final Executor validationExecutor;
 
     PceConstraints pceHardConstraints;
     PceConstraints pceSoftConstraints;
@@ -61,7 +71,14 @@ public class PceGraph {
     public PceGraph(PceNode aendNode, PceNode zendNode, Map<NodeId, PceNode> allPceNodes,
             PceConstraints pceHardConstraints, PceConstraints pceSoftConstraints, PceResult pceResult,
             String serviceType) {
+        this(aendNode, zendNode, allPceNodes, pceHardConstraints, pceSoftConstraints, pceResult, serviceType, null);
+    }
+
+    public PceGraph(PceNode aendNode, PceNode zendNode, Map<NodeId, PceNode> allPceNodes,
+            PceConstraints pceHardConstraints, PceConstraints pceSoftConstraints, PceResult pceResult,
+            String serviceType, Executor validationExecutor) {
         super();
+        this.validationExecutor = validationExecutor;
         this.apceNode = aendNode;
         this.zpceNode = zendNode;
         this.allPceNodes = allPceNodes;
@@ -90,16 +107,9 @@ public class PceGraph {
 
         // validate found paths
         pceResult.setRC(ResponseCodes.RESPONSE_FAILED);
-        for (GraphPath<String, PceGraphEdge> path : allWPaths) {
-            PostAlgoPathValidator papv = new PostAlgoPathValidator();
-            pceResult = papv.checkPath(path, allPceNodes, pceResult, pceHardConstraints, serviceType);
-            LOG.info("In calcPath after PostAlgoPathValidator {} {}",
-                    pceResult.getResponseCode(), ResponseCodes.RESPONSE_OK);
-
-            if (!pceResult.getResponseCode().equals(ResponseCodes.RESPONSE_OK)) {
-                LOG.info("In calcPath: post algo validations DROPPED the path {}", path);
-                continue;
-            }
+        int validPathIndex = validatePaths();
+        if (validPathIndex >= 0) {
+            GraphPath<String, PceGraphEdge> path = allWPaths.get(validPathIndex);
 
             // build pathAtoZ
             pathAtoZ.clear();
@@ -125,8 +135,6 @@ public class PceGraph {
                         pathAtoZ.size(), path.getWeight(), pathAtoZ);
                     break;
             }
-            break;
-
         }
 
         if (shortestPathAtoZ != null) {
@@ -138,6 +146,53 @@ public class PceGraph {
         return (pceResult.getStatus());
     }
 
+    /**
+     * Validate the candidate paths, concurrently on the validation executor when there are several of them.
+     *
+     * <p>Candidates are validated with their own copy of the PceResult and
+     * awaited in rank order: the first valid one is kept and the validation of
+     * the following ones is cancelled, so that the chosen path and pceResult are
+     * the ones of a validation of the candidates one after the other.
+     *
+     * @return the index of the best ranked valid path in allWPaths, -1 if none is valid.
+     */
+    private int validatePaths() {
+        List<Future<PceResult>> validations = new ArrayList<>();
+        for (GraphPath<String, PceGraphEdge> path : allWPaths) {
+            PceResult candidateResult = new PceResult(pceResult);
+            Callable<PceResult> validation = () -> new PostAlgoPathValidator()
+                .checkPath(path, allPceNodes, candidateResult, pceHardConstraints, serviceType);
+            validations.add(Futures.submit(validation, allWPaths.size() > 1 && validationExecutor != null
+                ? validationExecutor : MoreExecutors.directExecutor()));
+        }
+        try {
+            for (int index = 0; index < validations.size(); index++) {
+                try {
+                    pceResult = validations.get(index).get();
+                } catch (ExecutionException e) {
+                    // raised as a validation one after the other would have done it
+                    Throwables.throwIfUnchecked(e.getCause());
+                    throw new IllegalStateException("validation of the path failed " + allWPaths.get(index), e);
+                }
+                LOG.info("In calcPath after PostAlgoPathValidator {} {}",
+                        pceResult.getResponseCode(), ResponseCodes.RESPONSE_OK);
+                if (pceResult.getResponseCode().equals(ResponseCodes.RESPONSE_OK)) {
+                    LOG.debug("In validatePaths: path {} of {} chosen", index + 1, validations.size());
+                    return index;
+                }
+                LOG.info("In calcPath: post algo validations DROPPED the path {}", allWPaths.get(index));
+            }
+        } catch (InterruptedException e) {
+            LOG.error("In validatePaths: interrupted", e);
+            Thread.currentThread().interrupt();
+            pceResult.setRC(ResponseCodes.RESPONSE_FAILED);
+        } finally {
+            // the candidates ranked after the chosen one are not needed anymore
+            validations.forEach(validation -> validation.cancel(true));
+        }
+        return -1;
+    }
+
     private boolean runKgraphs(DefaultDirectedWeightedGraph<String, PceGraphEdge> weightedGraph) {
 
         if (weightedGraph.edgeSet().isEmpty() || weightedGraph.vertexSet().isEmpty()) {
@@ -250,6 +305,19 @@ public class PceGraph {
         return weight;
     }
 
+    /**
+     * Set kpathsToBring and mhopsPerPath from the max-candidate-paths and
+     * max-hops-per-path of a request, the current values are kept for the absent ones.
+     */
+    public void setPathComputationLimits(PathComputationLimits limits) {
+        if (limits.getMaxCandidatePaths() != null) {
+            this.kpathsToBring = limits.getMaxCandidatePaths().toJava();
+        }
+        if (limits.getMaxHopsPerPath() != null) {
+            this.mhopsPerPath = limits.getMaxHopsPerPath().toJava();
+        }
+    }
+
     public int getKpathsToBring() {
         return kpathsToBring;
     }
@@ -258,6 +326,10 @@ public class PceGraph {
         this.kpathsToBring = kpathsToBring;
     }
 
+    public int getMhopsPerPath() {
+        return mhopsPerPath;
+    }
+
     public void setMhopsPerPath(int mhopsPerPath) {
         this.mhopsPerPath = mhopsPerPath;
     }
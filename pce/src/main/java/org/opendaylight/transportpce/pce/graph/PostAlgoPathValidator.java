@@ -10,7 +10,6 @@ package org.opendaylight.transportpce.pce.graph;
 
 import edu.umd.cs.findbugs.annotations.SuppressFBWarnings;
 import java.util.ArrayList;
-import java.util.Arrays;
 import java.util.BitSet;
 import java.util.Collections;
 import java.util.HashMap;
@@ -24,6 +23,7 @@ import org.opendaylight.transportpce.common.fixedflex.GridUtils;
 import org.opendaylight.transportpce.pce.constraints.PceConstraints;
 import org.opendaylight.transportpce.pce.constraints.PceConstraints.ResourcePair;
 import org.opendaylight.transportpce.pce.model.SpectrumAssignment;
+import org.opendaylight.transportpce.pce.model.SpectrumAvailability;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceNode;
 import org.opendaylight.transportpce.pce.networkanalyzer.PceResult;
 import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.OpenroadmLinkType;
@@ -393,9 +393,7 @@ public class PostAlgoPathValidator {
      */
     private SpectrumAssignment getSpectrumAssignment(GraphPath<String, PceGraphEdge> path,
             Map<NodeId, PceNode> allPceNodes, int spectralWidthSlotNumber) {
-        byte[] freqMap = new byte[GridConstant.NB_OCTECTS];
-        Arrays.fill(freqMap, (byte) GridConstant.AVAILABLE_SLOT_VALUE);
-        BitSet result = BitSet.valueOf(freqMap);
+        SpectrumAvailability result = SpectrumAvailability.allAvailable();
         boolean isFlexGrid = true;
         LOG.info("Processing path {} with length {}", path, path.getLength());
         BitSet pceNodeFreqMap;
@@ -425,31 +423,27 @@ public class PostAlgoPathValidator {
     /**
      * Compute spectrum assignment from spectrum occupation for spectral width.
      *
-     * @param spectrumOccupation      the spectrum occupation BitSet.
+     * @param spectrumOccupation      the spectrum availability along the path.
      * @param spectralWidthSlotNumber the nb slots for spectral width.
      * @param isFlexGrid              true if flexible grid, false otherwise.
      * @return a spectrum assignment object which contains begin and stop index. If
      *         no spectrum assignment found, beginIndex = stopIndex = 0
      */
-    private SpectrumAssignment computeBestSpectrumAssignment(BitSet spectrumOccupation, int spectralWidthSlotNumber,
-            boolean isFlexGrid) {
+    private SpectrumAssignment computeBestSpectrumAssignment(SpectrumAvailability spectrumOccupation,
+            int spectralWidthSlotNumber, boolean isFlexGrid) {
         SpectrumAssignment spectrumAssignment = new SpectrumAssignment(0, 0);
         spectrumAssignment.setFlexGrid(isFlexGrid);
-        BitSet referenceBitSet = new BitSet(spectralWidthSlotNumber);
-        referenceBitSet.set(0, spectralWidthSlotNumber);
         int nbSteps = 1;
         if (isFlexGrid) {
             nbSteps = spectralWidthSlotNumber;
         }
         //higher is the frequency, smallest is the wavelength number
         //in operational, the allocation is done through wavelength starting from the smallest
-        //so we have to loop from the last element of the spectrum occupation
-        for (int i = spectrumOccupation.size(); i >= spectralWidthSlotNumber; i -= nbSteps) {
-            if (spectrumOccupation.get(i - spectralWidthSlotNumber, i).equals(referenceBitSet)) {
-                spectrumAssignment.setBeginIndex(i - spectralWidthSlotNumber);
-                spectrumAssignment.setStopIndex(i - 1);
-                break;
-            }
+        //so the first fit is searched from the last element of the spectrum occupation
+        int beginIndex = spectrumOccupation.firstFit(spectralWidthSlotNumber, nbSteps);
+        if (beginIndex >= 0) {
+            spectrumAssignment.setBeginIndex(beginIndex);
+            spectrumAssignment.setStopIndex(beginIndex + spectralWidthSlotNumber - 1);
         }
         return spectrumAssignment;
     }
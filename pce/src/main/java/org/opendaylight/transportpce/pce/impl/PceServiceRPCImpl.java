@@ -12,6 +12,8 @@ import java.util.concurrent.ExecutionException;
 import org.opendaylight.transportpce.pce.service.PathComputationService;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveInput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveOutput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestOutput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestOutput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.TransportpcePceService;
@@ -58,4 +60,17 @@ public class PceServiceRPCImpl implements TransportpcePceService {
         }
         return RpcResultBuilder.success(output).buildFuture();
     }
+
+    @Override
+    public ListenableFuture<RpcResult<PathComputationBatchRequestOutput>>
+            pathComputationBatchRequest(PathComputationBatchRequestInput input) {
+        LOG.info("RPC path computation batch request received");
+        PathComputationBatchRequestOutput output = null;
+        try {
+            output = this.pathComputationService.pathComputationBatchRequest(input).get();
+        } catch (InterruptedException | ExecutionException e) {
+            LOG.error("RPC path computation batch request failed !", e);
+        }
+        return RpcResultBuilder.success(output).buildFuture();
+    }
 }
@@ -0,0 +1,189 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+package org.opendaylight.transportpce.pce.model;
+
+import java.util.Arrays;
+import java.util.BitSet;
+import org.opendaylight.transportpce.common.fixedflex.GridConstant;
+
+/**
+ * Availability of the C-band frequency slots, packed in 64 bits words.
+ *
+ * <p>Slot i is available when bit i is set, bit i being bit i % 8 of byte i / 8 of
+ * the avail-freq-maps freq-map, as for {@link BitSet#valueOf(byte[])}. The availability
+ * along a path is the word-wide AND of the node availabilities, and the contiguous
+ * blocks are searched run by run of available slots, without per slot allocation.
+ * As in the historical PCE spectrum assignment, the blocks are searched from the
+ * highest slot index (smallest wavelength number) and must end on an index
+ * {@code EFFECTIVE_BITS - k * step}.
+ */
+public final class SpectrumAvailability {
+
+    private static final int WORD_SIZE = Long.SIZE;
+    private static final int NB_WORDS = GridConstant.EFFECTIVE_BITS / WORD_SIZE;
+    private static final long WORD_MASK = 0xffffffffffffffffL;
+
+    private final long[] words;
+
+    private SpectrumAvailability(long[] words) {
+        this.words = words;
+    }
+
+    /**
+     * Availability with all slots available.
+     *
+     * @return a new SpectrumAvailability
+     */
+    public static SpectrumAvailability allAvailable() {
+        long[] words = new long[NB_WORDS];
+        Arrays.fill(words, WORD_MASK);
+        return new SpectrumAvailability(words);
+    }
+
+    /**
+     * Availability of an avail-freq-maps freq-map.
+     *
+     * @param freqMap the freq-map bytes, missing bytes are unavailable slots
+     * @return a new SpectrumAvailability
+     */
+    public static SpectrumAvailability fromFreqMap(byte[] freqMap) {
+        long[] words = new long[NB_WORDS];
+        int nbBytes = Math.min(freqMap.length, GridConstant.NB_OCTECTS);
+        for (int i = 0; i < nbBytes; i++) {
+            words[i >> 3] |= (freqMap[i] & 0xffL) << ((i & 7) << 3);
+        }
+        return new SpectrumAvailability(words);
+    }
+
+    /**
+     * Restrict the availability to the slots available in both.
+     *
+     * @param other the other availability
+     * @return this SpectrumAvailability
+     */
+    public SpectrumAvailability and(SpectrumAvailability other) {
+        for (int i = 0; i < NB_WORDS; i++) {
+            words[i] &= other.words[i];
+        }
+        return this;
+    }
+
+    /**
+     * Restrict the availability to the slots set in a BitSet, as PceNode#getBitSetData.
+     *
+     * @param bitSet the slots available, the slots above its length are unavailable
+     * @return this SpectrumAvailability
+     */
+    public SpectrumAvailability and(BitSet bitSet) {
+        long[] otherWords = bitSet.toLongArray();
+        for (int i = 0; i < NB_WORDS; i++) {
+            words[i] &= i < otherWords.length ? otherWords[i] : 0L;
+        }
+        return this;
+    }
+
+    public boolean isAvailable(int index) {
+        return (words[index >> 6] & (1L << index)) != 0;
+    }
+
+    public int cardinality() {
+        int cardinality = 0;
+        for (long word : words) {
+            cardinality += Long.bitCount(word);
+        }
+        return cardinality;
+    }
+
+    /**
+     * First block of available slots, from the highest slot index.
+     *
+     * @param nbSlots the number of slots of the block
+     * @param step    the alignment of the block end, 1 to try every slot
+     * @return the begin index of the block, -1 if none
+     */
+    public int firstFit(int nbSlots, int step) {
+        for (int last = previousSetBit(GridConstant.EFFECTIVE_BITS - 1); last >= 0; ) {
+            int first = previousClearBit(last) + 1;
+            int begin = fit(first, last, nbSlots, step);
+            if (begin >= 0) {
+                return begin;
+            }
+            last = previousSetBit(first - 1);
+        }
+        return -1;
+    }
+
+    /**
+     * Block of available slots in the smallest run of available slots able to hold it,
+     * to keep the largest runs for the widest services.
+     *
+     * @param nbSlots the number of slots of the block
+     * @param step    the alignment of the block end, 1 to try every slot
+     * @return the begin index of the block, -1 if none
+     */
+    public int bestFit(int nbSlots, int step) {
+        int bestBegin = -1;
+        int bestRunSize = Integer.MAX_VALUE;
+        for (int last = previousSetBit(GridConstant.EFFECTIVE_BITS - 1); last >= 0; ) {
+            int first = previousClearBit(last) + 1;
+            int runSize = last - first + 1;
+            if (runSize < bestRunSize) {
+                int begin = fit(first, last, nbSlots, step);
+                if (begin >= 0) {
+                    bestBegin = begin;
+                    bestRunSize = runSize;
+                    if (runSize == nbSlots) {
+                        break;
+                    }
+                }
+            }
+            last = previousSetBit(first - 1);
+        }
+        return bestBegin;
+    }
+
+    // highest block begin in the run of available slots [first, last], -1 if the run is too small
+    private static int fit(int first, int last, int nbSlots, int step) {
+        int gap = GridConstant.EFFECTIVE_BITS - (last + 1);
+        int end = GridConstant.EFFECTIVE_BITS - (gap + step - 1) / step * step;
+        int begin = end - nbSlots;
+        return begin >= first ? begin : -1;
+    }
+
+    private int previousSetBit(int fromIndex) {
+        if (fromIndex < 0) {
+            return -1;
+        }
+        int wordIndex = fromIndex >> 6;
+        long word = words[wordIndex] & (WORD_MASK >>> -(fromIndex + 1));
+        while (word == 0) {
+            if (wordIndex == 0) {
+                return -1;
+            }
+            word = words[--wordIndex];
+        }
+        return (wordIndex + 1) * WORD_SIZE - 1 - Long.numberOfLeadingZeros(word);
+    }
+
+    private int previousClearBit(int fromIndex) {
+        int wordIndex = fromIndex >> 6;
+        long word = ~words[wordIndex] & (WORD_MASK >>> -(fromIndex + 1));
+        while (word == 0) {
+            if (wordIndex == 0) {
+                return -1;
+            }
+            word = ~words[--wordIndex];
+        }
+        return (wordIndex + 1) * WORD_SIZE - 1 - Long.numberOfLeadingZeros(word);
+    }
+
+    @Override
+    public String toString() {
+        return "SpectrumAvailability [" + BitSet.valueOf(words) + "]";
+    }
+}
@@ -0,0 +1,119 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+
+package org.opendaylight.transportpce.pce.networkanalyzer;
+
+import java.util.BitSet;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Optional;
+import java.util.concurrent.ExecutionException;
+import org.opendaylight.transportpce.common.fixedflex.GridConstant;
+import org.opendaylight.transportpce.common.fixedflex.GridUtils;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.OpenroadmLinkType;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NodeId;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+/**
+ * State shared by the path requests of a path-computation-batch-request.
+ *
+ * <p>All the path requests of a batch are computed against the same version of each
+ * network, taken from the network cache at its first use in the batch. When the
+ * resources are reserved in sequence, the spectrum assigned to a path is removed
+ * from the available spectrum of its ROADM nodes for the next path requests.
+ * The path requests of a batch are computed one after the other, a PceBatchContext
+ * is not thread safe.
+ */
+public class PceBatchContext {
+
+    private static final Logger LOG = LoggerFactory.getLogger(PceBatchContext.class);
+
+    private final PceNetworkCache networkCache;
+    private final boolean reserveInSequence;
+    // network-id -> snapshot used by the whole batch, empty if the network does not exist
+    private final Map<String, Optional<PceNetworkCache.NetworkSnapshot>> snapshots = new HashMap<>();
+    // ROADM node-id -> slots assigned to the previous path requests of the batch
+    private final Map<NodeId, BitSet> reservedSpectrum = new HashMap<>();
+
+    public PceBatchContext(PceNetworkCache networkCache, boolean reserveInSequence) {
+        this.networkCache = networkCache;
+        this.reserveInSequence = reserveInSequence;
+    }
+
+    public PceNetworkCache getNetworkCache() {
+        return networkCache;
+    }
+
+    public boolean isReserveInSequence() {
+        return reserveInSequence;
+    }
+
+    /**
+     * Snapshot of a network, the same for all the path requests of the batch.
+     *
+     * @param networkId openroadm-topology or otn-topology
+     * @return the network snapshot, or null if the network does not exist
+     * @throws ExecutionException when the datastore read fails
+     * @throws InterruptedException when interrupted during the datastore read
+     */
+    public PceNetworkCache.NetworkSnapshot getSnapshot(String networkId)
+            throws ExecutionException, InterruptedException {
+        Optional<PceNetworkCache.NetworkSnapshot> snapshot = snapshots.get(networkId);
+        if (snapshot == null) {
+            snapshot = Optional.ofNullable(networkCache.getSnapshot(networkId));
+            snapshots.put(networkId, snapshot);
+        }
+        return snapshot.orElse(null);
+    }
+
+    /**
+     * Remove the spectrum reserved by the previous path requests from the nodes of a path computation.
+     *
+     * @param allPceNodes the nodes built for the path request
+     */
+    public void applyReservedSpectrum(Map<NodeId, PceNode> allPceNodes) {
+        for (Map.Entry<NodeId, BitSet> reserved : reservedSpectrum.entrySet()) {
+            PceNode pceNode = allPceNodes.get(reserved.getKey());
+            if (pceNode != null && pceNode.getBitSetData() != null) {
+                pceNode.getBitSetData().andNot(reserved.getValue());
+            }
+        }
+    }
+
+    /**
+     * Reserve the spectrum assigned to a path for the next path requests, if reserved in sequence.
+     *
+     * @param path      the links of the path, from A to Z
+     * @param pceResult the result of the path computation, with the spectrum assigned
+     */
+    public void reserveSpectrum(List<PceLink> path, PceResult pceResult) {
+        if (!reserveInSequence || path == null || pceResult.getMinFreq() == null || pceResult.getMaxFreq() == null) {
+            return;
+        }
+        int beginIndex = GridUtils.getIndexFromFrequency(pceResult.getMinFreq());
+        int stopIndex = GridUtils.getIndexFromFrequency(pceResult.getMaxFreq());
+        for (PceLink link : path) {
+            // the spectrum is only reserved on the ROADM nodes, not on the xponders
+            if (link.getlinkType() != OpenroadmLinkType.XPONDEROUTPUT) {
+                reserveSpectrum(link.getSourceId(), beginIndex, stopIndex);
+            }
+            if (link.getlinkType() != OpenroadmLinkType.XPONDERINPUT) {
+                reserveSpectrum(link.getDestId(), beginIndex, stopIndex);
+            }
+        }
+        LOG.info("reserveSpectrum: slots {} to {} reserved on {} nodes", beginIndex, stopIndex - 1,
+            reservedSpectrum.size());
+    }
+
+    private void reserveSpectrum(NodeId nodeId, int beginIndex, int stopIndex) {
+        reservedSpectrum.computeIfAbsent(nodeId, id -> new BitSet(GridConstant.EFFECTIVE_BITS))
+            .set(beginIndex, stopIndex);
+    }
+}
@@ -87,15 +87,33 @@ public class PceCalculation {
     }
 
     private MappingUtils mappingUtils;
+    // null when the network is read from the datastore for each request
+    private PceNetworkCache networkCache;
+    // null unless the request is part of a path-computation-batch-request
+    private PceBatchContext batchContext;
 
     public PceCalculation(PathComputationRequestInput input, NetworkTransactionService networkTransactionService,
             PceConstraints pceHardConstraints, PceConstraints pceSoftConstraints, PceResult rc) {
+        this(input, networkTransactionService, pceHardConstraints, pceSoftConstraints, rc, null);
+    }
+
+    public PceCalculation(PathComputationRequestInput input, NetworkTransactionService networkTransactionService,
+            PceConstraints pceHardConstraints, PceConstraints pceSoftConstraints, PceResult rc,
+            PceNetworkCache networkCache) {
+        this(input, networkTransactionService, pceHardConstraints, pceSoftConstraints, rc, networkCache, null);
+    }
+
+    public PceCalculation(PathComputationRequestInput input, NetworkTransactionService networkTransactionService,
+            PceConstraints pceHardConstraints, PceConstraints pceSoftConstraints, PceResult rc,
+            PceNetworkCache networkCache, PceBatchContext batchContext) {
         this.input = input;
         this.networkTransactionService = networkTransactionService;
         this.returnStructure = rc;
 
         this.pceHardConstraints = pceHardConstraints;
         this.mappingUtils = new MappingUtilsImpl(networkTransactionService.getDataBroker());
+        this.networkCache = networkCache;
+        this.batchContext = batchContext;
         parseInput();
     }
 
@@ -113,6 +131,9 @@ public class PceCalculation {
             returnStructure.setRC(ResponseCodes.RESPONSE_FAILED);
             return;
         }
+        if (batchContext != null) {
+            batchContext.applyReservedSpectrum(allPceNodes);
+        }
         printNodesInfo(allPceNodes);
 
         returnStructure.setRC(ResponseCodes.RESPONSE_OK);
@@ -183,7 +204,6 @@ public class PceCalculation {
 
     private boolean readMdSal() {
         InstanceIdentifier<Network> nwInstanceIdentifier = null;
-        Network nw = null;
         if (("OC".equals(serviceFormatA)) || ("OTU".equals(serviceFormatA)) || (("Ethernet".equals(serviceFormatA))
             && (serviceRate == 100L))) {
 
@@ -200,6 +220,46 @@ public class PceCalculation {
             return false;
         }
 
+        if (networkCache != null) {
+            if (!readNetworkCache(nwInstanceIdentifier.firstKeyOf(Network.class).getNetworkId().getValue())) {
+                return false;
+            }
+        } else {
+            Network nw = readNetwork(nwInstanceIdentifier);
+            if (nw == null) {
+                LOG.error("readMdSal: network is null: {}", nwInstanceIdentifier);
+                return false;
+            }
+            allNodes = nw.nonnullNode().values().stream().sorted((n1, n2)
+                -> n1.getNodeId().getValue().compareTo(n2.getNodeId().getValue())).collect(Collectors.toList());
+            Network1 nw1 = nw.augmentation(Network1.class);
+            if (nw1 != null) {
+                allLinks = nw1.nonnullLink().values().stream().sorted((l1, l2)
+                    -> l1.getSource().getSourceTp().toString().compareTo(l2.getSource().getSourceTp().toString()))
+                        .collect(Collectors.toList());
+            } else {
+                LOG.warn("no otn links in otn-topology");
+            }
+        }
+        if (allNodes == null || allNodes.isEmpty()) {
+            LOG.error("readMdSal: no nodes ");
+            return false;
+        }
+        LOG.info("readMdSal: network nodes: {} nodes added", allNodes.size());
+        LOG.debug("readMdSal: network nodes: {} nodes added", allNodes);
+
+        if (allLinks == null || allLinks.isEmpty()) {
+            LOG.error("readMdSal: no links ");
+            return false;
+        }
+        LOG.info("readMdSal: network links: {} links added", allLinks.size());
+        LOG.debug("readMdSal: network links: {} links added", allLinks);
+
+        return true;
+    }
+
+    private Network readNetwork(InstanceIdentifier<Network> nwInstanceIdentifier) {
+        Network nw = null;
         try {
             Optional<Network> nwOptional =
                 networkTransactionService.read(LogicalDatastoreType.CONFIGURATION, nwInstanceIdentifier).get();
@@ -215,35 +275,26 @@ public class PceCalculation {
                 "readMdSal: Error reading from operational store, topology : " + nwInstanceIdentifier + " :" + e);
         }
         networkTransactionService.close();
+        return nw;
+    }
 
-        if (nw == null) {
-            LOG.error("readMdSal: network is null: {}", nwInstanceIdentifier);
-            return false;
-        }
-        allNodes = nw.nonnullNode().values().stream().sorted((n1, n2)
-            -> n1.getNodeId().getValue().compareTo(n2.getNodeId().getValue())).collect(Collectors.toList());
-        Network1 nw1 = nw.augmentation(Network1.class);
-        if (nw1 != null) {
-            allLinks = nw1.nonnullLink().values().stream().sorted((l1, l2)
-                -> l1.getSource().getSourceTp().toString().compareTo(l2.getSource().getSourceTp().toString()))
-                    .collect(Collectors.toList());
-        } else {
-            LOG.warn("no otn links in otn-topology");
-        }
-        if (allNodes == null || allNodes.isEmpty()) {
-            LOG.error("readMdSal: no nodes ");
-            return false;
+    private boolean readNetworkCache(String networkId) {
+        PceNetworkCache.NetworkSnapshot snapshot;
+        try {
+            snapshot = batchContext != null ? batchContext.getSnapshot(networkId) : networkCache.getSnapshot(networkId);
+        } catch (InterruptedException | ExecutionException e) {
+            LOG.error("readMdSal: Error reading topology {}", networkId);
+            returnStructure.setRC(ResponseCodes.RESPONSE_FAILED);
+            throw new RuntimeException(
+                "readMdSal: Error reading from operational store, topology : " + networkId + " :" + e);
         }
-        LOG.info("readMdSal: network nodes: {} nodes added", allNodes.size());
-        LOG.debug("readMdSal: network nodes: {} nodes added", allNodes);
-
-        if (allLinks == null || allLinks.isEmpty()) {
-            LOG.error("readMdSal: no links ");
+        if (snapshot == null) {
+            LOG.error("readMdSal: network is null: {}", networkId);
             return false;
         }
-        LOG.info("readMdSal: network links: {} links added", allLinks.size());
-        LOG.debug("readMdSal: network links: {} links added", allLinks);
-
+        LOG.info("readMdSal: network {} version {} from cache", networkId, snapshot.getVersion());
+        allNodes = snapshot.getNodes();
+        allLinks = snapshot.getLinks();
         return true;
     }
 
@@ -507,7 +558,7 @@ public class PceCalculation {
             deviceNodeId = node.getNodeId().getValue();
         }
         LOG.info("Device node id {} for {}", deviceNodeId, node);
-        PceOpticalNode pceNode = new PceOpticalNode(node, nodeType, mappingUtils.getOpenRoadmVersion(deviceNodeId),
+        PceOpticalNode pceNode = new PceOpticalNode(node, nodeType, getOpenRoadmVersion(deviceNodeId),
                 getSlotWidthGranularity(deviceNodeId, node.getNodeId()));
         pceNode.validateAZxponder(anodeId, znodeId, input.getServiceAEnd().getServiceFormat());
         pceNode.initFrequenciesBitSet();
@@ -685,6 +736,12 @@ public class PceCalculation {
         }));
     }
 
+    private String getOpenRoadmVersion(String deviceNodeId) {
+        return networkCache != null
+            ? networkCache.getOpenRoadmVersion(deviceNodeId)
+            : mappingUtils.getOpenRoadmVersion(deviceNodeId);
+    }
+
     /**
      * Get mc capability slot width granularity for device.
      * @param deviceNodeId String
@@ -694,7 +751,9 @@ public class PceCalculation {
     private BigDecimal getSlotWidthGranularity(String deviceNodeId, NodeId nodeId) {
         // nodeId: openroadm-topology level node
         // deviceNodeId: openroadm-network level node
-        List<McCapabilities> mcCapabilities = mappingUtils.getMcCapabilitiesForNode(deviceNodeId);
+        List<McCapabilities> mcCapabilities = networkCache != null
+            ? networkCache.getMcCapabilitiesForNode(deviceNodeId)
+            : mappingUtils.getMcCapabilitiesForNode(deviceNodeId);
         String[] params = nodeId.getValue().split("-");
         // DEGX or SRGX
         String rdmModuleName = params[params.length - 1];
@@ -0,0 +1,328 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+
+package org.opendaylight.transportpce.pce.networkanalyzer;
+
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Optional;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ExecutionException;
+import java.util.function.Function;
+import java.util.stream.Collectors;
+import org.opendaylight.mdsal.binding.api.DataBroker;
+import org.opendaylight.mdsal.binding.api.DataObjectModification;
+import org.opendaylight.mdsal.binding.api.DataTreeChangeListener;
+import org.opendaylight.mdsal.binding.api.DataTreeIdentifier;
+import org.opendaylight.mdsal.binding.api.DataTreeModification;
+import org.opendaylight.mdsal.binding.api.ReadTransaction;
+import org.opendaylight.mdsal.common.api.LogicalDatastoreType;
+import org.opendaylight.transportpce.common.InstanceIdentifiers;
+import org.opendaylight.transportpce.common.mapping.MappingUtils;
+import org.opendaylight.transportpce.common.mapping.MappingUtilsImpl;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.nodes.McCapabilities;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NetworkId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.Networks;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NodeId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.Network;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.NetworkKey;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.Node;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.LinkId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.Network1;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.networks.network.Link;
+import org.opendaylight.yangtools.concepts.ListenerRegistration;
+import org.opendaylight.yangtools.yang.binding.InstanceIdentifier;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+/**
+ * Cache of the openroadm-topology and otn-topology used by the path computations.
+ *
+ * <p>The nodes and links of each network are kept up to date node by node and
+ * link by link from the datastore change notifications, and every change bumps
+ * the version of the network. PceCalculation gets the sorted node and link lists
+ * of the current version instead of reading the whole network for each request,
+ * as well as the portmapping data (OpenROADM version and mc-capabilities) of the
+ * devices, which are reread only after a topology change. A device without portmapping
+ * data is looked up again at each request until its portmapping is written.
+ *
+ * <p>The change notifications are delivered asynchronously, after the commit of the
+ * topology change. Until the notification is processed, usually a few milliseconds
+ * later, a path computation still gets the previous version of the network, and so
+ * do the PceResultCache keys. A path computation that must see a topology change it
+ * has just committed can be run with the cache disabled (network-cache-enabled=false
+ * in org.opendaylight.transportpce.pce.cfg). A disabled cache reads the networks and
+ * the portmapping from the datastore for each path computation.
+ */
+public class PceNetworkCache implements DataTreeChangeListener<Network> {
+
+    private static final Logger LOG = LoggerFactory.getLogger(PceNetworkCache.class);
+    private static final List<InstanceIdentifier<Network>> NETWORK_IIDS =
+        List.of(InstanceIdentifiers.OVERLAY_NETWORK_II, InstanceIdentifiers.OTN_NETWORK_II);
+
+    private final DataBroker dataBroker;
+    private final MappingUtils mappingUtils;
+    private final boolean enabled;
+    private final List<ListenerRegistration<PceNetworkCache>> registrations = new ArrayList<>();
+    // network-id -> nodes and links, present once the network has been read or notified
+    private final Map<String, NetworkState> networks = new HashMap<>();
+    // network-id -> version, kept when the network is removed
+    private final Map<String, Long> versions = new HashMap<>();
+    // device node-id -> portmapping data, cleared on each topology change
+    private final Map<String, String> openRoadmVersions = new ConcurrentHashMap<>();
+    private final Map<String, List<McCapabilities>> mcCapabilities = new ConcurrentHashMap<>();
+
+    public PceNetworkCache(DataBroker dataBroker) {
+        this(dataBroker, true);
+    }
+
+    public PceNetworkCache(DataBroker dataBroker, boolean enabled) {
+        this.dataBroker = dataBroker;
+        this.mappingUtils = new MappingUtilsImpl(dataBroker);
+        this.enabled = enabled;
+    }
+
+    /*
+     * Method called when the blueprint container is created.
+     */
+    public void init() {
+        if (!enabled) {
+            LOG.info("PceNetworkCache disabled, the networks are read for each path computation");
+            return;
+        }
+        LOG.info("PceNetworkCache Initiated");
+        for (InstanceIdentifier<Network> networkIid : NETWORK_IIDS) {
+            registrations.add(dataBroker.registerDataTreeChangeListener(
+                DataTreeIdentifier.create(LogicalDatastoreType.CONFIGURATION, networkIid), this));
+        }
+    }
+
+    /*
+     * Method called when the blueprint container is destroyed.
+     */
+    public void close() {
+        LOG.info("PceNetworkCache Closed");
+        registrations.forEach(ListenerRegistration::close);
+        registrations.clear();
+        synchronized (this) {
+            networks.clear();
+        }
+    }
+
+    /**
+     * Snapshot of the current version of a network, read from the datastore if not cached yet.
+     *
+     * @param networkId openroadm-topology or otn-topology
+     * @return the network snapshot, or null if the network does not exist
+     * @throws ExecutionException when the datastore read fails
+     * @throws InterruptedException when interrupted during the datastore read
+     */
+    public NetworkSnapshot getSnapshot(String networkId) throws ExecutionException, InterruptedException {
+        if (!enabled) {
+            Optional<Network> network = readNetwork(networkId);
+            return network.isEmpty() ? null : new NetworkState(network.get()).snapshot(networkId, 0L);
+        }
+        long version;
+        synchronized (this) {
+            NetworkState state = networks.get(networkId);
+            if (state != null) {
+                return state.snapshot(networkId, getVersion(networkId));
+            }
+            version = getVersion(networkId);
+        }
+        Optional<Network> network = readNetwork(networkId);
+        if (network.isEmpty()) {
+            LOG.warn("getSnapshot: network {} not found", networkId);
+            return null;
+        }
+        NetworkState state = new NetworkState(network.get());
+        synchronized (this) {
+            // a change notified during the read wins over the data read
+            if (getVersion(networkId) == version && !networks.containsKey(networkId)) {
+                networks.put(networkId, state);
+                LOG.info("getSnapshot: network {} version {} cached, {} nodes and {} links", networkId, version,
+                    state.nodes.size(), state.links.size());
+            }
+            return state.snapshot(networkId, version);
+        }
+    }
+
+    public synchronized long getVersion(String networkId) {
+        return versions.getOrDefault(networkId, 0L);
+    }
+
+    public boolean isEnabled() {
+        return enabled;
+    }
+
+    public String getOpenRoadmVersion(String deviceNodeId) {
+        if (!enabled) {
+            return mappingUtils.getOpenRoadmVersion(deviceNodeId);
+        }
+        // a null version, portmapping not found, is not cached
+        return openRoadmVersions.computeIfAbsent(deviceNodeId, mappingUtils::getOpenRoadmVersion);
+    }
+
+    public List<McCapabilities> getMcCapabilitiesForNode(String deviceNodeId) {
+        List<McCapabilities> nodeMcCapabilities = mcCapabilities.get(deviceNodeId);
+        if (nodeMcCapabilities != null) {
+            return nodeMcCapabilities;
+        }
+        nodeMcCapabilities = mappingUtils.getMcCapabilitiesForNode(deviceNodeId);
+        // the portmapping of a device can be written without topology change, an empty lookup is not cached
+        if (enabled && nodeMcCapabilities != null && !nodeMcCapabilities.isEmpty()) {
+            mcCapabilities.put(deviceNodeId, nodeMcCapabilities);
+        }
+        return nodeMcCapabilities;
+    }
+
+    private Optional<Network> readNetwork(String networkId) throws ExecutionException, InterruptedException {
+        InstanceIdentifier<Network> networkIid = InstanceIdentifier.builder(Networks.class)
+            .child(Network.class, new NetworkKey(new NetworkId(networkId))).build();
+        try (ReadTransaction readTx = dataBroker.newReadOnlyTransaction()) {
+            return readTx.read(LogicalDatastoreType.CONFIGURATION, networkIid).get();
+        }
+    }
+
+    @Override
+    public void onDataTreeChanged(Collection<DataTreeModification<Network>> changes) {
+        for (DataTreeModification<Network> change : changes) {
+            NetworkKey networkKey = change.getRootPath().getRootIdentifier().firstKeyOf(Network.class);
+            if (networkKey == null) {
+                continue;
+            }
+            String networkId = networkKey.getNetworkId().getValue();
+            DataObjectModification<Network> rootNode = change.getRootNode();
+            synchronized (this) {
+                long version = getVersion(networkId) + 1;
+                versions.put(networkId, version);
+                switch (rootNode.getModificationType()) {
+                    case WRITE:
+                        networks.put(networkId, new NetworkState(rootNode.getDataAfter()));
+                        LOG.info("onDataTreeChanged: network {} version {} written", networkId, version);
+                        break;
+                    case DELETE:
+                        networks.remove(networkId);
+                        LOG.info("onDataTreeChanged: network {} version {} removed", networkId, version);
+                        break;
+                    case SUBTREE_MODIFIED:
+                        NetworkState state = networks.get(networkId);
+                        if (state != null) {
+                            state.update(rootNode);
+                        }
+                        LOG.debug("onDataTreeChanged: network {} version {} modified", networkId, version);
+                        break;
+                    default:
+                        LOG.warn("onDataTreeChanged: unknown modification {} of network {}",
+                            rootNode.getModificationType(), networkId);
+                        networks.remove(networkId);
+                        break;
+                }
+            }
+        }
+        // a new or removed device comes with a topology change
+        openRoadmVersions.clear();
+        mcCapabilities.clear();
+    }
+
+    /**
+     * Immutable node and link lists of one version of a network, sorted as PceCalculation expects.
+     */
+    public static final class NetworkSnapshot {
+        private final String networkId;
+        private final long version;
+        private final List<Node> nodes;
+        private final List<Link> links;
+
+        NetworkSnapshot(String networkId, long version, List<Node> nodes, List<Link> links) {
+            this.networkId = networkId;
+            this.version = version;
+            this.nodes = nodes;
+            this.links = links;
+        }
+
+        public String getNetworkId() {
+            return networkId;
+        }
+
+        public long getVersion() {
+            return version;
+        }
+
+        public List<Node> getNodes() {
+            return nodes;
+        }
+
+        public List<Link> getLinks() {
+            return links;
+        }
+    }
+
+    private static final class NetworkState {
+        private final Map<NodeId, Node> nodes = new HashMap<>();
+        private final Map<LinkId, Link> links = new HashMap<>();
+        // last snapshot built, reset by any change
+        private NetworkSnapshot snapshot;
+
+        NetworkState(Network network) {
+            nodes.putAll(network.nonnullNode().values().stream()
+                .collect(Collectors.toMap(Node::getNodeId, Function.identity())));
+            Network1 network1 = network.augmentation(Network1.class);
+            if (network1 != null) {
+                links.putAll(network1.nonnullLink().values().stream()
+                    .collect(Collectors.toMap(Link::getLinkId, Function.identity())));
+            }
+        }
+
+        void update(DataObjectModification<Network> rootNode) {
+            for (DataObjectModification<Node> nodeChange : rootNode.getModifiedChildren(Node.class)) {
+                Node before = nodeChange.getDataBefore();
+                Node after = nodeChange.getDataAfter();
+                if (after != null) {
+                    nodes.put(after.getNodeId(), after);
+                } else if (before != null) {
+                    nodes.remove(before.getNodeId());
+                }
+            }
+            DataObjectModification<Network1> network1Change = rootNode.getModifiedAugmentation(Network1.class);
+            if (network1Change != null) {
+                if (network1Change.getDataAfter() == null) {
+                    links.clear();
+                } else {
+                    for (DataObjectModification<Link> linkChange : network1Change.getModifiedChildren(Link.class)) {
+                        Link before = linkChange.getDataBefore();
+                        Link after = linkChange.getDataAfter();
+                        if (after != null) {
+                            links.put(after.getLinkId(), after);
+                        } else if (before != null) {
+                            links.remove(before.getLinkId());
+                        }
+                    }
+                }
+            }
+            snapshot = null;
+        }
+
+        NetworkSnapshot snapshot(String networkId, long version) {
+            if (snapshot == null || snapshot.getVersion() != version) {
+                List<Node> sortedNodes = new ArrayList<>(nodes.values());
+                sortedNodes.sort((n1, n2) -> n1.getNodeId().getValue().compareTo(n2.getNodeId().getValue()));
+                List<Link> sortedLinks = new ArrayList<>(links.values());
+                sortedLinks.sort((l1, l2) -> l1.getSource().getSourceTp().toString()
+                    .compareTo(l2.getSource().getSourceTp().toString()));
+                snapshot = new NetworkSnapshot(networkId, version, Collections.unmodifiableList(sortedNodes),
+                    Collections.unmodifiableList(sortedLinks));
+            }
+            return snapshot;
+        }
+    }
+}
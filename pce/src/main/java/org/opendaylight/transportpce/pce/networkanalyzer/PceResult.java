@@ -46,6 +46,31 @@ public class PceResult {
     private AToZDirection atozdirection = null;
     private ZToADirection ztoadirection = null;
 
+    public PceResult() {
+    }
+
+    /**
+     * Copy of a PceResult, used to validate several candidate paths concurrently.
+     * @param other the PceResult to copy.
+     */
+    public PceResult(PceResult other) {
+        this.calcMessage = other.calcMessage;
+        this.calcStatus = other.calcStatus;
+        this.responseCode = other.responseCode;
+        this.resultWavelength = other.resultWavelength;
+        this.resultTribPort = other.resultTribPort;
+        this.resultTribSlot = other.resultTribSlot;
+        this.resultTribSlotNb = other.resultTribSlotNb;
+        this.serviceType = other.serviceType;
+        this.minFreq = other.minFreq;
+        this.maxFreq = other.maxFreq;
+        this.rate = other.rate;
+        this.serviceFormat = other.serviceFormat;
+        this.localCause = other.localCause;
+        this.atozdirection = other.atozdirection;
+        this.ztoadirection = other.ztoadirection;
+    }
+
     public void setRC(String rc) {
         switch (rc) {
             case ResponseCodes.RESPONSE_OK :
@@ -10,6 +10,8 @@ package org.opendaylight.transportpce.pce.service;
 import com.google.common.util.concurrent.ListenableFuture;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveInput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveOutput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestOutput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestOutput;
 
@@ -34,4 +36,14 @@ public interface PathComputationService {
      */
     ListenableFuture<PathComputationRequestOutput> pathComputationRequest(PathComputationRequestInput input);
 
+    /**
+     * Requests the computation of a batch of paths against a single topology snapshot.
+     * Each path request is analysed and gets its own graph, only the topology read is shared.
+     *
+     * @param input PathComputationBatchRequestInput data
+     * @return output PathComputationBatchRequestOutput data
+     */
+    ListenableFuture<PathComputationBatchRequestOutput> pathComputationBatchRequest(
+            PathComputationBatchRequestInput input);
+
 }
@@ -10,24 +10,35 @@ package org.opendaylight.transportpce.pce.service;
 import com.google.common.util.concurrent.ListenableFuture;
 import com.google.common.util.concurrent.ListeningExecutorService;
 import com.google.common.util.concurrent.MoreExecutors;
+import com.google.common.util.concurrent.ThreadFactoryBuilder;
 import edu.umd.cs.findbugs.annotations.SuppressFBWarnings;
 import java.util.ArrayList;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutorService;
 import java.util.concurrent.Executors;
 import java.util.stream.Collectors;
 import org.opendaylight.mdsal.binding.api.NotificationPublishService;
+import org.opendaylight.transportpce.common.ResponseCodes;
 import org.opendaylight.transportpce.common.network.NetworkTransactionService;
 import org.opendaylight.transportpce.pce.PceComplianceCheck;
 import org.opendaylight.transportpce.pce.PceComplianceCheckResult;
 import org.opendaylight.transportpce.pce.PceSendingPceRPCs;
 import org.opendaylight.transportpce.pce.gnpy.GnpyResult;
 import org.opendaylight.transportpce.pce.gnpy.consumer.GnpyConsumer;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceBatchContext;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNetworkCache;
 import org.opendaylight.yang.gen.v1.gnpy.path.rev200909.result.Response;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveInput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveOutput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.CancelResourceReserveOutputBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestOutput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestOutputBuilder;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInputBuilder;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestOutput;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestOutputBuilder;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.ServicePathRpcResult;
@@ -39,6 +50,12 @@ import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev20
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.gnpy.gnpy.response.response.type.NoPathCaseBuilder;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.gnpy.gnpy.response.response.type.PathCase;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.gnpy.gnpy.response.response.type.PathCaseBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.input.PathRequest;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.output.PathResponse;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.output.PathResponseBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.output.PathResponseKey;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.request.input.ServiceAEndBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.request.input.ServiceZEndBuilder;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.performance.PathProperties;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.performance.PathPropertiesBuilder;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.performance.path.properties.PathMetric;
@@ -57,19 +74,41 @@ import org.slf4j.LoggerFactory;
 public class PathComputationServiceImpl implements PathComputationService {
 
     private static final Logger LOG = LoggerFactory.getLogger(PathComputationServiceImpl.class);
+    private static final int VALIDATION_THREADS = Math.min(Runtime.getRuntime().availableProcessors(), 8);
     private final NotificationPublishService notificationPublishService;
     private NetworkTransactionService networkTransactionService;
     private final ListeningExecutorService executor;
+    // candidate paths validation, shared by the path computations
+    private final ExecutorService validationExecutor;
     private ServicePathRpcResult notification = null;
     private final GnpyConsumer gnpyConsumer;
+    private final PceNetworkCache networkCache;
+    private final PceResultCache resultCache;
 
     public PathComputationServiceImpl(NetworkTransactionService networkTransactionService,
                                       NotificationPublishService notificationPublishService,
                                       GnpyConsumer gnpyConsumer) {
+        this(networkTransactionService, notificationPublishService, gnpyConsumer, null);
+    }
+
+    public PathComputationServiceImpl(NetworkTransactionService networkTransactionService,
+                                      NotificationPublishService notificationPublishService,
+                                      GnpyConsumer gnpyConsumer, PceNetworkCache networkCache) {
+        this(networkTransactionService, notificationPublishService, gnpyConsumer, networkCache, null);
+    }
+
+    public PathComputationServiceImpl(NetworkTransactionService networkTransactionService,
+                                      NotificationPublishService notificationPublishService,
+                                      GnpyConsumer gnpyConsumer, PceNetworkCache networkCache,
+                                      PceResultCache resultCache) {
         this.notificationPublishService = notificationPublishService;
         this.networkTransactionService = networkTransactionService;
         this.executor = MoreExecutors.listeningDecorator(Executors.newFixedThreadPool(5));
+        this.validationExecutor = VALIDATION_THREADS > 1 ? Executors.newFixedThreadPool(VALIDATION_THREADS,
+                new ThreadFactoryBuilder().setNameFormat("pce-path-validation-%d").setDaemon(true).build()) : null;
         this.gnpyConsumer = gnpyConsumer;
+        this.networkCache = networkCache;
+        this.resultCache = resultCache;
     }
 
     public void init() {
@@ -78,6 +117,9 @@ public class PathComputationServiceImpl implements PathComputationService {
 
     public void close() {
         LOG.info("close.");
+        if (validationExecutor != null) {
+            validationExecutor.shutdownNow();
+        }
     }
 
     @SuppressFBWarnings(
@@ -157,18 +199,39 @@ public class PathComputationServiceImpl implements PathComputationService {
                         RpcStatusEx.Pending, "Service compliant, submitting pathComputation Request ...", null);
                 String message = "";
                 String responseCode = "";
-                PceSendingPceRPCs sendingPCE = new PceSendingPceRPCs(input, networkTransactionService,
-                        gnpyConsumer);
-                sendingPCE.pathComputation();
-                message = sendingPCE.getMessage();
-                responseCode = sendingPCE.getResponseCode();
                 PathDescriptionBuilder path = null;
-                path = sendingPCE.getPathDescription();
+                GnpyResult gnpyAtoZ = null;
+                GnpyResult gnpyZtoA = null;
+                Boolean success = null;
+                PceResultCache.CacheKey cacheKey = resultCache == null ? null : resultCache.getKey(input);
+                PceResultCache.CachedResult cachedResult = cacheKey == null ? null : resultCache.get(cacheKey);
+                if (cachedResult != null) {
+                    LOG.info("Path of {} found in the PCE result cache", input.getServiceName());
+                    message = cachedResult.getMessage();
+                    responseCode = cachedResult.getResponseCode();
+                    path = new PathDescriptionBuilder().setAToZDirection(cachedResult.getAtoZDirection())
+                            .setZToADirection(cachedResult.getZtoADirection());
+                    gnpyAtoZ = cachedResult.getGnpyAtoZ();
+                    gnpyZtoA = cachedResult.getGnpyZtoA();
+                    success = true;
+                } else {
+                    PceSendingPceRPCs sendingPCE = new PceSendingPceRPCs(input, networkTransactionService,
+                            gnpyConsumer, networkCache, null, validationExecutor);
+                    sendingPCE.pathComputation();
+                    message = sendingPCE.getMessage();
+                    responseCode = sendingPCE.getResponseCode();
+                    path = sendingPCE.getPathDescription();
+                    gnpyAtoZ = sendingPCE.getGnpyAtoZ();
+                    gnpyZtoA = sendingPCE.getGnpyZtoA();
+                    success = sendingPCE.getSuccess();
+                    if (cacheKey != null && Boolean.TRUE.equals(success) && path != null) {
+                        resultCache.put(cacheKey, new PceResultCache.CachedResult(message, responseCode,
+                                path.getAToZDirection(), path.getZToADirection(), gnpyAtoZ, gnpyZtoA));
+                    }
+                }
                 LOG.info("PCE response: {} {}", message, responseCode);
 
                 //add the GNPy result
-                GnpyResult gnpyAtoZ = sendingPCE.getGnpyAtoZ();
-                GnpyResult gnpyZtoA = sendingPCE.getGnpyZtoA();
                 List<GnpyResponse> listResponse = new ArrayList<>();
                 if (gnpyAtoZ != null) {
                     GnpyResponse respAtoZ = generateGnpyResponse(gnpyAtoZ.getResponse(),"A-to-Z");
@@ -181,7 +244,7 @@ public class PathComputationServiceImpl implements PathComputationService {
                 output.setGnpyResponse(listResponse.stream()
                         .collect(Collectors.toMap(GnpyResponse::key, gnpyResponse -> gnpyResponse)));
 
-                if (Boolean.FALSE.equals(sendingPCE.getSuccess()) || (path == null)) {
+                if (Boolean.FALSE.equals(success) || (path == null)) {
                     configurationResponseCommon.setAckFinalIndicator("Yes")
                             .setRequestId(input.getServiceHandlerHeader().getRequestId()).setResponseCode(responseCode)
                             .setResponseMessage(message);
@@ -232,6 +295,116 @@ public class PathComputationServiceImpl implements PathComputationService {
         });
     }
 
+    @Override
+    public ListenableFuture<PathComputationBatchRequestOutput> pathComputationBatchRequest(
+            PathComputationBatchRequestInput input) {
+        LOG.info("pathComputationBatchRequest");
+        return executor.submit(() -> pathComputationBatch(input));
+    }
+
+    private PathComputationBatchRequestOutput pathComputationBatch(PathComputationBatchRequestInput input) {
+        ConfigurationResponseCommonBuilder configurationResponseCommon = new ConfigurationResponseCommonBuilder()
+                .setAckFinalIndicator("Yes");
+        if (input.getServiceHandlerHeader() == null
+                || !PceComplianceCheck.checkString(input.getServiceHandlerHeader().getRequestId())) {
+            LOG.error("Batch not calculated, ServiceHandlerHeader Request-ID is not set");
+            return new PathComputationBatchRequestOutputBuilder()
+                    .setConfigurationResponseCommon(configurationResponseCommon.setRequestId("")
+                            .setResponseCode(ResponseCodes.RESPONSE_FAILED)
+                            .setResponseMessage("ServiceHandlerHeader Request-ID  is not set").build())
+                    .build();
+        }
+        // without the shared cache, the networks are read once for the batch
+        PceBatchContext batchContext = new PceBatchContext(networkCache != null ? networkCache
+                : new PceNetworkCache(networkTransactionService.getDataBroker()),
+                Boolean.TRUE.equals(input.getReserveInSequence()));
+        Map<PathResponseKey, PathResponse> pathResponses = new LinkedHashMap<>();
+        int nbPaths = 0;
+        for (PathRequest pathRequest : input.nonnullPathRequest().values()) {
+            PathResponse pathResponse = pathComputationBatchItem(toPathComputationRequestInput(input, pathRequest),
+                    batchContext);
+            if (ResponseCodes.RESPONSE_OK.equals(pathResponse.getConfigurationResponseCommon().getResponseCode())) {
+                nbPaths++;
+            }
+            pathResponses.put(pathResponse.key(), pathResponse);
+        }
+        LOG.info("pathComputationBatchRequest: {} paths calculated for {} path requests", nbPaths,
+                pathResponses.size());
+        configurationResponseCommon.setRequestId(input.getServiceHandlerHeader().getRequestId())
+                .setResponseCode(ResponseCodes.RESPONSE_OK)
+                .setResponseMessage(nbPaths + " paths calculated for " + pathResponses.size() + " path requests");
+        return new PathComputationBatchRequestOutputBuilder()
+                .setConfigurationResponseCommon(configurationResponseCommon.build())
+                .setPathResponse(pathResponses)
+                .build();
+    }
+
+    @SuppressWarnings("checkstyle:IllegalCatch")
+    private PathResponse pathComputationBatchItem(PathComputationRequestInput input, PceBatchContext batchContext) {
+        PathResponseBuilder pathResponse = new PathResponseBuilder().setServiceName(input.getServiceName());
+        ConfigurationResponseCommonBuilder configurationResponseCommon = new ConfigurationResponseCommonBuilder()
+                .setAckFinalIndicator("Yes").setRequestId(input.getServiceHandlerHeader().getRequestId());
+        PceComplianceCheckResult check = PceComplianceCheck.check(input);
+        if (!check.hasPassed()) {
+            LOG.error("Path not calculated, service not compliant : {}", check.getMessage());
+            return pathResponse.setConfigurationResponseCommon(configurationResponseCommon
+                    .setResponseCode("Path not calculated").setResponseMessage(check.getMessage()).build())
+                    .build();
+        }
+        PceSendingPceRPCs sendingPCE = newPceSendingPceRPCs(input, batchContext);
+        try {
+            sendingPCE.pathComputation();
+        } catch (Exception e) {
+            // one path request in error does not stop the batch
+            LOG.error("Path computation of {} failed", input.getServiceName(), e);
+            return pathResponse.setConfigurationResponseCommon(configurationResponseCommon
+                    .setResponseCode(ResponseCodes.RESPONSE_FAILED).setResponseMessage(e.getMessage()).build())
+                    .build();
+        }
+        PathDescriptionBuilder path = sendingPCE.getPathDescription();
+        LOG.info("PCE response for {}: {} {}", input.getServiceName(), sendingPCE.getMessage(),
+                sendingPCE.getResponseCode());
+        configurationResponseCommon.setResponseCode(sendingPCE.getResponseCode())
+                .setResponseMessage(sendingPCE.getMessage());
+        if (Boolean.FALSE.equals(sendingPCE.getSuccess()) || path == null) {
+            return pathResponse.setConfigurationResponseCommon(configurationResponseCommon.build()).build();
+        }
+        batchContext.reserveSpectrum(sendingPCE.getPathAtoZ(), sendingPCE.getReturnStructure());
+        return pathResponse.setConfigurationResponseCommon(configurationResponseCommon.build())
+                .setResponseParameters(new ResponseParametersBuilder().setPathDescription(
+                        new org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.service.types.rev200128
+                            .response.parameters.sp.response.parameters.PathDescriptionBuilder()
+                                .setAToZDirection(path.getAToZDirection()).setZToADirection(path.getZToADirection())
+                                .build())
+                        .build())
+                .build();
+    }
+
+    PceSendingPceRPCs newPceSendingPceRPCs(PathComputationRequestInput input, PceBatchContext batchContext) {
+        return new PceSendingPceRPCs(input, networkTransactionService, gnpyConsumer, batchContext.getNetworkCache(),
+                batchContext, validationExecutor);
+    }
+
+    private static PathComputationRequestInput toPathComputationRequestInput(PathComputationBatchRequestInput input,
+            PathRequest pathRequest) {
+        return new PathComputationRequestInputBuilder()
+                .setServiceName(pathRequest.getServiceName())
+                .setResourceReserve(Boolean.TRUE.equals(input.getReserveInSequence()))
+                .setServiceHandlerHeader(input.getServiceHandlerHeader())
+                .setServiceAEnd(pathRequest.getServiceAEnd() == null ? null
+                        : new ServiceAEndBuilder(pathRequest.getServiceAEnd()).build())
+                .setServiceZEnd(pathRequest.getServiceZEnd() == null ? null
+                        : new ServiceZEndBuilder(pathRequest.getServiceZEnd()).build())
+                .setHardConstraints(pathRequest.getHardConstraints())
+                .setSoftConstraints(pathRequest.getSoftConstraints())
+                .setPceMetric(pathRequest.getPceMetric())
+                .setLocallyProtectedLinks(pathRequest.getLocallyProtectedLinks())
+                .setRoutingMetric(pathRequest.getRoutingMetric())
+                .setMaxCandidatePaths(pathRequest.getMaxCandidatePaths())
+                .setMaxHopsPerPath(pathRequest.getMaxHopsPerPath())
+                .build();
+    }
+
     public GnpyResponse generateGnpyResponse(Response responseGnpy, String pathDir) {
         ResponseType respType = null;
         boolean feasible = true;
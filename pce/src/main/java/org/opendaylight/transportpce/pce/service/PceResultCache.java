@@ -0,0 +1,320 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+
+package org.opendaylight.transportpce.pce.service;
+
+import com.google.common.util.concurrent.FutureCallback;
+import com.google.common.util.concurrent.MoreExecutors;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.Objects;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.atomic.AtomicLong;
+import org.opendaylight.mdsal.binding.api.DataBroker;
+import org.opendaylight.mdsal.binding.api.WriteTransaction;
+import org.opendaylight.mdsal.common.api.CommitInfo;
+import org.opendaylight.mdsal.common.api.LogicalDatastoreType;
+import org.opendaylight.transportpce.common.NetworkUtils;
+import org.opendaylight.transportpce.pce.gnpy.GnpyResult;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNetworkCache;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationCacheStatistics;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationCacheStatisticsBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInputBuilder;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.pathdescription.rev201210.path.description.AToZDirection;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.pathdescription.rev201210.path.description.ZToADirection;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.routing.constraints.rev171017.constraints.sp.CoRoutingOrGeneral;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.routing.constraints.rev171017.constraints.sp.co.routing.or.general.CoRouting;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.routing.constraints.rev171017.constraints.sp.co.routing.or.general.General;
+import org.opendaylight.yangtools.yang.binding.InstanceIdentifier;
+import org.opendaylight.yangtools.yang.common.Uint32;
+import org.opendaylight.yangtools.yang.common.Uint64;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+/**
+ * LRU cache of the path-computation-request results.
+ *
+ * <p>A result is cached for the content of the request, without the service name,
+ * the request id and the resource-reserve flag, and for the versions of the
+ * openroadm-topology and otn-topology given by the PceNetworkCache. Any topology
+ * modification, frequency maps included, drops all the cached results. The requests
+ * with co-routing or diversity constraints depend on the existing services and are
+ * not cached, nor are the requests when the PceNetworkCache is disabled, since the
+ * topology versions are not tracked then. The hit/miss counters are kept in memory
+ * and published in the operational datastore (path-computation-cache-statistics)
+ * asynchronously: a lookup never waits for the statistics write, and the counter
+ * changes made while a write is in flight are published by a single next write.
+ */
+public class PceResultCache {
+
+    private static final Logger LOG = LoggerFactory.getLogger(PceResultCache.class);
+    public static final int DEFAULT_CAPACITY = 256;
+    private static final InstanceIdentifier<PathComputationCacheStatistics> STATISTICS_IID =
+        InstanceIdentifier.create(PathComputationCacheStatistics.class);
+
+    private final DataBroker dataBroker;
+    private final PceNetworkCache networkCache;
+    private final int capacity;
+    // in access order, the least recently used result first
+    private final Map<CacheKey, CachedResult> results;
+    // topology versions of the cached results
+    private long overlayVersion;
+    private long otnVersion;
+    private final AtomicLong hits = new AtomicLong();
+    private final AtomicLong misses = new AtomicLong();
+    private final AtomicLong evictions = new AtomicLong();
+    // a statistics write is in flight, the counters changed since its start are written after it
+    private final AtomicBoolean statisticsWriting = new AtomicBoolean();
+    private final AtomicBoolean statisticsChanged = new AtomicBoolean();
+
+    public PceResultCache(DataBroker dataBroker, PceNetworkCache networkCache) {
+        this(dataBroker, networkCache, DEFAULT_CAPACITY);
+    }
+
+    public PceResultCache(DataBroker dataBroker, PceNetworkCache networkCache, int capacity) {
+        this.dataBroker = dataBroker;
+        this.networkCache = networkCache;
+        this.capacity = capacity;
+        this.results = new LinkedHashMap<>(16, 0.75f, true);
+    }
+
+    /*
+     * Method called when the blueprint container is created.
+     */
+    public void init() {
+        LOG.info("PceResultCache Initiated, capacity {}", capacity);
+        publishStatistics();
+    }
+
+    /*
+     * Method called when the blueprint container is destroyed.
+     */
+    public void close() {
+        LOG.info("PceResultCache Closed");
+        synchronized (this) {
+            results.clear();
+        }
+    }
+
+    /**
+     * Cache key of a request, for the current topology versions.
+     *
+     * @param input the path computation request
+     * @return the cache key, or null if the result of the request must not be cached
+     */
+    public CacheKey getKey(PathComputationRequestInput input) {
+        if (!networkCache.isEnabled() || !isCacheable(input)) {
+            return null;
+        }
+        PathComputationRequestInput request = new PathComputationRequestInputBuilder(input)
+            .setServiceName(null).setServiceHandlerHeader(null).setResourceReserve(null).build();
+        return new CacheKey(request, networkCache.getVersion(NetworkUtils.OVERLAY_NETWORK_ID),
+            networkCache.getVersion(NetworkUtils.OTN_NETWORK_ID));
+    }
+
+    public CachedResult get(CacheKey key) {
+        CachedResult result;
+        synchronized (this) {
+            dropModifiedTopologyResults();
+            result = key.isCurrent(overlayVersion, otnVersion) ? results.get(key) : null;
+        }
+        if (result != null) {
+            hits.incrementAndGet();
+        } else {
+            misses.incrementAndGet();
+        }
+        publishStatistics();
+        return result;
+    }
+
+    public void put(CacheKey key, CachedResult result) {
+        synchronized (this) {
+            dropModifiedTopologyResults();
+            // a result computed before a topology modification is not cached
+            if (!key.isCurrent(overlayVersion, otnVersion)) {
+                return;
+            }
+            results.put(key, result);
+            if (results.size() > capacity) {
+                Iterator<CacheKey> leastRecentlyUsed = results.keySet().iterator();
+                leastRecentlyUsed.next();
+                leastRecentlyUsed.remove();
+                evictions.incrementAndGet();
+            }
+        }
+        publishStatistics();
+    }
+
+    public long getHits() {
+        return hits.get();
+    }
+
+    public long getMisses() {
+        return misses.get();
+    }
+
+    public long getEvictions() {
+        return evictions.get();
+    }
+
+    public synchronized int size() {
+        return results.size();
+    }
+
+    private void dropModifiedTopologyResults() {
+        long currentOverlayVersion = networkCache.getVersion(NetworkUtils.OVERLAY_NETWORK_ID);
+        long currentOtnVersion = networkCache.getVersion(NetworkUtils.OTN_NETWORK_ID);
+        if (currentOverlayVersion == overlayVersion && currentOtnVersion == otnVersion) {
+            return;
+        }
+        LOG.info("dropModifiedTopologyResults: topology modified, {} results dropped", results.size());
+        evictions.addAndGet(results.size());
+        results.clear();
+        overlayVersion = currentOverlayVersion;
+        otnVersion = currentOtnVersion;
+    }
+
+    private static boolean isCacheable(PathComputationRequestInput input) {
+        if (input.getHardConstraints() != null
+                && !isCacheable(input.getHardConstraints().getCoRoutingOrGeneral())) {
+            return false;
+        }
+        return input.getSoftConstraints() == null
+            || isCacheable(input.getSoftConstraints().getCoRoutingOrGeneral());
+    }
+
+    private static boolean isCacheable(CoRoutingOrGeneral coRoutingOrGeneral) {
+        if (coRoutingOrGeneral instanceof CoRouting) {
+            return false;
+        }
+        return !(coRoutingOrGeneral instanceof General) || ((General) coRoutingOrGeneral).getDiversity() == null;
+    }
+
+    private void publishStatistics() {
+        statisticsChanged.set(true);
+        if (statisticsWriting.compareAndSet(false, true)) {
+            writeStatistics();
+        }
+    }
+
+    private void writeStatistics() {
+        statisticsChanged.set(false);
+        PathComputationCacheStatistics statistics = new PathComputationCacheStatisticsBuilder()
+            .setCapacity(Uint32.valueOf(capacity)).setEntries(Uint32.valueOf(size()))
+            .setHits(Uint64.valueOf(hits.get())).setMisses(Uint64.valueOf(misses.get()))
+            .setEvictions(Uint64.valueOf(evictions.get())).build();
+        WriteTransaction writeTransaction = dataBroker.newWriteOnlyTransaction();
+        writeTransaction.put(LogicalDatastoreType.OPERATIONAL, STATISTICS_IID, statistics);
+        writeTransaction.commit().addCallback(new FutureCallback<CommitInfo>() {
+            @Override
+            public void onSuccess(CommitInfo result) {
+                LOG.debug("writeStatistics: {} hits, {} misses", statistics.getHits(), statistics.getMisses());
+                statisticsWritten();
+            }
+
+            @Override
+            public void onFailure(Throwable throwable) {
+                LOG.warn("writeStatistics: failed to write the path computation cache statistics", throwable);
+                statisticsWritten();
+            }
+        }, MoreExecutors.directExecutor());
+    }
+
+    private void statisticsWritten() {
+        statisticsWriting.set(false);
+        // counters changed during the write, unless another thread has started a write since
+        if (statisticsChanged.get() && statisticsWriting.compareAndSet(false, true)) {
+            writeStatistics();
+        }
+    }
+
+    /**
+     * Normalized request content and topology versions.
+     */
+    public static final class CacheKey {
+        private final PathComputationRequestInput request;
+        private final long overlayVersion;
+        private final long otnVersion;
+
+        CacheKey(PathComputationRequestInput request, long overlayVersion, long otnVersion) {
+            this.request = request;
+            this.overlayVersion = overlayVersion;
+            this.otnVersion = otnVersion;
+        }
+
+        boolean isCurrent(long currentOverlayVersion, long currentOtnVersion) {
+            return overlayVersion == currentOverlayVersion && otnVersion == currentOtnVersion;
+        }
+
+        @Override
+        public boolean equals(Object obj) {
+            if (this == obj) {
+                return true;
+            }
+            if (!(obj instanceof CacheKey)) {
+                return false;
+            }
+            CacheKey other = (CacheKey) obj;
+            return overlayVersion == other.overlayVersion && otnVersion == other.otnVersion
+                && request.equals(other.request);
+        }
+
+        @Override
+        public int hashCode() {
+            return Objects.hash(request, overlayVersion, otnVersion);
+        }
+    }
+
+    /**
+     * Successful result of a path computation.
+     */
+    public static final class CachedResult {
+        private final String message;
+        private final String responseCode;
+        private final AToZDirection atoZDirection;
+        private final ZToADirection ztoADirection;
+        private final GnpyResult gnpyAtoZ;
+        private final GnpyResult gnpyZtoA;
+
+        public CachedResult(String message, String responseCode, AToZDirection atoZDirection,
+                ZToADirection ztoADirection, GnpyResult gnpyAtoZ, GnpyResult gnpyZtoA) {
+            this.message = message;
+            this.responseCode = responseCode;
+            this.atoZDirection = atoZDirection;
+            this.ztoADirection = ztoADirection;
+            this.gnpyAtoZ = gnpyAtoZ;
+            this.gnpyZtoA = gnpyZtoA;
+        }
+
+        public String getMessage() {
+            return message;
+        }
+
+        public String getResponseCode() {
+            return responseCode;
+        }
+
+        public AToZDirection getAtoZDirection() {
+            return atoZDirection;
+        }
+
+        public ZToADirection getZtoADirection() {
+            return ztoADirection;
+        }
+
+        public GnpyResult getGnpyAtoZ() {
+            return gnpyAtoZ;
+        }
+
+        public GnpyResult getGnpyZtoA() {
+            return gnpyZtoA;
+        }
+    }
+}
@@ -8,8 +8,16 @@
 
 package org.opendaylight.transportpce.pce.graph;
 
+import com.google.common.util.concurrent.Uninterruptibles;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
 import java.util.Map;
 import java.util.Optional;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.Executor;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicInteger;
 import org.junit.Assert;
 import org.junit.Before;
 import org.junit.Test;
@@ -24,6 +32,7 @@ import org.opendaylight.transportpce.pce.networkanalyzer.PceResult;
 import org.opendaylight.transportpce.pce.utils.NodeUtils;
 import org.opendaylight.transportpce.pce.utils.PceTestData;
 import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInputBuilder;
 import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.OpenroadmNodeType;
 import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.OpenroadmTpType;
 import org.opendaylight.yang.gen.v1.http.org.openroadm.service.format.rev190531.ServiceFormat;
@@ -32,6 +41,7 @@ import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev
 import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.Node;
 import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.NodeKey;
 import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.networks.network.Link;
+import org.opendaylight.yangtools.yang.common.Uint16;
 
 public class PceGraphTest {
 
@@ -108,6 +118,71 @@ public class PceGraphTest {
         Assert.assertEquals(pceGraph.calcPath(), false);
     }
 
+    @Test
+    public void clacPathBestRankedCandidateValidatedLast() {
+        // a 2 hops candidate through OpenROADM-3-3-DEG1, ranked after the direct link
+        NodeId nodeId3 = new NodeId("OpenROADM-3-3-DEG1");
+        Node node3 = NodeUtils.getNodeBuilder(NodeUtils.geSupportingNodes())
+                .setNodeId(nodeId3).withKey(new NodeKey(nodeId3)).build();
+        PceOpticalNode pceOpticalNode3 = new PceOpticalNode(node3,
+                OpenroadmNodeType.DEGREE, StringConstants.OPENROADM_DEVICE_VERSION_2_2_1, GridConstant.SLOT_WIDTH_50);
+        pceOpticalNode.addOutgoingLink(new PceLink(NodeUtils.createRoadmToRoadm("OpenROADM-3-2-DEG1",
+                "OpenROADM-3-3-DEG1", "DEG1-TTP-TX", "DEG1-TTP-RX").build(), pceOpticalNode, pceOpticalNode3));
+        pceOpticalNode3.addOutgoingLink(new PceLink(NodeUtils.createRoadmToRoadm("OpenROADM-3-3-DEG1",
+                "OpenROADM-3-1-DEG1", "DEG1-TTP-TX", "DEG1-TTP-RX").build(), pceOpticalNode3, pceOpticalNode2));
+        allPceNodes = Map.of(pceOpticalNode.getNodeId(), pceOpticalNode, pceOpticalNode2.getNodeId(),
+                pceOpticalNode2, nodeId3, pceOpticalNode3);
+
+        PceGraph sequentialGraph = new PceGraph(pceOpticalNode, pceOpticalNode2, allPceNodes,
+                pceHardConstraints, null, new PceResult(), StringConstants.SERVICE_TYPE_ODU4);
+        Assert.assertTrue(sequentialGraph.calcPath());
+
+        // the validation of the best ranked candidate only starts once the other one is done
+        CountDownLatch lowerRankedValidated = new CountDownLatch(1);
+        AtomicInteger submitted = new AtomicInteger();
+        List<Integer> validationOrder = Collections.synchronizedList(new ArrayList<>());
+        Executor validationExecutor = task -> {
+            int rank = submitted.getAndIncrement();
+            new Thread(() -> {
+                if (rank == 0) {
+                    Uninterruptibles.awaitUninterruptibly(lowerRankedValidated, 10, TimeUnit.SECONDS);
+                    validationOrder.add(rank);
+                    task.run();
+                } else {
+                    task.run();
+                    validationOrder.add(rank);
+                    lowerRankedValidated.countDown();
+                }
+            }).start();
+        };
+        PceGraph concurrentGraph = new PceGraph(pceOpticalNode, pceOpticalNode2, allPceNodes,
+                pceHardConstraints, null, new PceResult(), StringConstants.SERVICE_TYPE_ODU4, validationExecutor);
+        Assert.assertTrue(concurrentGraph.calcPath());
+
+        Assert.assertEquals(2, submitted.get());
+        Assert.assertEquals(List.of(1, 0), validationOrder);
+        Assert.assertEquals(1, concurrentGraph.getPathAtoZ().size());
+        Assert.assertEquals(sequentialGraph.getPathAtoZ(), concurrentGraph.getPathAtoZ());
+        Assert.assertEquals(sequentialGraph.getReturnStructure().getResponseCode(),
+                concurrentGraph.getReturnStructure().getResponseCode());
+        Assert.assertEquals(sequentialGraph.getReturnStructure().getLocalCause(),
+                concurrentGraph.getReturnStructure().getLocalCause());
+        Assert.assertEquals(sequentialGraph.getReturnStructure().getServiceType(),
+                concurrentGraph.getReturnStructure().getServiceType());
+    }
+
+    @Test
+    public void setPathComputationLimits() {
+        pceGraph.setPathComputationLimits(requestInput);
+        Assert.assertEquals(10, pceGraph.getKpathsToBring());
+        Assert.assertEquals(50, pceGraph.getMhopsPerPath());
+
+        pceGraph.setPathComputationLimits(new PathComputationRequestInputBuilder(requestInput)
+                .setMaxCandidatePaths(Uint16.valueOf(3)).setMaxHopsPerPath(Uint16.valueOf(7)).build());
+        Assert.assertEquals(3, pceGraph.getKpathsToBring());
+        Assert.assertEquals(7, pceGraph.getMhopsPerPath());
+    }
+
     @Test(expected = Exception.class)
     public void clacPath10GE2() {
         pceGraph = getOtnPceGraph(StringConstants.SERVICE_TYPE_10GE);
@@ -0,0 +1,82 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+package org.opendaylight.transportpce.pce.model;
+
+import java.util.Arrays;
+import java.util.BitSet;
+import org.junit.Assert;
+import org.junit.Test;
+import org.opendaylight.transportpce.common.fixedflex.GridConstant;
+
+public class SpectrumAvailabilityTest {
+
+    @Test
+    public void allAvailableTest() {
+        SpectrumAvailability availability = SpectrumAvailability.allAvailable();
+        Assert.assertEquals(GridConstant.EFFECTIVE_BITS, availability.cardinality());
+        Assert.assertEquals(GridConstant.EFFECTIVE_BITS - GridConstant.NB_SLOTS_100G,
+            availability.firstFit(GridConstant.NB_SLOTS_100G, 1));
+        Assert.assertEquals(GridConstant.EFFECTIVE_BITS - 14, availability.bestFit(14, 14));
+    }
+
+    @Test
+    public void fromFreqMapTest() {
+        byte[] freqMap = new byte[GridConstant.NB_OCTECTS];
+        freqMap[0] = (byte) 0x81;
+        freqMap[95] = (byte) 0x80;
+        SpectrumAvailability availability = SpectrumAvailability.fromFreqMap(freqMap);
+        Assert.assertEquals(3, availability.cardinality());
+        Assert.assertTrue(availability.isAvailable(0));
+        Assert.assertTrue(availability.isAvailable(7));
+        Assert.assertTrue(availability.isAvailable(767));
+        Assert.assertFalse(availability.isAvailable(8));
+        Assert.assertEquals("SpectrumAvailability [{0, 7, 767}]", availability.toString());
+    }
+
+    @Test
+    public void andTest() {
+        BitSet bitSet = new BitSet(GridConstant.EFFECTIVE_BITS);
+        bitSet.set(100, 300);
+        byte[] freqMap = new byte[GridConstant.NB_OCTECTS];
+        Arrays.fill(freqMap, (byte) GridConstant.AVAILABLE_SLOT_VALUE);
+        freqMap[25] = 0;
+        SpectrumAvailability availability = SpectrumAvailability.allAvailable().and(bitSet)
+            .and(SpectrumAvailability.fromFreqMap(freqMap));
+        Assert.assertEquals(192, availability.cardinality());
+        Assert.assertFalse(availability.isAvailable(200));
+        Assert.assertTrue(availability.isAvailable(299));
+        Assert.assertFalse(availability.isAvailable(300));
+    }
+
+    @Test
+    public void firstFitTest() {
+        BitSet bitSet = new BitSet(GridConstant.EFFECTIVE_BITS);
+        bitSet.set(0, 20);
+        bitSet.set(700, 707);
+        SpectrumAvailability availability = SpectrumAvailability.allAvailable().and(bitSet);
+        // the run 700-706 is too small for 8 slots
+        Assert.assertEquals(12, availability.firstFit(GridConstant.NB_SLOTS_100G, 1));
+        Assert.assertEquals(703, availability.firstFit(4, 1));
+        // flexgrid blocks end on 768 - k * 8
+        Assert.assertEquals(8, availability.firstFit(GridConstant.NB_SLOTS_100G, GridConstant.NB_SLOTS_100G));
+        Assert.assertEquals(-1, availability.firstFit(21, 1));
+    }
+
+    @Test
+    public void bestFitTest() {
+        BitSet bitSet = new BitSet(GridConstant.EFFECTIVE_BITS);
+        bitSet.set(0, 40);
+        bitSet.set(300, 310);
+        bitSet.set(600, 700);
+        SpectrumAvailability availability = SpectrumAvailability.allAvailable().and(bitSet);
+        Assert.assertEquals(692, availability.firstFit(GridConstant.NB_SLOTS_100G, 1));
+        Assert.assertEquals(302, availability.bestFit(GridConstant.NB_SLOTS_100G, 1));
+        Assert.assertEquals(26, availability.bestFit(GridConstant.NB_SLOTS_400G, 1));
+        Assert.assertEquals(-1, availability.bestFit(101, 1));
+    }
+}
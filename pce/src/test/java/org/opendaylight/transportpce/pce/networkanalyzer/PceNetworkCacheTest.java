@@ -0,0 +1,319 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+package org.opendaylight.transportpce.pce.networkanalyzer;
+
+import java.util.List;
+import java.util.Map;
+import java.util.Optional;
+import java.util.concurrent.ExecutionException;
+import java.util.stream.Collectors;
+import org.junit.After;
+import org.junit.Assert;
+import org.junit.Before;
+import org.junit.Test;
+import org.mockito.Mockito;
+import org.opendaylight.mdsal.binding.api.DataBroker;
+import org.opendaylight.mdsal.binding.api.DataObjectModification;
+import org.opendaylight.mdsal.binding.api.DataTreeIdentifier;
+import org.opendaylight.mdsal.binding.api.DataTreeModification;
+import org.opendaylight.mdsal.binding.api.ReadTransaction;
+import org.opendaylight.mdsal.binding.api.WriteTransaction;
+import org.opendaylight.mdsal.common.api.LogicalDatastoreType;
+import org.opendaylight.transportpce.common.InstanceIdentifiers;
+import org.opendaylight.transportpce.common.NetworkUtils;
+import org.opendaylight.transportpce.common.network.NetworkTransactionImpl;
+import org.opendaylight.transportpce.common.network.RequestProcessor;
+import org.opendaylight.transportpce.pce.constraints.PceConstraintsCalc;
+import org.opendaylight.transportpce.pce.utils.PceTestData;
+import org.opendaylight.transportpce.pce.utils.PceTestUtils;
+import org.opendaylight.transportpce.pce.utils.TransactionUtils;
+import org.opendaylight.transportpce.pce.utils.NodeUtils;
+import org.opendaylight.transportpce.test.AbstractTest;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.Nodes;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.NodesBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.NodesKey;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.nodes.McCapabilities;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.nodes.McCapabilitiesBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.network.nodes.NodeInfoBuilder;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.common.optical.channel.types.rev200529.FrequencyGHz;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.device.types.rev191129.NodeTypes;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NetworkId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NodeId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.Network;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.NetworkBuilder;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.Node;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.NodeBuilder;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.NodeKey;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.node.SupportingNode;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.node.SupportingNodeBuilder;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.LinkId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.Network1;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.networks.network.Link;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.topology.rev180226.networks.network.LinkKey;
+import org.opendaylight.yangtools.util.concurrent.FluentFutures;
+import org.opendaylight.yangtools.yang.binding.DataObject;
+import org.opendaylight.yangtools.yang.binding.InstanceIdentifier;
+
+public class PceNetworkCacheTest extends AbstractTest {
+
+    private PceNetworkCache networkCache;
+
+    @Before
+    public void setUp() throws ExecutionException, InterruptedException {
+        PceTestUtils.writeNetworkIntoDataStore(this.getDataBroker(), this.getDataStoreContextUtil(),
+                TransactionUtils.getNetworkForSpanLoss());
+        networkCache = new PceNetworkCache(this.getDataBroker());
+    }
+
+    @Test
+    public void testSnapshotIsReadOnce() throws ExecutionException, InterruptedException {
+        PceNetworkCache.NetworkSnapshot snapshot = networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID);
+        Assert.assertNotNull(snapshot);
+        Assert.assertEquals(NetworkUtils.OVERLAY_NETWORK_ID, snapshot.getNetworkId());
+        Assert.assertEquals(0L, snapshot.getVersion());
+        Assert.assertEquals(2, snapshot.getNodes().size());
+        Assert.assertEquals("ROADM-A1-DEG2", snapshot.getNodes().get(0).getNodeId().getValue());
+        Assert.assertFalse(snapshot.getLinks().isEmpty());
+        Assert.assertSame(snapshot, networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID));
+    }
+
+    @Test
+    public void testMissingNetwork() throws ExecutionException, InterruptedException {
+        Assert.assertNull(networkCache.getSnapshot(NetworkUtils.OTN_NETWORK_ID));
+        Assert.assertEquals(0L, networkCache.getVersion(NetworkUtils.OTN_NETWORK_ID));
+    }
+
+    @Test
+    public void testDisabledCacheReadsEachTime() throws ExecutionException, InterruptedException {
+        PceNetworkCache disabledCache = new PceNetworkCache(this.getDataBroker(), false);
+        disabledCache.init();
+        Assert.assertFalse(disabledCache.isEnabled());
+        PceNetworkCache.NetworkSnapshot snapshot = disabledCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID);
+        Assert.assertEquals(2, snapshot.getNodes().size());
+        Assert.assertNotSame(snapshot, disabledCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID));
+        Assert.assertNull(disabledCache.getSnapshot(NetworkUtils.OTN_NETWORK_ID));
+        disabledCache.close();
+    }
+
+    @Test
+    public void testMissingMcCapabilitiesAreNotCached() throws ExecutionException, InterruptedException {
+        Assert.assertTrue(networkCache.getMcCapabilitiesForNode("ROADM-A1").isEmpty());
+
+        // portmapping written after the first lookup, without topology change
+        McCapabilities mcCapabilities = new McCapabilitiesBuilder()
+                .setMcNodeName("DEG1-TTP")
+                .setSlotWidthGranularity(FrequencyGHz.getDefaultInstance("12.5"))
+                .setCenterFreqGranularity(FrequencyGHz.getDefaultInstance("6.25"))
+                .build();
+        Nodes nodes = new NodesBuilder()
+                .setNodeId("ROADM-A1")
+                .setNodeInfo(new NodeInfoBuilder().setNodeType(NodeTypes.Rdm).build())
+                .setMcCapabilities(Map.of(mcCapabilities.key(), mcCapabilities))
+                .build();
+        WriteTransaction writeTransaction = this.getDataBroker().newWriteOnlyTransaction();
+        writeTransaction.put(LogicalDatastoreType.CONFIGURATION, InstanceIdentifier.builder(
+                org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.portmapping.rev201012.Network.class)
+                .child(Nodes.class, new NodesKey("ROADM-A1")).build(), nodes);
+        writeTransaction.commit().get();
+
+        Assert.assertEquals(1, networkCache.getMcCapabilitiesForNode("ROADM-A1").size());
+        Assert.assertSame(networkCache.getMcCapabilitiesForNode("ROADM-A1"),
+                networkCache.getMcCapabilitiesForNode("ROADM-A1"));
+    }
+
+    @Test
+    public void testNodeChanges() throws ExecutionException, InterruptedException {
+        networkCache.init();
+        // initial notification of the network already written
+        waitForVersion(1L);
+        Assert.assertEquals(List.of("ROADM-A1-DEG2", "ROADM-C1-DEG1"), getNodeIds());
+
+        InstanceIdentifier<Node> nodeIid = InstanceIdentifiers.OVERLAY_NETWORK_II
+                .child(Node.class, new NodeKey(new NodeId("ROADM-B1-DEG1")));
+        Node node = new NodeBuilder().setNodeId(new NodeId("ROADM-B1-DEG1")).build();
+        put(nodeIid, node);
+        waitForVersion(2L);
+        Assert.assertEquals(List.of("ROADM-A1-DEG2", "ROADM-B1-DEG1", "ROADM-C1-DEG1"), getNodeIds());
+        Assert.assertTrue(getNode("ROADM-B1-DEG1").nonnullSupportingNode().isEmpty());
+
+        SupportingNode supportingNode = new SupportingNodeBuilder()
+                .setNetworkRef(new NetworkId(NetworkUtils.UNDERLAY_NETWORK_ID)).setNodeRef(new NodeId("ROADM-B1"))
+                .build();
+        put(nodeIid, new NodeBuilder(node)
+                .setSupportingNode(Map.of(supportingNode.key(), supportingNode)).build());
+        waitForVersion(3L);
+        Assert.assertEquals(3, getNodeIds().size());
+        Assert.assertEquals(supportingNode, getNode("ROADM-B1-DEG1").getSupportingNode().get(supportingNode.key()));
+
+        delete(nodeIid);
+        waitForVersion(4L);
+        Assert.assertEquals(List.of("ROADM-A1-DEG2", "ROADM-C1-DEG1"), getNodeIds());
+        Assert.assertEquals(4L, networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID).getVersion());
+    }
+
+    @Test
+    public void testLinkChanges() throws ExecutionException, InterruptedException {
+        networkCache.init();
+        waitForVersion(1L);
+        List<LinkId> initialLinkIds = getLinkIds();
+        Assert.assertFalse(initialLinkIds.isEmpty());
+
+        Link link = NodeUtils.createRoadmToRoadm("ROADM-C1-DEG1", "ROADM-A1-DEG2", "DEG1-TTP-TXRX", "DEG2-TTP-TXRX")
+                .build();
+        InstanceIdentifier<Link> linkIid = InstanceIdentifiers.OVERLAY_NETWORK_II.augmentation(Network1.class)
+                .child(Link.class, new LinkKey(link.getLinkId()));
+        put(linkIid, link);
+        waitForVersion(2L);
+        Assert.assertEquals(initialLinkIds.size() + 1, getLinkIds().size());
+        Assert.assertTrue(getLinkIds().contains(link.getLinkId()));
+
+        Link modifiedLink = NodeUtils.createRoadmToRoadm("ROADM-C1-DEG1", "ROADM-A1-DEG2", "DEG1-TTP-TXRX",
+                "DEG2-TTP-TXRX").setDestination(null).build();
+        put(linkIid, modifiedLink);
+        waitForVersion(3L);
+        Assert.assertNull(getLink(link.getLinkId()).getDestination());
+
+        delete(linkIid);
+        waitForVersion(4L);
+        Assert.assertEquals(initialLinkIds, getLinkIds());
+
+        // all the links removed with the augmentation, the nodes are kept
+        delete(InstanceIdentifiers.OVERLAY_NETWORK_II.augmentation(Network1.class));
+        waitForVersion(5L);
+        Assert.assertTrue(getLinkIds().isEmpty());
+        Assert.assertEquals(2, getNodeIds().size());
+    }
+
+    @Test
+    public void testNetworkChanges() throws ExecutionException, InterruptedException {
+        networkCache.init();
+        waitForVersion(1L);
+        delete(InstanceIdentifiers.OVERLAY_NETWORK_II);
+        waitForVersion(2L);
+        Assert.assertNull(networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID));
+
+        PceTestUtils.writeNetworkIntoDataStore(this.getDataBroker(), this.getDataStoreContextUtil(),
+                TransactionUtils.getNetworkForSpanLoss());
+        waitForVersion(3L);
+        Assert.assertEquals(3L, networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID).getVersion());
+        Assert.assertEquals(2, getNodeIds().size());
+    }
+
+    @Test
+    @SuppressWarnings("unchecked")
+    public void testChangeNotifiedDuringReadWins() throws ExecutionException, InterruptedException {
+        DataBroker dataBroker = Mockito.mock(DataBroker.class);
+        ReadTransaction readTx = Mockito.mock(ReadTransaction.class);
+        Mockito.when(dataBroker.newReadOnlyTransaction()).thenReturn(readTx);
+        PceNetworkCache cache = new PceNetworkCache(dataBroker);
+        Network readNetwork = TransactionUtils.getNetworkForSpanLoss();
+        Node notifiedNode = readNetwork.getNode().values().iterator().next();
+        Network notifiedNetwork = new NetworkBuilder(readNetwork)
+                .setNode(Map.of(notifiedNode.key(), notifiedNode)).build();
+        DataObjectModification<Network> rootNode = Mockito.mock(DataObjectModification.class);
+        Mockito.when(rootNode.getModificationType()).thenReturn(DataObjectModification.ModificationType.WRITE);
+        Mockito.when(rootNode.getDataAfter()).thenReturn(notifiedNetwork);
+        DataTreeModification<Network> change = Mockito.mock(DataTreeModification.class);
+        Mockito.when(change.getRootPath()).thenReturn(
+                DataTreeIdentifier.create(LogicalDatastoreType.CONFIGURATION, InstanceIdentifiers.OVERLAY_NETWORK_II));
+        Mockito.when(change.getRootNode()).thenReturn(rootNode);
+        Mockito.doAnswer(invocation -> {
+            // the network is modified while it is read
+            cache.onDataTreeChanged(List.of(change));
+            return FluentFutures.immediateFluentFuture(Optional.of(readNetwork));
+        }).when(readTx).read(Mockito.eq(LogicalDatastoreType.CONFIGURATION), Mockito.any(InstanceIdentifier.class));
+
+        PceNetworkCache.NetworkSnapshot snapshot = cache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID);
+        Assert.assertEquals(0L, snapshot.getVersion());
+        Assert.assertEquals(2, snapshot.getNodes().size());
+        // the data read is not cached over the notified one
+        snapshot = cache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID);
+        Assert.assertEquals(1L, snapshot.getVersion());
+        Assert.assertEquals(List.of(notifiedNode), snapshot.getNodes());
+        Mockito.verify(dataBroker, Mockito.times(1)).newReadOnlyTransaction();
+    }
+
+    @Test
+    public void testPceCalculationWithCache() {
+        PceCalculation withoutCache = retrievePceNetwork(null);
+        PceCalculation withCache = retrievePceNetwork(networkCache);
+        Assert.assertNull(withCache.getaendPceNode());
+        Assert.assertNull(withCache.getzendPceNode());
+        Assert.assertEquals(withoutCache.getAllPceNodes().keySet(), withCache.getAllPceNodes().keySet());
+        Assert.assertEquals(withoutCache.getAllPceLinks().keySet(), withCache.getAllPceLinks().keySet());
+        PceResult expected = withoutCache.getReturnStructure();
+        PceResult result = withCache.getReturnStructure();
+        Assert.assertEquals(expected.getStatus(), result.getStatus());
+        Assert.assertEquals(expected.getResponseCode(), result.getResponseCode());
+        Assert.assertEquals(expected.getMessage(), result.getMessage());
+        Assert.assertEquals(expected.getLocalCause(), result.getLocalCause());
+        Assert.assertEquals(expected.getServiceType(), result.getServiceType());
+    }
+
+    @After
+    public void destroy() {
+        networkCache.close();
+    }
+
+    private PceCalculation retrievePceNetwork(PceNetworkCache cache) {
+        PceResult pceResult = new PceResult();
+        pceResult.setRC("200");
+        NetworkTransactionImpl networkTransaction = new NetworkTransactionImpl(
+                new RequestProcessor(this.getDataBroker()));
+        PceConstraintsCalc pceConstraintsCalc = new PceConstraintsCalc(PceTestData.getPCERequest(),
+                networkTransaction);
+        PceCalculation pceCalculation = new PceCalculation(PceTestData.getPCERequest(), networkTransaction,
+                pceConstraintsCalc.getPceHardConstraints(), pceConstraintsCalc.getPceSoftConstraints(),
+                pceResult, cache);
+        pceCalculation.retrievePceNetwork();
+        return pceCalculation;
+    }
+
+    /*
+     * The change notifications are asynchronous.
+     */
+    private void waitForVersion(long version) throws InterruptedException {
+        for (int i = 0; i < 100 && networkCache.getVersion(NetworkUtils.OVERLAY_NETWORK_ID) < version; i++) {
+            Thread.sleep(50);
+        }
+        Assert.assertEquals(version, networkCache.getVersion(NetworkUtils.OVERLAY_NETWORK_ID));
+    }
+
+    private List<String> getNodeIds() throws ExecutionException, InterruptedException {
+        return networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID).getNodes().stream()
+                .map(node -> node.getNodeId().getValue()).collect(Collectors.toList());
+    }
+
+    private Node getNode(String nodeId) throws ExecutionException, InterruptedException {
+        return networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID).getNodes().stream()
+                .filter(node -> nodeId.equals(node.getNodeId().getValue())).findFirst().orElseThrow();
+    }
+
+    private List<LinkId> getLinkIds() throws ExecutionException, InterruptedException {
+        return networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID).getLinks().stream()
+                .map(Link::getLinkId).collect(Collectors.toList());
+    }
+
+    private Link getLink(LinkId linkId) throws ExecutionException, InterruptedException {
+        return networkCache.getSnapshot(NetworkUtils.OVERLAY_NETWORK_ID).getLinks().stream()
+                .filter(link -> linkId.equals(link.getLinkId())).findFirst().orElseThrow();
+    }
+
+    private <T extends DataObject> void put(InstanceIdentifier<T> iid, T data)
+            throws ExecutionException, InterruptedException {
+        WriteTransaction writeTransaction = this.getDataBroker().newWriteOnlyTransaction();
+        writeTransaction.put(LogicalDatastoreType.CONFIGURATION, iid, data);
+        writeTransaction.commit().get();
+    }
+
+    private void delete(InstanceIdentifier<?> iid) throws ExecutionException, InterruptedException {
+        WriteTransaction writeTransaction = this.getDataBroker().newWriteOnlyTransaction();
+        writeTransaction.delete(LogicalDatastoreType.CONFIGURATION, iid);
+        writeTransaction.commit().get();
+    }
+}
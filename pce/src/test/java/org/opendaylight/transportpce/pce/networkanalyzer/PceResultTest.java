@@ -54,4 +54,19 @@ public class PceResultTest extends AbstractTest {
         pceResult.setLocalCause(PceResult.LocalCause.INT_PROBLEM);
         Assert.assertEquals(pceResult.getLocalCause(), PceResult.LocalCause.INT_PROBLEM);
     }
+
+    @Test
+    public void copyTest() {
+        pceResult.setRC("200");
+        pceResult.setServiceType("100GE");
+        pceResult.setResultWavelength(12);
+        PceResult copy = new PceResult(pceResult);
+        copy.setRC("500");
+        copy.setLocalCause(PceResult.LocalCause.OUT_OF_SPEC_OSNR);
+        Assert.assertTrue(pceResult.getStatus());
+        Assert.assertEquals(PceResult.LocalCause.NONE, pceResult.getLocalCause());
+        Assert.assertFalse(copy.getStatus());
+        Assert.assertEquals("100GE", copy.getServiceType());
+        Assert.assertEquals(12, copy.getResultWavelength());
+    }
 }
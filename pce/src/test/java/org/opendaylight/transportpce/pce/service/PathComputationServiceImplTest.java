@@ -8,16 +8,30 @@
 package org.opendaylight.transportpce.pce.service;
 
 import java.math.BigDecimal;
+import java.util.BitSet;
+import java.util.LinkedHashMap;
+import java.util.List;
 import java.util.Map;
+import java.util.concurrent.ExecutionException;
+import java.util.function.BiFunction;
 import org.junit.After;
 import org.junit.Assert;
 import org.junit.Before;
 import org.junit.Test;
 import org.mockito.Mockito;
 import org.opendaylight.mdsal.binding.api.DataBroker;
+import org.opendaylight.transportpce.common.ResponseCodes;
+import org.opendaylight.transportpce.common.fixedflex.GridConstant;
+import org.opendaylight.transportpce.common.fixedflex.GridUtils;
 import org.opendaylight.transportpce.common.network.NetworkTransactionService;
+import org.opendaylight.transportpce.pce.PceSendingPceRPCs;
 import org.opendaylight.transportpce.pce.gnpy.GnpyResult;
 import org.opendaylight.transportpce.pce.gnpy.GnpyTopoImpl;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceBatchContext;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceLink;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNetworkCache;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNode;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceResult;
 import org.opendaylight.transportpce.pce.utils.PceTestData;
 import org.opendaylight.transportpce.test.AbstractTest;
 import org.opendaylight.transportpce.test.DataStoreContext;
@@ -31,6 +45,23 @@ import org.opendaylight.yang.gen.v1.gnpy.path.rev200909.result.ResponseBuilder;
 import org.opendaylight.yang.gen.v1.gnpy.path.rev200909.result.ResponseKey;
 import org.opendaylight.yang.gen.v1.gnpy.path.rev200909.result.response.response.type.NoPathCaseBuilder;
 import org.opendaylight.yang.gen.v1.gnpy.path.rev200909.result.response.response.type.PathCaseBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestInputBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationBatchRequestOutput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestOutput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.input.PathRequest;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.input.PathRequestBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.input.PathRequestKey;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.output.PathResponse;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.batch.request.output.PathResponseKey;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.service.path.rpc.result.PathDescriptionBuilder;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.common.optical.channel.types.rev200529.FrequencyTHz;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.OpenroadmLinkType;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.pathdescription.rev201210.path.description.AToZDirection;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.pathdescription.rev201210.path.description.AToZDirectionBuilder;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.service.types.rev200128.service.handler.header.ServiceHandlerHeaderBuilder;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NodeId;
 import org.opendaylight.yangtools.yang.common.Uint32;
 
 public class PathComputationServiceImplTest extends AbstractTest {
@@ -89,8 +120,222 @@ public class PathComputationServiceImplTest extends AbstractTest {
 
     }
 
+    @Test
+    public void testPathComputationRequestFromResultCache() throws ExecutionException, InterruptedException {
+        PceResultCache resultCache = new PceResultCache(dataBroker, new PceNetworkCache(dataBroker));
+        pathComputationServiceImpl.close();
+        pathComputationServiceImpl = new PathComputationServiceImpl(networkTransactionService,
+                this.getNotificationPublishService(), null, new PceNetworkCache(dataBroker), resultCache);
+        PathComputationRequestInput input = PceTestData.getPCE_simpletopology_test1_request();
+        AToZDirection atoZDirection = new AToZDirectionBuilder()
+                .setAToZWavelengthNumber(Uint32.valueOf(1))
+                .setAToZMinFrequency(new FrequencyTHz(GridUtils.getStartFrequencyFromIndex(0)))
+                .setAToZMaxFrequency(new FrequencyTHz(GridUtils.getStopFrequencyFromIndex(7)))
+                .build();
+        resultCache.put(resultCache.getKey(input), new PceResultCache.CachedResult("Path is calculated",
+                ResponseCodes.RESPONSE_OK, atoZDirection, null, null, null));
+
+        // the path is not computed, the network transaction service is a mock
+        PathComputationRequestOutput output = pathComputationServiceImpl.pathComputationRequest(input).get();
+        Assert.assertEquals(ResponseCodes.RESPONSE_OK, output.getConfigurationResponseCommon().getResponseCode());
+        Assert.assertEquals("Path is calculated", output.getConfigurationResponseCommon().getResponseMessage());
+        Assert.assertEquals(atoZDirection, output.getResponseParameters().getPathDescription().getAToZDirection());
+        Assert.assertEquals(1, resultCache.getHits());
+        Assert.assertEquals(0, resultCache.getMisses());
+        Mockito.verifyNoInteractions(networkTransactionService);
+    }
+
+    @Test
+    public void testPathComputationBatchRequest() throws ExecutionException, InterruptedException {
+        PathComputationBatchRequestOutput output = pathComputationServiceImpl.pathComputationBatchRequest(
+                new PathComputationBatchRequestInputBuilder()
+                    .setServiceHandlerHeader(new ServiceHandlerHeaderBuilder().setRequestId("request 1").build())
+                    .build()).get();
+        Assert.assertEquals(ResponseCodes.RESPONSE_OK, output.getConfigurationResponseCommon().getResponseCode());
+        Assert.assertEquals("request 1", output.getConfigurationResponseCommon().getRequestId());
+        Assert.assertTrue(output.nonnullPathResponse().isEmpty());
+    }
+
+    @Test
+    public void testPathComputationBatchRequestWithoutRequestId() throws ExecutionException, InterruptedException {
+        PathComputationBatchRequestOutput output = pathComputationServiceImpl.pathComputationBatchRequest(
+                new PathComputationBatchRequestInputBuilder().build()).get();
+        Assert.assertEquals(ResponseCodes.RESPONSE_FAILED,
+                output.getConfigurationResponseCommon().getResponseCode());
+    }
+
+    @Test
+    public void testPathComputationBatchRequestOrder() throws ExecutionException, InterruptedException {
+        PceLink link = createRoadmToRoadmLink();
+        setBatchPathComputations((input, batchContext) -> new PathFound(input, batchContext, link));
+        PathComputationBatchRequestOutput output = pathComputationServiceImpl.pathComputationBatchRequest(
+                createBatchRequest(false, "service 3", "service 1", "service 2")).get();
+        Assert.assertEquals(ResponseCodes.RESPONSE_OK, output.getConfigurationResponseCommon().getResponseCode());
+        Assert.assertEquals("3 paths calculated for 3 path requests",
+                output.getConfigurationResponseCommon().getResponseMessage());
+        Assert.assertEquals(List.of(new PathResponseKey("service 3"), new PathResponseKey("service 1"),
+                new PathResponseKey("service 2")), List.copyOf(output.getPathResponse().keySet()));
+        for (PathResponse pathResponse : output.getPathResponse().values()) {
+            Assert.assertEquals(ResponseCodes.RESPONSE_OK,
+                    pathResponse.getConfigurationResponseCommon().getResponseCode());
+            Assert.assertNotNull(pathResponse.getResponseParameters().getPathDescription());
+        }
+    }
+
+    @Test
+    public void testPathComputationBatchRequestReserveInSequence() throws ExecutionException, InterruptedException {
+        PceLink link = createRoadmToRoadmLink();
+        setBatchPathComputations((input, batchContext) -> new PathFound(input, batchContext, link));
+        PathComputationBatchRequestOutput output = pathComputationServiceImpl.pathComputationBatchRequest(
+                createBatchRequest(true, "service 1", "service 2")).get();
+        // the second path does not get the slots assigned to the first one
+        Assert.assertEquals(GridUtils.getStartFrequencyFromIndex(0),
+                getMinFrequency(output.getPathResponse().get(new PathResponseKey("service 1"))));
+        Assert.assertEquals(GridUtils.getStartFrequencyFromIndex(8),
+                getMinFrequency(output.getPathResponse().get(new PathResponseKey("service 2"))));
+
+        output = pathComputationServiceImpl.pathComputationBatchRequest(
+                createBatchRequest(false, "service 1", "service 2")).get();
+        Assert.assertEquals(GridUtils.getStartFrequencyFromIndex(0),
+                getMinFrequency(output.getPathResponse().get(new PathResponseKey("service 2"))));
+    }
+
+    @Test
+    public void testPathComputationBatchRequestFailedPathRequest() throws ExecutionException, InterruptedException {
+        PceLink link = createRoadmToRoadmLink();
+        setBatchPathComputations((input, batchContext) -> "service 2".equals(input.getServiceName())
+                ? new PathComputationError(input)
+                : new PathFound(input, batchContext, link));
+        PathComputationBatchRequestOutput output = pathComputationServiceImpl.pathComputationBatchRequest(
+                createBatchRequest(true, "service 1", "service 2", "service 3")).get();
+        Assert.assertEquals(ResponseCodes.RESPONSE_OK, output.getConfigurationResponseCommon().getResponseCode());
+        Assert.assertEquals("2 paths calculated for 3 path requests",
+                output.getConfigurationResponseCommon().getResponseMessage());
+        PathResponse failed = output.getPathResponse().get(new PathResponseKey("service 2"));
+        Assert.assertEquals(ResponseCodes.RESPONSE_FAILED, failed.getConfigurationResponseCommon().getResponseCode());
+        Assert.assertEquals("topology read failed", failed.getConfigurationResponseCommon().getResponseMessage());
+        Assert.assertNull(failed.getResponseParameters());
+        Assert.assertEquals(GridUtils.getStartFrequencyFromIndex(8),
+                getMinFrequency(output.getPathResponse().get(new PathResponseKey("service 3"))));
+    }
+
+    /*
+     * Replace the path computation of each path request of a batch, the batch context is the real one.
+     */
+    private void setBatchPathComputations(
+            BiFunction<PathComputationRequestInput, PceBatchContext, PceSendingPceRPCs> pathComputations) {
+        pathComputationServiceImpl.close();
+        pathComputationServiceImpl = new PathComputationServiceImpl(networkTransactionService,
+                this.getNotificationPublishService(), null, new PceNetworkCache(dataBroker)) {
+            @Override
+            PceSendingPceRPCs newPceSendingPceRPCs(PathComputationRequestInput input,
+                    PceBatchContext batchContext) {
+                return pathComputations.apply(input, batchContext);
+            }
+        };
+    }
+
+    private static PathComputationBatchRequestInput createBatchRequest(boolean reserveInSequence,
+            String... serviceNames) {
+        Map<PathRequestKey, PathRequest> pathRequests = new LinkedHashMap<>();
+        for (String serviceName : serviceNames) {
+            PathRequest pathRequest = new PathRequestBuilder().setServiceName(serviceName).build();
+            pathRequests.put(pathRequest.key(), pathRequest);
+        }
+        return new PathComputationBatchRequestInputBuilder()
+                .setServiceHandlerHeader(new ServiceHandlerHeaderBuilder().setRequestId("request 1").build())
+                .setReserveInSequence(reserveInSequence)
+                .setPathRequest(pathRequests)
+                .build();
+    }
+
+    private static PceLink createRoadmToRoadmLink() {
+        PceLink link = Mockito.mock(PceLink.class);
+        Mockito.when(link.getlinkType()).thenReturn(OpenroadmLinkType.ROADMTOROADM);
+        Mockito.when(link.getSourceId()).thenReturn(new NodeId("ROADM-A1-DEG2"));
+        Mockito.when(link.getDestId()).thenReturn(new NodeId("ROADM-C1-DEG1"));
+        return link;
+    }
+
+    private static BigDecimal getMinFrequency(PathResponse pathResponse) {
+        return pathResponse.getResponseParameters().getPathDescription().getAToZDirection().getAToZMinFrequency()
+                .getValue();
+    }
+
     @After
     public void destroy() {
         pathComputationServiceImpl.close();
     }
+
+    /*
+     * Path over a link, on the first 8 slots left available on its source node by the previous path requests.
+     */
+    private static final class PathFound extends PceSendingPceRPCs {
+        private final PceBatchContext batchContext;
+        private final PceLink link;
+        private final PceResult pceResult = new PceResult();
+
+        PathFound(PathComputationRequestInput input, PceBatchContext batchContext, PceLink link) {
+            super(input, null, null, batchContext.getNetworkCache(), batchContext);
+            this.batchContext = batchContext;
+            this.link = link;
+        }
+
+        @Override
+        public void pathComputation() {
+            BitSet slots = new BitSet(GridConstant.EFFECTIVE_BITS);
+            slots.set(0, GridConstant.EFFECTIVE_BITS);
+            PceNode roadm = Mockito.mock(PceNode.class);
+            Mockito.when(roadm.getBitSetData()).thenReturn(slots);
+            batchContext.applyReservedSpectrum(Map.of(link.getSourceId(), roadm));
+            int beginIndex = slots.nextSetBit(0);
+            pceResult.setMinFreq(GridUtils.getStartFrequencyFromIndex(beginIndex));
+            pceResult.setMaxFreq(GridUtils.getStopFrequencyFromIndex(beginIndex + 7));
+        }
+
+        @Override
+        public Boolean getSuccess() {
+            return true;
+        }
+
+        @Override
+        public String getResponseCode() {
+            return ResponseCodes.RESPONSE_OK;
+        }
+
+        @Override
+        public String getMessage() {
+            return "Path is calculated";
+        }
+
+        @Override
+        public PathDescriptionBuilder getPathDescription() {
+            return new PathDescriptionBuilder().setAToZDirection(new AToZDirectionBuilder()
+                    .setAToZMinFrequency(new FrequencyTHz(pceResult.getMinFreq()))
+                    .setAToZMaxFrequency(new FrequencyTHz(pceResult.getMaxFreq()))
+                    .build());
+        }
+
+        @Override
+        public List<PceLink> getPathAtoZ() {
+            return List.of(link);
+        }
+
+        @Override
+        public PceResult getReturnStructure() {
+            return pceResult;
+        }
+    }
+
+    private static final class PathComputationError extends PceSendingPceRPCs {
+
+        PathComputationError(PathComputationRequestInput input) {
+            super(input, null, null);
+        }
+
+        @Override
+        public void pathComputation() {
+            throw new IllegalStateException("topology read failed");
+        }
+    }
 }
@@ -0,0 +1,211 @@
+/*
+ * Copyright © 2020 Orange, Inc. and others.  All rights reserved.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Eclipse Public License v1.0 which accompanies this distribution,
+ * and is available at http://www.eclipse.org/legal/epl-v10.html
+ */
+package org.opendaylight.transportpce.pce.service;
+
+import com.google.common.util.concurrent.FluentFuture;
+import com.google.common.util.concurrent.SettableFuture;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Optional;
+import java.util.concurrent.ExecutionException;
+import org.junit.Assert;
+import org.junit.Before;
+import org.junit.Test;
+import org.mockito.Mockito;
+import org.opendaylight.mdsal.binding.api.DataBroker;
+import org.opendaylight.mdsal.binding.api.ReadTransaction;
+import org.opendaylight.mdsal.binding.api.WriteTransaction;
+import org.opendaylight.mdsal.common.api.CommitInfo;
+import org.opendaylight.mdsal.common.api.LogicalDatastoreType;
+import org.opendaylight.transportpce.common.InstanceIdentifiers;
+import org.opendaylight.transportpce.common.NetworkUtils;
+import org.opendaylight.transportpce.common.fixedflex.GridConstant;
+import org.opendaylight.transportpce.common.fixedflex.GridUtils;
+import org.opendaylight.transportpce.pce.networkanalyzer.PceNetworkCache;
+import org.opendaylight.transportpce.pce.utils.PceTestData;
+import org.opendaylight.transportpce.pce.utils.PceTestUtils;
+import org.opendaylight.transportpce.pce.utils.TransactionUtils;
+import org.opendaylight.transportpce.test.AbstractTest;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationCacheStatistics;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInput;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.PathComputationRequestInputBuilder;
+import org.opendaylight.yang.gen.v1.http.org.opendaylight.transportpce.pce.rev200128.path.computation.request.input.ServiceZEndBuilder;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.topology.rev200529.Node1;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.topology.rev200529.networks.network.node.DegreeAttributes;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.available.freq.map.AvailFreqMaps;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.available.freq.map.AvailFreqMapsBuilder;
+import org.opendaylight.yang.gen.v1.http.org.openroadm.network.types.rev200529.available.freq.map.AvailFreqMapsKey;
+import org.opendaylight.yang.gen.v1.http.org.transportpce.b.c._interface.service.types.rev200128.service.handler.header.ServiceHandlerHeaderBuilder;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.NodeId;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.Node;
+import org.opendaylight.yang.gen.v1.urn.ietf.params.xml.ns.yang.ietf.network.rev180226.networks.network.NodeKey;
+import org.opendaylight.yangtools.yang.binding.InstanceIdentifier;
+import org.opendaylight.yangtools.yang.common.Uint64;
+
+public class PceResultCacheTest extends AbstractTest {
+
+    private PceResultCache resultCache;
+
+    @Before
+    public void setUp() {
+        resultCache = new PceResultCache(this.getDataBroker(), new PceNetworkCache(this.getDataBroker()), 1);
+        resultCache.init();
+    }
+
+    @Test
+    public void testKeyIgnoresServiceNameAndRequestId() {
+        PathComputationRequestInput input = PceTestData.getPCE_simpletopology_test1_request();
+        PathComputationRequestInput otherService = new PathComputationRequestInputBuilder(input)
+                .setServiceName("service 2")
+                .setServiceHandlerHeader(new ServiceHandlerHeaderBuilder().setRequestId("request 2").build())
+                .build();
+        Assert.assertEquals(resultCache.getKey(input), resultCache.getKey(otherService));
+        PathComputationRequestInput otherZend = new PathComputationRequestInputBuilder(input)
+                .setServiceZEnd(new ServiceZEndBuilder(input.getServiceZEnd()).setNodeId("XPONDER-4-2").build())
+                .build();
+        Assert.assertNotEquals(resultCache.getKey(input), resultCache.getKey(otherZend));
+    }
+
+    @Test
+    public void testCoRoutingRequestIsNotCached() {
+        Assert.assertNull(resultCache.getKey(PceTestData.getPathComputationRequestInputWithCoRoutingOrGeneral2()));
+    }
+
+    @Test
+    public void testRequestIsNotCachedWithoutNetworkCache() {
+        PceResultCache withoutNetworkCache = new PceResultCache(this.getDataBroker(),
+                new PceNetworkCache(this.getDataBroker(), false));
+        Assert.assertNull(withoutNetworkCache.getKey(PceTestData.getPCE_simpletopology_test1_request()));
+    }
+
+    @Test
+    public void testHitMissAndEviction() throws ExecutionException, InterruptedException {
+        PceResultCache.CacheKey key = resultCache.getKey(PceTestData.getPCE_simpletopology_test1_request());
+        Assert.assertNull(resultCache.get(key));
+        resultCache.put(key, new PceResultCache.CachedResult("Path is calculated", "200", null, null, null, null));
+        Assert.assertEquals("200", resultCache.get(key).getResponseCode());
+        Assert.assertEquals(1, resultCache.getHits());
+        Assert.assertEquals(1, resultCache.getMisses());
+
+        // capacity of 1, the first result is evicted
+        PceResultCache.CacheKey otherKey = resultCache.getKey(PceTestData.getPCE_test3_request_54());
+        resultCache.put(otherKey, new PceResultCache.CachedResult("Path is calculated", "200", null, null, null,
+                null));
+        Assert.assertEquals(1, resultCache.size());
+        Assert.assertNull(resultCache.get(key));
+
+        PathComputationCacheStatistics statistics = readStatistics(Uint64.valueOf(2));
+        Assert.assertEquals(Uint64.valueOf(1), statistics.getHits());
+        Assert.assertEquals(Uint64.valueOf(2), statistics.getMisses());
+        Assert.assertEquals(Uint64.valueOf(1), statistics.getEvictions());
+    }
+
+    @Test
+    public void testTopologyChangeDropsResults() throws ExecutionException, InterruptedException {
+        PceTestUtils.writeNetworkIntoDataStore(this.getDataBroker(), this.getDataStoreContextUtil(),
+                TransactionUtils.getNetworkForSpanLoss());
+        PceNetworkCache networkCache = new PceNetworkCache(this.getDataBroker());
+        networkCache.init();
+        waitForVersion(networkCache, 1L);
+        PceResultCache cache = new PceResultCache(this.getDataBroker(), networkCache);
+        cache.init();
+        PceResultCache.CacheKey key = cache.getKey(PceTestData.getPCE_simpletopology_test1_request());
+        cache.put(key, new PceResultCache.CachedResult("Path is calculated", "200", null, null, null, null));
+        Assert.assertNotNull(cache.get(key));
+        Assert.assertEquals(0, cache.getEvictions());
+
+        // first slots of ROADM-C1-DEG1 used by a new service
+        AvailFreqMaps availFreqMaps = GridUtils.initFreqMaps4FixedGrid2Available()
+                .get(new AvailFreqMapsKey(GridConstant.C_BAND));
+        byte[] freqMap = availFreqMaps.getFreqMap().clone();
+        freqMap[0] = 0;
+        WriteTransaction writeTransaction = this.getDataBroker().newWriteOnlyTransaction();
+        writeTransaction.put(LogicalDatastoreType.CONFIGURATION, InstanceIdentifiers.OVERLAY_NETWORK_II
+                .child(Node.class, new NodeKey(new NodeId("ROADM-C1-DEG1"))).augmentation(Node1.class)
+                .child(DegreeAttributes.class).child(AvailFreqMaps.class, availFreqMaps.key()),
+                new AvailFreqMapsBuilder(availFreqMaps).setFreqMap(freqMap).build());
+        writeTransaction.commit().get();
+        waitForVersion(networkCache, 2L);
+
+        Assert.assertNull(cache.get(key));
+        Assert.assertEquals(1, cache.getEvictions());
+        Assert.assertEquals(0, cache.size());
+        // a result computed on the previous topology is not cached
+        cache.put(key, new PceResultCache.CachedResult("Path is calculated", "200", null, null, null, null));
+        Assert.assertEquals(0, cache.size());
+        PceResultCache.CacheKey currentKey = cache.getKey(PceTestData.getPCE_simpletopology_test1_request());
+        Assert.assertNotEquals(key, currentKey);
+        Assert.assertNull(cache.get(currentKey));
+        cache.close();
+        networkCache.close();
+    }
+
+    @Test(timeout = 10000)
+    public void testHitDoesNotWaitForStatisticsWrite() {
+        // statistics commits completed by the test only
+        List<SettableFuture<CommitInfo>> commits = new ArrayList<>();
+        WriteTransaction writeTransaction = Mockito.mock(WriteTransaction.class);
+        Mockito.doAnswer(invocation -> {
+            SettableFuture<CommitInfo> commit = SettableFuture.create();
+            commits.add(commit);
+            return FluentFuture.from(commit);
+        }).when(writeTransaction).commit();
+        DataBroker dataBroker = Mockito.mock(DataBroker.class);
+        Mockito.when(dataBroker.newWriteOnlyTransaction()).thenReturn(writeTransaction);
+        PceResultCache cache = new PceResultCache(dataBroker, new PceNetworkCache(this.getDataBroker()));
+        cache.init();
+
+        PceResultCache.CacheKey key = cache.getKey(PceTestData.getPCE_simpletopology_test1_request());
+        cache.put(key, new PceResultCache.CachedResult("Path is calculated", "200", null, null, null, null));
+        for (int i = 0; i < 10; i++) {
+            Assert.assertEquals("200", cache.get(key).getResponseCode());
+        }
+        Assert.assertEquals(10, cache.getHits());
+        // the lookups did not wait for the pending write, nor start other ones
+        Assert.assertEquals(1, commits.size());
+        Mockito.verify(writeTransaction, Mockito.times(1)).put(Mockito.eq(LogicalDatastoreType.OPERATIONAL),
+                Mockito.any(InstanceIdentifier.class), Mockito.any(PathComputationCacheStatistics.class));
+
+        // the counters changed meanwhile are published by a single write
+        commits.get(0).set(CommitInfo.empty());
+        Assert.assertEquals(2, commits.size());
+        commits.get(1).set(CommitInfo.empty());
+        Assert.assertEquals(2, commits.size());
+        cache.close();
+    }
+
+    /*
+     * The change notifications are asynchronous.
+     */
+    private static void waitForVersion(PceNetworkCache networkCache, long version) throws InterruptedException {
+        for (int i = 0; i < 100 && networkCache.getVersion(NetworkUtils.OVERLAY_NETWORK_ID) < version; i++) {
+            Thread.sleep(50);
+        }
+        Assert.assertEquals(version, networkCache.getVersion(NetworkUtils.OVERLAY_NETWORK_ID));
+    }
+
+    /*
+     * Statistics once written with the expected misses, the writes are asynchronous.
+     */
+    private PathComputationCacheStatistics readStatistics(Uint64 misses)
+            throws ExecutionException, InterruptedException {
+        for (int i = 0; i < 100; i++) {
+            Optional<PathComputationCacheStatistics> statistics;
+            try (ReadTransaction readTx = this.getDataBroker().newReadOnlyTransaction()) {
+                statistics = readTx.read(LogicalDatastoreType.OPERATIONAL,
+                        InstanceIdentifier.create(PathComputationCacheStatistics.class)).get();
+            }
+            if (statistics.isPresent() && misses.equals(statistics.get().getMisses())) {
+                return statistics.get();
+            }
+            Thread.sleep(50);
+        }
+        Assert.fail("path-computation-cache-statistics not written with " + misses + " misses");
+        return null;
+    }
+}
@@ -138,18 +138,22 @@ class TransportPCEFulltesting(unittest.TestCase):
     def test_01_connect_xpdrA(self):
         response = test_utils.mount_device("XPDRA01", 'xpdra')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("XPDRA01")))
 
     def test_02_connect_xpdrC(self):
         response = test_utils.mount_device("XPDRC01", 'xpdrc')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("XPDRC01")))
 
     def test_03_connect_rdmA(self):
         response = test_utils.mount_device("ROADMA01", 'roadma-full')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("ROADMA01")))
 
     def test_04_connect_rdmC(self):
         response = test_utils.mount_device("ROADMC01", 'roadmc-full')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("ROADMC01")))
 
     def test_05_connect_xprdA_N1_to_roadmA_PP1(self):
         response = test_utils.connect_xpdr_to_rdm_request("XPDRA01", "1", "1",
@@ -158,7 +162,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDRA01-XPDR1-XPDR1-NETWORK1toROADMA01-SRG1-SRG1-PP1-TXRX"),
+            timeout=10, replaces=2))
 
     def test_06_connect_roadmA_PP1_to_xpdrA_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDRA01", "1", "1",
@@ -167,7 +173,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADMA01-SRG1-SRG1-PP1-TXRXtoXPDRA01-XPDR1-XPDR1-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_07_connect_xprdC_N1_to_roadmC_PP1(self):
         response = test_utils.connect_xpdr_to_rdm_request("XPDRC01", "1", "1",
@@ -176,7 +184,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDRC01-XPDR1-XPDR1-NETWORK1toROADMC01-SRG1-SRG1-PP1-TXRX"),
+            timeout=10, replaces=2))
 
     def test_08_connect_roadmC_PP1_to_xpdrC_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDRC01", "1", "1",
@@ -185,7 +195,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADMC01-SRG1-SRG1-PP1-TXRXtoXPDRC01-XPDR1-XPDR1-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_09_add_omsAttributes_ROADMA_ROADMC(self):
         # Config ROADMA-ROADMC oms-attributes
@@ -226,7 +238,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_12_get_eth_service1(self):
         response = test_utils.get_service_list_request("services/service1")
@@ -351,7 +365,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDRA01-XPDR1-XPDR1-NETWORK2toROADMA01-SRG1-SRG1-PP2-TXRX"),
+            timeout=10, replaces=2))
 
     def test_19_connect_roadmA_PP2_to_xpdrA_N2(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDRA01", "1", "2",
@@ -360,7 +376,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADMA01-SRG1-SRG1-PP2-TXRXtoXPDRA01-XPDR1-XPDR1-NETWORK2"),
+            timeout=10, replaces=2))
 
     def test_20_connect_xprdC_N2_to_roadmC_PP2(self):
         response = test_utils.connect_xpdr_to_rdm_request("XPDRC01", "1", "2",
@@ -369,7 +387,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDRC01-XPDR1-XPDR1-NETWORK2toROADMC01-SRG1-SRG1-PP2-TXRX"),
+            timeout=10, replaces=2))
 
     def test_21_connect_roadmC_PP2_to_xpdrC_N2(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDRC01", "1", "2",
@@ -378,7 +398,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADMC01-SRG1-SRG1-PP2-TXRXtoXPDRC01-XPDR1-XPDR1-NETWORK2"),
+            timeout=10, replaces=2))
 
     def test_22_create_eth_service2(self):
         self.cr_serv_sample_data["input"]["service-name"] = "service2"
@@ -388,7 +410,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_23_get_eth_service2(self):
         response = test_utils.get_service_list_request("services/service2")
@@ -441,7 +465,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                                  ele['org-openroadm-network-topology:xpdr-network-attributes']['wavelength'])
             if ele['tp-id'] == 'XPDR1-CLIENT1' or ele['tp-id'] == 'XPDR1-CLIENT2':
                 self.assertNotIn('org-openroadm-network-topology:xpdr-client-attributes', dict.keys(ele))
-        time.sleep(10)
 
     def test_26_check_topo_ROADMA_SRG1(self):
         response = test_utils.get_ordm_topo_request("node/ROADMA01-SRG1")
@@ -468,7 +491,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 self.assertEqual(freq_map_array[94], 0, "Lambda 2 should not be available")
             if ele['tp-id'] == 'SRG1-PP3-TXRX':
                 self.assertNotIn('org-openroadm-network-topology:pp-attributes', dict.keys(ele))
-        time.sleep(10)
 
     def test_27_check_topo_ROADMA_DEG1(self):
         response = test_utils.get_ordm_topo_request("node/ROADMA01-DEG1")
@@ -493,7 +515,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 freq_map_array = [int(x) for x in freq_map]
                 self.assertEqual(freq_map_array[95], 0, "Lambda 1 should not be available")
                 self.assertEqual(freq_map_array[94], 0, "Lambda 2 should not be available")
-        time.sleep(10)
 
     #     creation service test on a non-available resource
     def test_28_create_eth_service3(self):
@@ -529,7 +550,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service1"), timeout=20, replaces=20))
 
     def test_31_delete_eth_service2(self):
         response = test_utils.service_delete_request("service2")
@@ -538,7 +559,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service2"), timeout=20, replaces=20))
 
     def test_32_check_no_xc_ROADMA(self):
         response = test_utils.check_netconf_node_request("ROADMA01", "")
@@ -569,7 +590,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 self.assertNotIn('wavelength', dict.keys(
                     ele[u'org-openroadm-network-topology:'
                         u'xpdr-network-attributes']))
-        time.sleep(10)
 
     def test_34_check_topo_ROADMA_SRG1(self):
         response = test_utils.get_ordm_topo_request("node/ROADMA01-SRG1")
@@ -596,7 +616,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 self.assertEqual(freq_map_array[94], 255, "Lambda 2 should  be available")
             else:
                 self.assertNotIn('org-openroadm-network-topology:pp-attributes', dict.keys(ele))
-        time.sleep(10)
 
     def test_35_check_topo_ROADMA_DEG1(self):
         response = test_utils.get_ordm_topo_request("node/ROADMA01-DEG1")
@@ -621,7 +640,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 freq_map_array = [int(x) for x in freq_map]
                 self.assertEqual(freq_map_array[95], 255, "Lambda 1 should be available")
                 self.assertEqual(freq_map_array[94], 255, "Lambda 2 should be available")
-        time.sleep(10)
 
     # test service-create for Optical Channel (OC) service from srg-pp to srg-pp
     def test_36_create_oc_service1(self):
@@ -637,7 +655,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_37_get_oc_service1(self):
         response = test_utils.get_service_list_request("services/service1")
@@ -711,7 +731,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_41_get_oc_service2(self):
         response = test_utils.get_service_list_request("services/service2")
@@ -762,7 +784,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service1"), timeout=20, replaces=20))
 
     def test_45_delete_oc_service2(self):
         response = test_utils.service_delete_request("service2")
@@ -771,7 +793,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common'][
                           'response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service2"), timeout=20, replaces=20))
 
     def test_46_get_no_oc_services(self):
         print("start test")
@@ -21,9 +21,9 @@ from common import test_utils
 
 class TransportPCEtesting(unittest.TestCase):
 
-    simple_topo_bi_dir_data = None
-    simple_topo_uni_dir_data = None
-    complex_topo_uni_dir_data = None
+    simple_topo_bi_dir_file = None
+    simple_topo_uni_dir_file = None
+    complex_topo_uni_dir_file = None
     port_mapping_data = None
     processes = None
 
@@ -34,19 +34,16 @@ class TransportPCEtesting(unittest.TestCase):
             sample_files_parsed = False
             TOPO_BI_DIR_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)),
                                             "..", "..", "sample_configs", "honeynode-topo.xml")
-            with open(TOPO_BI_DIR_FILE, 'r') as topo_bi_dir:
-                cls.simple_topo_bi_dir_data = topo_bi_dir.read()
+            # topologies are streamed from disk by test_utils.put_file_request
+            cls.simple_topo_bi_dir_file = TOPO_BI_DIR_FILE
 
             TOPO_UNI_DIR_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)),
                                              "..", "..", "sample_configs", "NW-simple-topology.xml")
-
-            with open(TOPO_UNI_DIR_FILE, 'r') as topo_uni_dir:
-                cls.simple_topo_uni_dir_data = topo_uni_dir.read()
+            cls.simple_topo_uni_dir_file = TOPO_UNI_DIR_FILE
 
             TOPO_UNI_DIR_COMPLEX_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)),
                                                      "..", "..", "sample_configs", "NW-for-test-5-4.xml")
-            with open(TOPO_UNI_DIR_COMPLEX_FILE, 'r') as topo_uni_dir_complex:
-                cls.complex_topo_uni_dir_data = topo_uni_dir_complex.read()
+            cls.complex_topo_uni_dir_file = TOPO_UNI_DIR_COMPLEX_FILE
             PORT_MAPPING_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)),
                                                      "..", "..", "sample_configs", "pce_portmapping_121.json")
             with open(PORT_MAPPING_FILE, 'r') as port_mapping:
@@ -85,7 +82,7 @@ class TransportPCEtesting(unittest.TestCase):
 
      # Load simple bidirectional topology
     def test_01_load_simple_topology_bi(self):
-        response = test_utils.put_xmlrequest(test_utils.URL_CONFIG_ORDM_TOPO, self.simple_topo_bi_dir_data)
+        response = test_utils.put_file_request(test_utils.URL_CONFIG_ORDM_TOPO, self.simple_topo_bi_dir_file)
         self.assertEqual(response.status_code, requests.codes.ok)
         time.sleep(2)
 
@@ -148,7 +145,7 @@ class TransportPCEtesting(unittest.TestCase):
 
     # Load simple bidirectional topology
     def test_08_load_simple_topology_uni(self):
-        response = test_utils.put_xmlrequest(test_utils.URL_CONFIG_ORDM_TOPO, self.simple_topo_uni_dir_data)
+        response = test_utils.put_file_request(test_utils.URL_CONFIG_ORDM_TOPO, self.simple_topo_uni_dir_file)
         self.assertEqual(response.status_code, 201)
         time.sleep(2)
 
@@ -224,7 +221,7 @@ class TransportPCEtesting(unittest.TestCase):
 
     # Load complex topology
     def test_15_load_complex_topology(self):
-        response = test_utils.put_xmlrequest(test_utils.URL_CONFIG_ORDM_TOPO, self.complex_topo_uni_dir_data)
+        response = test_utils.put_file_request(test_utils.URL_CONFIG_ORDM_TOPO, self.complex_topo_uni_dir_file)
         self.assertEqual(response.status_code, 201)
         time.sleep(2)
 
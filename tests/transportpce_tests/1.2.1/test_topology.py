@@ -17,6 +17,7 @@ import time
 import unittest
 import requests
 from common import test_utils
+from common.topology_view import TopologyView
 
 
 class TransportPCETopologyTesting(unittest.TestCase):
@@ -90,6 +91,24 @@ class TransportPCETopologyTesting(unittest.TestCase):
         }
     }
 
+    def check_roadm_nodes(self, topology, check_dict, clli, roadm):
+        for node_id, check in check_dict.items():
+            self.assertEqual(topology.node_types[node_id], check['node_type'])
+            if check['node_type'] == 'SRG':
+                self.assertEqual(topology.tp_count(node_id), 17)
+            for item in check['checks_tp']:
+                self.assertEqual(topology.tp(node_id, item['tp-id']), item)
+            self.assertTrue(topology.supported_by(node_id, 'clli-network', clli))
+            self.assertTrue(topology.supported_by(node_id, 'openroadm-network', roadm))
+
+    def check_xpdr_node(self, topology, node_id, clli=None):
+        self.assertTrue(topology.supported_by(node_id, 'openroadm-network', 'XPDRA01'))
+        if clli is not None:
+            self.assertTrue(topology.supported_by(node_id, 'clli-network', clli))
+        self.assertEqual(topology.node_types[node_id], 'XPONDER')
+        self.assertEqual(topology.tp_count(node_id, 'XPONDER-CLIENT'), 4)
+        self.assertEqual(topology.tp_count(node_id, 'XPONDER-NETWORK'), 2)
+
     @classmethod
     def setUpClass(cls):
         cls.processes = test_utils.start_tpce()
@@ -127,13 +146,11 @@ class TransportPCETopologyTesting(unittest.TestCase):
         self.assertEqual(res['network'][0]['node'][0]['org-openroadm-network:model'], '2')
 
     def test_04_getLinks_OpenroadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
+        topology = TopologyView.from_response(response)
         # Tests related to links
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        self.assertEqual(nbLink, 10)
+        self.assertEqual(len(topology.links), 10)
         check_list = {'EXPRESS-LINK': ['ROADMA01-DEG2-DEG2-CTP-TXRXtoROADMA01-DEG1-DEG1-CTP-TXRX',
                                        'ROADMA01-DEG1-DEG1-CTP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX'],
                       'ADD-LINK': ['ROADMA01-SRG1-SRG1-CP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX',
@@ -145,47 +162,17 @@ class TransportPCETopologyTesting(unittest.TestCase):
                                     'ROADMA01-DEG1-DEG1-CTP-TXRXtoROADMA01-SRG3-SRG3-CP-TXRX',
                                     'ROADMA01-DEG2-DEG2-CTP-TXRXtoROADMA01-SRG3-SRG3-CP-TXRX']
                       }
-        for i in range(0, nbLink):
-            linkId = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            linkType = res['network'][0]['ietf-network-topology:link'][i]['org-openroadm-common-network:link-type']
-            if linkType in check_list:
-                find = linkId in check_list[linkType]
-                self.assertEqual(find, True)
-                (check_list[linkType]).remove(linkId)
-            else:
-                self.assertFalse(True)
-        for link_type in check_list:
-            self.assertEqual(len(check_list[link_type]), 0)
+        self.assertEqual(topology.links_by_type(),
+                         {link_type: set(link_ids) for link_type, link_ids in check_list.items()})
 
     def test_05_getNodes_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
-        res = response.json()
         # Tests related to nodes
         self.assertEqual(response.status_code, requests.codes.ok)
-        nbNode = len(res['network'][0]['node'])
-        self.assertEqual(nbNode, 4)
-        listNode = ['ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2']
-        for i in range(0, nbNode):
-            self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                          res['network'][0]['node'][i]['supporting-node'])
-            nodeType = res['network'][0]['node'][i]['org-openroadm-common-network:node-type']
-            nodeId = res['network'][0]['node'][i]['node-id']
-            if nodeId in self.CHECK_DICT1:
-                self.assertEqual(nodeType, self.CHECK_DICT1[nodeId]['node_type'])
-                if self.CHECK_DICT1[nodeId]['node_type'] == 'SRG':
-                    self.assertEqual(len(res['network'][0]['node'][i]['ietf-network-topology:termination-point']), 17)
-                for item in self.CHECK_DICT1[nodeId]['checks_tp']:
-                    self.assertIn(item, res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                listNode.remove(nodeId)
-            else:
-                self.assertFalse(True)
-
-        self.assertEqual(len(listNode), 0)
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.nodes), 4)
+        self.assertEqual(set(topology.nodes), {'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2'})
+        self.check_roadm_nodes(topology, self.CHECK_DICT1, 'NodeA', 'ROADMA01')
 
     def test_06_connect_XPDRA(self):
         response = test_utils.mount_device("XPDRA01", 'xpdra')
@@ -219,59 +206,21 @@ class TransportPCETopologyTesting(unittest.TestCase):
                 self.assertFalse(True)
 
     def test_09_getNodes_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
-        res = response.json()
         # Tests related to nodes
         self.assertEqual(response.status_code, requests.codes.ok)
-        nbNode = len(res['network'][0]['node'])
-        self.assertEqual(nbNode, 5)
-        listNode = ['XPDRA01-XPDR1', 'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2']
-        for i in range(0, nbNode):
-            nodeType = res['network'][0]['node'][i]['org-openroadm-common-network:node-type']
-            nodeId = res['network'][0]['node'][i]['node-id']
-            # Tests related to XPDRA nodes
-            if nodeId == 'XPDRA01-XPDR1':
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'XPDRA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertEqual(nodeType, 'XPONDER')
-                nbTps = len(res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                client = 0
-                network = 0
-                for j in range(0, nbTps):
-                    tpType = res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j][
-                        'org-openroadm-common-network:tp-type']
-                    tpId = res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j]['tp-id']
-                    if tpType == 'XPONDER-CLIENT':
-                        client += 1
-                    elif tpType == 'XPONDER-NETWORK':
-                        network += 1
-                    if tpId == 'XPDR1-NETWORK2':
-                        self.assertEqual(res['network'][0]['node'][i]['ietf-network-topology:termination-point']
-                                         [j]['transportpce-topology:associated-connection-map-port'], 'XPDR1-CLIENT3')
-                    if tpId == 'XPDR1-CLIENT3':
-                        self.assertEqual(res['network'][0]['node'][i]['ietf-network-topology:termination-point']
-                                         [j]['transportpce-topology:associated-connection-map-port'], 'XPDR1-NETWORK2')
-                self.assertTrue(client == 4)
-                self.assertTrue(network == 2)
-                listNode.remove(nodeId)
-            # Tests related to ROADMA nodes
-            elif nodeId in self.CHECK_DICT1:
-                self.assertEqual(nodeType, self.CHECK_DICT1[nodeId]['node_type'])
-                if self.CHECK_DICT1[nodeId]['node_type'] == 'SRG':
-                    self.assertEqual(len(res['network'][0]['node'][i]['ietf-network-topology:termination-point']), 17)
-                for item in self.CHECK_DICT1[nodeId]['checks_tp']:
-                    self.assertIn(item, res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                listNode.remove(nodeId)
-            else:
-                self.assertFalse(True)
-        self.assertEqual(len(listNode), 0)
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.nodes), 5)
+        self.assertEqual(set(topology.nodes),
+                         {'XPDRA01-XPDR1', 'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2'})
+        # Tests related to XPDRA nodes
+        self.check_xpdr_node(topology, 'XPDRA01-XPDR1', 'NodeA')
+        self.assertEqual(topology.tp('XPDRA01-XPDR1', 'XPDR1-NETWORK2')
+                         ['transportpce-topology:associated-connection-map-port'], 'XPDR1-CLIENT3')
+        self.assertEqual(topology.tp('XPDRA01-XPDR1', 'XPDR1-CLIENT3')
+                         ['transportpce-topology:associated-connection-map-port'], 'XPDR1-NETWORK2')
+        # Tests related to ROADMA nodes
+        self.check_roadm_nodes(topology, self.CHECK_DICT1, 'NodeA', 'ROADMA01')
 
     # Connect the tail XPDRA to ROADMA and vice versa
     def test_10_connect_tail_xpdr_rdm(self):
@@ -287,13 +236,11 @@ class TransportPCETopologyTesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
 
     def test_12_getLinks_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
+        topology = TopologyView.from_response(response)
         # Tests related to links
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        self.assertEqual(nbLink, 12)
+        self.assertEqual(len(topology.links), 12)
         check_list = {'EXPRESS-LINK': ['ROADMA01-DEG2-DEG2-CTP-TXRXtoROADMA01-DEG1-DEG1-CTP-TXRX',
                                        'ROADMA01-DEG1-DEG1-CTP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX'],
                       'ADD-LINK': ['ROADMA01-SRG1-SRG1-CP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX',
@@ -307,17 +254,8 @@ class TransportPCETopologyTesting(unittest.TestCase):
                       'XPONDER-INPUT': ['ROADMA01-SRG1-SRG1-PP1-TXRXtoXPDRA01-XPDR1-XPDR1-NETWORK1'],
                       'XPONDER-OUTPUT': ['XPDRA01-XPDR1-XPDR1-NETWORK1toROADMA01-SRG1-SRG1-PP1-TXRX']
                       }
-        for i in range(0, nbLink):
-            linkId = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            linkType = res['network'][0]['ietf-network-topology:link'][i]['org-openroadm-common-network:link-type']
-            if linkType in check_list:
-                find = linkId in check_list[linkType]
-                self.assertEqual(find, True)
-                (check_list[linkType]).remove(linkId)
-            else:
-                self.assertFalse(True)
-        for link_type in check_list:
-            self.assertEqual(len(check_list[link_type]), 0)
+        self.assertEqual(topology.links_by_type(),
+                         {link_type: set(link_ids) for link_type, link_ids in check_list.items()})
 
     def test_13_connect_ROADMC(self):
         response = test_utils.mount_device("ROADMC01", 'roadmc')
@@ -393,13 +331,11 @@ class TransportPCETopologyTesting(unittest.TestCase):
         self.assertEqual(len(listNode), 0)
 
     def test_18_getROADMLinkOpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
+        topology = TopologyView.from_response(response)
         # Tests related to links
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        self.assertEqual(nbLink, 20)
+        self.assertEqual(len(topology.links), 20)
         check_list = {'EXPRESS-LINK': ['ROADMA01-DEG2-DEG2-CTP-TXRXtoROADMA01-DEG1-DEG1-CTP-TXRX',
                                        'ROADMA01-DEG1-DEG1-CTP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX',
                                        'ROADMC01-DEG2-DEG2-CTP-TXRXtoROADMC01-DEG1-DEG1-CTP-TXRX',
@@ -421,106 +357,37 @@ class TransportPCETopologyTesting(unittest.TestCase):
                       'XPONDER-INPUT': ['ROADMA01-SRG1-SRG1-PP1-TXRXtoXPDRA01-XPDR1-XPDR1-NETWORK1'],
                       'XPONDER-OUTPUT': ['XPDRA01-XPDR1-XPDR1-NETWORK1toROADMA01-SRG1-SRG1-PP1-TXRX']
                       }
-        for i in range(0, nbLink):
-            linkId = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            linkType = res['network'][0]['ietf-network-topology:link'][i]['org-openroadm-common-network:link-type']
-            if linkType in check_list:
-                find = linkId in check_list[linkType]
-                self.assertEqual(find, True)
-                (check_list[linkType]).remove(linkId)
-            else:
-                self.assertFalse(True)
-        for link_type in check_list:
-            self.assertEqual(len(check_list[link_type]), 0)
+        self.assertEqual(topology.links_by_type(),
+                         {link_type: set(link_ids) for link_type, link_ids in check_list.items()})
 
     def test_19_getLinkOmsAttributesOpenRoadmTopology(self):
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
+        topology = TopologyView.from_response(response)
         # Tests related to links
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        self.assertEqual(nbLink, 20)
-        R2RLink = ['ROADMA01-DEG1-DEG1-TTP-TXRXtoROADMC01-DEG2-DEG2-TTP-TXRX',
-                   'ROADMC01-DEG2-DEG2-TTP-TXRXtoROADMA01-DEG1-DEG1-TTP-TXRX']
-        for i in range(0, nbLink):
-            link_id = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            if link_id in R2RLink:
-                find = False
-                spanLoss = (res['network'][0]['ietf-network-topology:link'][i]
-                               ['org-openroadm-network-topology:OMS-attributes']['span']["engineered-spanloss"])
-                length = (res['network'][0]['ietf-network-topology:link'][i]
-                             ['org-openroadm-network-topology:OMS-attributes']['span']['link-concatenation'][0]
-                             ['SRLG-length'])
-                if (spanLoss is not None) & (length is not None):
-                    find = True
-                self.assertTrue(find)
-                R2RLink.remove(link_id)
-        self.assertEqual(len(R2RLink), 0)
+        self.assertEqual(len(topology.links), 20)
+        for link_id in ('ROADMA01-DEG1-DEG1-TTP-TXRXtoROADMC01-DEG2-DEG2-TTP-TXRX',
+                        'ROADMC01-DEG2-DEG2-TTP-TXRXtoROADMA01-DEG1-DEG1-TTP-TXRX'):
+            span = topology.links[link_id]['org-openroadm-network-topology:OMS-attributes']['span']
+            self.assertIsNotNone(span["engineered-spanloss"])
+            self.assertIsNotNone(span['link-concatenation'][0]['SRLG-length'])
 
     def test_20_getNodes_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
-        res = response.json()
         # Tests related to nodes
         self.assertEqual(response.status_code, requests.codes.ok)
-        nbNode = len(res['network'][0]['node'])
-        self.assertEqual(nbNode, 8)
-        listNode = ['XPDRA01-XPDR1',
-                    'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2',
-                    'ROADMC01-SRG1', 'ROADMC01-DEG1', 'ROADMC01-DEG2']
-        for i in range(0, nbNode):
-            nodeType = res['network'][0]['node'][i]['org-openroadm-common-network:node-type']
-            nodeId = res['network'][0]['node'][i]['node-id']
-            # Tests related to XPDRA nodes
-            if nodeId == 'XPDRA01-XPDR1':
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'XPDRA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertEqual(nodeType, 'XPONDER')
-                nbTps = len(res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertTrue(nbTps == 6)
-                client = 0
-                network = 0
-                for j in range(0, nbTps):
-                    tpType = res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j][
-                        'org-openroadm-common-network:tp-type']
-                    if tpType == 'XPONDER-CLIENT':
-                        client += 1
-                    elif tpType == 'XPONDER-NETWORK':
-                        network += 1
-                self.assertTrue(client == 4)
-                self.assertTrue(network == 2)
-                listNode.remove(nodeId)
-            # Tests related to ROADMA nodes
-            elif nodeId in self.CHECK_DICT1:
-                self.assertEqual(nodeType, self.CHECK_DICT1[nodeId]['node_type'])
-                if self.CHECK_DICT1[nodeId]['node_type'] == 'SRG':
-                    self.assertEqual(len(res['network'][0]['node'][i]['ietf-network-topology:termination-point']), 17)
-                for item in self.CHECK_DICT1[nodeId]['checks_tp']:
-                    self.assertIn(item, res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertEqual(res['network'][0]['node'][i]['org-openroadm-common-network:node-type'],
-                                 self.CHECK_DICT1[nodeId]['node_type'])
-                listNode.remove(nodeId)
-            # Tests related to ROADMC nodes
-            elif nodeId in self.CHECK_DICT2:
-                self.assertEqual(nodeType, self.CHECK_DICT2[nodeId]['node_type'])
-                if self.CHECK_DICT2[nodeId]['node_type'] == 'SRG':
-                    self.assertEqual(len(res['network'][0]['node'][i]['ietf-network-topology:termination-point']), 17)
-                for item in self.CHECK_DICT2[nodeId]['checks_tp']:
-                    self.assertIn(item, res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeC'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMC01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertEqual(res['network'][0]['node'][i]['org-openroadm-common-network:node-type'],
-                                 self.CHECK_DICT2[nodeId]['node_type'])
-                listNode.remove(nodeId)
-            else:
-                self.assertFalse(True)
-        self.assertEqual(len(listNode), 0)
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.nodes), 8)
+        self.assertEqual(set(topology.nodes),
+                         {'XPDRA01-XPDR1',
+                          'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2',
+                          'ROADMC01-SRG1', 'ROADMC01-DEG1', 'ROADMC01-DEG2'})
+        # Tests related to XPDRA nodes
+        self.assertEqual(topology.tp_count('XPDRA01-XPDR1'), 6)
+        self.check_xpdr_node(topology, 'XPDRA01-XPDR1')
+        # Tests related to ROADMA and ROADMC nodes
+        self.check_roadm_nodes(topology, self.CHECK_DICT1, 'NodeA', 'ROADMA01')
+        self.check_roadm_nodes(topology, self.CHECK_DICT2, 'NodeC', 'ROADMC01')
 
     def test_21_connect_ROADMB(self):
         response = test_utils.mount_device("ROADMB01", 'roadmb')
@@ -597,77 +464,49 @@ class TransportPCETopologyTesting(unittest.TestCase):
     def test_27_verifyDegree(self):
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
+        topology = TopologyView.from_response(response)
         # Tests related to links
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        listR2RLink = ['ROADMA01-DEG1-DEG1-TTP-TXRXtoROADMC01-DEG2-DEG2-TTP-TXRX',
-                       'ROADMC01-DEG2-DEG2-TTP-TXRXtoROADMA01-DEG1-DEG1-TTP-TXRX',
-                       'ROADMA01-DEG2-DEG2-TTP-TXRXtoROADMB01-DEG1-DEG1-TTP-TXRX',
-                       'ROADMC01-DEG1-DEG1-TTP-TXRXtoROADMB01-DEG2-DEG2-TTP-TXRX',
-                       'ROADMB01-DEG1-DEG1-TTP-TXRXtoROADMA01-DEG2-DEG2-TTP-TXRX',
-                       'ROADMB01-DEG2-DEG2-TTP-TXRXtoROADMC01-DEG1-DEG1-TTP-TXRX']
-        for i in range(0, nbLink):
-            if (res['network'][0]['ietf-network-topology:link'][i]
-                   ['org-openroadm-common-network:link-type'] == 'ROADM-TO-ROADM'):
-                link_id = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-                find = link_id in listR2RLink
-                self.assertEqual(find, True)
-                listR2RLink.remove(link_id)
-        self.assertEqual(len(listR2RLink), 0)
+        self.assertEqual(topology.link_ids('ROADM-TO-ROADM'),
+                         {'ROADMA01-DEG1-DEG1-TTP-TXRXtoROADMC01-DEG2-DEG2-TTP-TXRX',
+                          'ROADMC01-DEG2-DEG2-TTP-TXRXtoROADMA01-DEG1-DEG1-TTP-TXRX',
+                          'ROADMA01-DEG2-DEG2-TTP-TXRXtoROADMB01-DEG1-DEG1-TTP-TXRX',
+                          'ROADMC01-DEG1-DEG1-TTP-TXRXtoROADMB01-DEG2-DEG2-TTP-TXRX',
+                          'ROADMB01-DEG1-DEG1-TTP-TXRXtoROADMA01-DEG2-DEG2-TTP-TXRX',
+                          'ROADMB01-DEG2-DEG2-TTP-TXRXtoROADMC01-DEG1-DEG1-TTP-TXRX'})
 
     def test_28_verifyOppositeLinkTopology(self):
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
+        topology = TopologyView.from_response(response)
         # Tests related to links
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        self.assertEqual(nbLink, 34)
-        for i in range(0, nbLink):
-            link_id = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            link_type = res['network'][0]['ietf-network-topology:link'][i]['org-openroadm-common-network:link-type']
-            link_src = res['network'][0]['ietf-network-topology:link'][i]['source']['source-node']
-            link_dest = res['network'][0]['ietf-network-topology:link'][i]['destination']['dest-node']
-            oppLink_id = (res['network'][0]['ietf-network-topology:link'][i]
-                             ['org-openroadm-common-network:opposite-link'])
+        self.assertEqual(len(topology.links), 34)
+        CHECK_DICT = {'ADD-LINK': 'DROP-LINK', 'DROP-LINK': 'ADD-LINK',
+                      'EXPRESS-LINK': 'EXPRESS-LINK', 'ROADM-TO-ROADM': 'ROADM-TO-ROADM',
+                      'XPONDER-INPUT': 'XPONDER-OUTPUT', 'XPONDER-OUTUT': 'XPONDER-INPUT'}
+        for link_id, link in topology.links.items():
             # Find the opposite link
-            response_oppLink = test_utils.get_ordm_topo_request("ietf-network-topology:link/"+oppLink_id)
-            self.assertEqual(response_oppLink.status_code, requests.codes.ok)
-            res_oppLink = response_oppLink.json()
-            self.assertEqual(res_oppLink['ietf-network-topology:link'][0]
-                             ['org-openroadm-common-network:opposite-link'], link_id)
-            self.assertEqual(res_oppLink['ietf-network-topology:link'][0]['source']['source-node'], link_dest)
-            self.assertEqual(res_oppLink['ietf-network-topology:link'][0]['destination']['dest-node'], link_src)
-            oppLink_type = res_oppLink['ietf-network-topology:link'][0]['org-openroadm-common-network:link-type']
-            CHECK_DICT = {'ADD-LINK': 'DROP-LINK', 'DROP-LINK': 'ADD-LINK',
-                          'EXPRESS-LINK': 'EXPRESS-LINK', 'ROADM-TO-ROADM': 'ROADM-TO-ROADM',
-                          'XPONDER-INPUT': 'XPONDER-OUTPUT', 'XPONDER-OUTUT': 'XPONDER-INPUT'}
+            opp_link = topology.links.get(link['org-openroadm-common-network:opposite-link'])
+            self.assertIsNotNone(opp_link)
+            self.assertEqual(opp_link['org-openroadm-common-network:opposite-link'], link_id)
+            self.assertEqual(opp_link['source']['source-node'], link['destination']['dest-node'])
+            self.assertEqual(opp_link['destination']['dest-node'], link['source']['source-node'])
+            link_type = link['org-openroadm-common-network:link-type']
             if link_type in CHECK_DICT:
-                self.assertEqual(oppLink_type, CHECK_DICT[link_type])
+                self.assertEqual(opp_link['org-openroadm-common-network:link-type'], CHECK_DICT[link_type])
 
     def test_29_getLinkOmsAttributesOpenRoadmTopology(self):
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        R2RLink = ['ROADMA01-DEG1-DEG1-TTP-TXRXtoROADMC01-DEG2-DEG2-TTP-TXRX',
-                   'ROADMC01-DEG2-DEG2-TTP-TXRXtoROADMA01-DEG1-DEG1-TTP-TXRX',
-                   'ROADMA01-DEG2-DEG2-TTP-TXRXtoROADMB01-DEG1-DEG1-TTP-TXRX',
-                   'ROADMC01-DEG1-DEG1-TTP-TXRXtoROADMB01-DEG2-DEG2-TTP-TXRX',
-                   'ROADMB01-DEG1-DEG1-TTP-TXRXtoROADMA01-DEG2-DEG2-TTP-TXRX',
-                   'ROADMB01-DEG2-DEG2-TTP-TXRXtoROADMC01-DEG1-DEG1-TTP-TXRX']
-        for i in range(0, nbLink):
-            link_id = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            if link_id in R2RLink:
-                find = False
-                spanLoss = res['network'][0]['ietf-network-topology:link'][i][
-                    'org-openroadm-network-topology:OMS-attributes']['span']["engineered-spanloss"]
-                length = res['network'][0]['ietf-network-topology:link'][i][
-                    'org-openroadm-network-topology:OMS-attributes']['span']['link-concatenation'][0]['SRLG-length']
-                if (spanLoss is not None) & (length is not None):
-                    find = True
-                self.assertTrue(find)
-                R2RLink.remove(link_id)
-        self.assertEqual(len(R2RLink), 0)
+        topology = TopologyView.from_response(response)
+        for link_id in ('ROADMA01-DEG1-DEG1-TTP-TXRXtoROADMC01-DEG2-DEG2-TTP-TXRX',
+                        'ROADMC01-DEG2-DEG2-TTP-TXRXtoROADMA01-DEG1-DEG1-TTP-TXRX',
+                        'ROADMA01-DEG2-DEG2-TTP-TXRXtoROADMB01-DEG1-DEG1-TTP-TXRX',
+                        'ROADMC01-DEG1-DEG1-TTP-TXRXtoROADMB01-DEG2-DEG2-TTP-TXRX',
+                        'ROADMB01-DEG1-DEG1-TTP-TXRXtoROADMA01-DEG2-DEG2-TTP-TXRX',
+                        'ROADMB01-DEG2-DEG2-TTP-TXRXtoROADMC01-DEG1-DEG1-TTP-TXRX'):
+            span = topology.links[link_id]['org-openroadm-network-topology:OMS-attributes']['span']
+            self.assertIsNotNone(span["engineered-spanloss"])
+            self.assertIsNotNone(span['link-concatenation'][0]['SRLG-length'])
 
     def test_30_disconnect_ROADMB(self):
         # Delete in the topology-netconf
@@ -685,55 +524,24 @@ class TransportPCETopologyTesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
 
     def test_32_getNodes_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
-        res = response.json()
         # Tests related to nodes
         self.assertEqual(response.status_code, requests.codes.ok)
-        nbNode = len(res['network'][0]['node'])
-        self.assertEqual(nbNode, 5)
-        listNode = ['XPDRA01-XPDR1', 'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2']
-        for i in range(0, nbNode):
-            nodeType = res['network'][0]['node'][i]['org-openroadm-common-network:node-type']
-            nodeId = res['network'][0]['node'][i]['node-id']
-            # Tests related to XPDRA nodes
-            if nodeId == 'XPDRA01-XPDR1':
-                nbTp = len(res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                for j in range(0, nbTp):
-                    tpid = res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j]['tp-id']
-                    if tpid == 'XPDR1-CLIENT1':
-                        self.assertEqual(res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j]
-                                         ['org-openroadm-common-network:tp-type'], 'XPONDER-CLIENT')
-                    if tpid == 'XPDR1-NETWORK1':
-                        self.assertEqual(res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j]
-                                         ['org-openroadm-common-network:tp-type'], 'XPONDER-NETWORK')
-                        self.assertEqual(res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j]
-                                         ['org-openroadm-network-topology:xpdr-network-attributes']
-                                         ['tail-equipment-id'],
-                                         'ROADMA01-SRG1--SRG1-PP1-TXRX')
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'XPDRA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                listNode.remove(nodeId)
-            # Tests related to ROADMA nodes
-            elif nodeId in self.CHECK_DICT1:
-                self.assertEqual(nodeType, self.CHECK_DICT1[nodeId]['node_type'])
-                if self.CHECK_DICT1[nodeId]['node_type'] == 'SRG':
-                    self.assertEqual(len(res['network'][0]['node'][i]['ietf-network-topology:termination-point']), 17)
-                for item in self.CHECK_DICT1[nodeId]['checks_tp']:
-                    self.assertIn(item, res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                listNode.remove(nodeId)
-            else:
-                self.assertFalse(True)
-        self.assertEqual(len(listNode), 0)
-        # Test related to SRG1 of ROADMC
-        for i in range(0, nbNode):
-            self.assertNotEqual(res['network'][0]['node'][i]['node-id'], 'ROADMC01-SRG1')
-            self.assertNotEqual(res['network'][0]['node'][i]['node-id'], 'ROADMC01-DEG1')
-            self.assertNotEqual(res['network'][0]['node'][i]['node-id'], 'ROADMC01-DEG2')
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.nodes), 5)
+        # ROADMC01 nodes are gone
+        self.assertEqual(set(topology.nodes),
+                         {'XPDRA01-XPDR1', 'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2'})
+        # Tests related to XPDRA nodes
+        self.assertEqual(topology.tp('XPDRA01-XPDR1', 'XPDR1-CLIENT1')['org-openroadm-common-network:tp-type'],
+                         'XPONDER-CLIENT')
+        network_tp = topology.tp('XPDRA01-XPDR1', 'XPDR1-NETWORK1')
+        self.assertEqual(network_tp['org-openroadm-common-network:tp-type'], 'XPONDER-NETWORK')
+        self.assertEqual(network_tp['org-openroadm-network-topology:xpdr-network-attributes']['tail-equipment-id'],
+                         'ROADMA01-SRG1--SRG1-PP1-TXRX')
+        self.assertTrue(topology.supported_by('XPDRA01-XPDR1', 'openroadm-network', 'XPDRA01'))
+        # Tests related to ROADMA nodes
+        self.check_roadm_nodes(topology, self.CHECK_DICT1, 'NodeA', 'ROADMA01')
 
     def test_33_getOpenRoadmNetwork(self):
         response = test_utils.get_ordm_net_request()
@@ -776,33 +584,13 @@ class TransportPCETopologyTesting(unittest.TestCase):
             self.assertNotEqual(res['network'][0]['node'][i]['node-id'], 'XPDRA01')
 
     def test_38_getNodes_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
-        res = response.json()
         # Tests related to nodes
         self.assertEqual(response.status_code, requests.codes.ok)
-        nbNode = len(res['network'][0]['node'])
-        self.assertEqual(nbNode, 4)
-        listNode = ['ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2']
-        for i in range(0, nbNode):
-            self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                          res['network'][0]['node'][i]['supporting-node'])
-            nodeType = res['network'][0]['node'][i]['org-openroadm-common-network:node-type']
-            nodeId = res['network'][0]['node'][i]['node-id']
-            if nodeId in self.CHECK_DICT1:
-                self.assertEqual(nodeType, self.CHECK_DICT1[nodeId]['node_type'])
-                if self.CHECK_DICT1[nodeId]['node_type'] == 'SRG':
-                    self.assertEqual(len(res['network'][0]['node'][i]['ietf-network-topology:termination-point']), 17)
-                for item in self.CHECK_DICT1[nodeId]['checks_tp']:
-                    self.assertIn(item, res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'ROADMA01'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                listNode.remove(nodeId)
-            else:
-                self.assertFalse(True)
-        self.assertEqual(len(listNode), 0)
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.nodes), 4)
+        self.assertEqual(set(topology.nodes), {'ROADMA01-SRG1', 'ROADMA01-SRG3', 'ROADMA01-DEG1', 'ROADMA01-DEG2'})
+        self.check_roadm_nodes(topology, self.CHECK_DICT1, 'NodeA', 'ROADMA01')
 
     def test_39_disconnect_ROADM_XPDRA_link(self):
         # Link-1
@@ -815,9 +603,8 @@ class TransportPCETopologyTesting(unittest.TestCase):
     def test_40_getLinks_OpenRoadmTopology(self):
         response = test_utils.get_ordm_topo_request("")
         self.assertEqual(response.status_code, requests.codes.ok)
-        res = response.json()
-        nbLink = len(res['network'][0]['ietf-network-topology:link'])
-        self.assertEqual(nbLink, 16)
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.links), 16)
         check_list = {'EXPRESS-LINK': ['ROADMA01-DEG2-DEG2-CTP-TXRXtoROADMA01-DEG1-DEG1-CTP-TXRX',
                                        'ROADMA01-DEG1-DEG1-CTP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX'],
                       'ADD-LINK': ['ROADMA01-SRG1-SRG1-CP-TXRXtoROADMA01-DEG2-DEG2-CTP-TXRX',
@@ -829,24 +616,10 @@ class TransportPCETopologyTesting(unittest.TestCase):
                                     'ROADMA01-DEG1-DEG1-CTP-TXRXtoROADMA01-SRG3-SRG3-CP-TXRX',
                                     'ROADMA01-DEG2-DEG2-CTP-TXRXtoROADMA01-SRG3-SRG3-CP-TXRX']
                       }
-        roadmtoroadmLink = 0
-        for i in range(0, nbLink):
-            linkId = res['network'][0]['ietf-network-topology:link'][i]['link-id']
-            linkType = res['network'][0]['ietf-network-topology:link'][i]['org-openroadm-common-network:link-type']
-            if linkType in check_list:
-                find = linkId in check_list[linkType]
-                self.assertEqual(find, True)
-                (check_list[linkType]).remove(linkId)
-            else:
-                roadmtoroadmLink += 1
-        for link_type in check_list:
-            self.assertEqual(len(check_list[link_type]), 0)
-        self.assertEqual(roadmtoroadmLink, 6)
-        for i in range(0, nbLink):
-            self.assertNotEqual(res['network'][0]['ietf-network-topology:link'][i]
-                                ['org-openroadm-common-network:link-type'], 'XPONDER-OUTPUT')
-            self.assertNotEqual(res['network'][0]['ietf-network-topology:link'][i]
-                                ['org-openroadm-common-network:link-type'], 'XPONDER-INPUT')
+        links_by_type = topology.links_by_type()
+        # the remaining links are the 6 ROADM-TO-ROADM ones, no XPONDER-INPUT/OUTPUT link is left
+        self.assertEqual(len(links_by_type.pop('ROADM-TO-ROADM', ())), 6)
+        self.assertEqual(links_by_type, {link_type: set(link_ids) for link_type, link_ids in check_list.items()})
 
     def test_41_disconnect_ROADMA(self):
         response = test_utils.unmount_device("ROADMA01")
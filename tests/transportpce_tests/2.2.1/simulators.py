@@ -10,6 +10,8 @@
 
 import os
 
+# An entry may add 'simulator': 'lightweight' to be served by common/netconf_simulator.py
+# instead of honeynode (TPCE_SIMULATOR sets the default for all entries).
 SIMS = {
     'xpdra': {'port': '17840', 'configfile': 'oper-XPDRA.xml', 'logfile': 'oper-XPDRA.log'},
     'roadma': {'port': '17841', 'configfile': 'oper-ROADMA.xml', 'logfile': 'oper-ROADMA.log'},
@@ -129,18 +129,22 @@ class TransportPCEFulltesting(unittest.TestCase):
     def test_01_connect_xpdrA(self):
         response = test_utils.mount_device("XPDR-A1", 'xpdra')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("XPDR-A1")))
 
     def test_02_connect_xpdrC(self):
         response = test_utils.mount_device("XPDR-C1", 'xpdrc')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("XPDR-C1")))
 
     def test_03_connect_rdmA(self):
         response = test_utils.mount_device("ROADM-A1", 'roadma')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("ROADM-A1")))
 
     def test_04_connect_rdmC(self):
         response = test_utils.mount_device("ROADM-C1", 'roadmc')
         self.assertEqual(response.status_code, requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("ROADM-C1")))
 
     def test_05_connect_xprdA_N1_to_roadmA_PP1(self):
         response = test_utils.connect_xpdr_to_rdm_request("XPDR-A1", "1", "1",
@@ -148,7 +152,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDR-A1-XPDR1-XPDR1-NETWORK1toROADM-A1-SRG1-SRG1-PP1-TXRX"),
+            timeout=10, replaces=2))
 
     def test_06_connect_roadmA_PP1_to_xpdrA_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDR-A1", "1", "1",
@@ -156,7 +162,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-A1-SRG1-SRG1-PP1-TXRXtoXPDR-A1-XPDR1-XPDR1-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_07_connect_xprdC_N1_to_roadmC_PP1(self):
         response = test_utils.connect_xpdr_to_rdm_request("XPDR-C1", "1", "1",
@@ -164,7 +172,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDR-C1-XPDR1-XPDR1-NETWORK1toROADM-C1-SRG1-SRG1-PP1-TXRX"),
+            timeout=10, replaces=2))
 
     def test_08_connect_roadmC_PP1_to_xpdrC_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDR-C1", "1", "1",
@@ -172,7 +182,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-C1-SRG1-SRG1-PP1-TXRXtoXPDR-C1-XPDR1-XPDR1-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_09_add_omsAttributes_ROADMA_ROADMC(self):
         # Config ROADMA-ROADMC oms-attributes
@@ -212,7 +224,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_12_get_eth_service1(self):
         response = test_utils.get_service_list_request("services/service1")
@@ -333,7 +347,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDR-A1-XPDR1-XPDR1-NETWORK2toROADM-A1-SRG1-SRG1-PP2-TXRX"),
+            timeout=10, replaces=2))
 
     def test_19_connect_roadmA_PP2_to_xpdrA_N2(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDR-A1", "1", "2",
@@ -341,7 +357,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-A1-SRG1-SRG1-PP2-TXRXtoXPDR-A1-XPDR1-XPDR1-NETWORK2"),
+            timeout=10, replaces=2))
 
     def test_20_connect_xprdC_N2_to_roadmC_PP2(self):
         response = test_utils.connect_xpdr_to_rdm_request("XPDR-C1", "1", "2",
@@ -349,7 +367,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("XPDR-C1-XPDR1-XPDR1-NETWORK2toROADM-C1-SRG1-SRG1-PP2-TXRX"),
+            timeout=10, replaces=2))
 
     def test_21_connect_roadmC_PP2_to_xpdrC_N2(self):
         response = test_utils.connect_rdm_to_xpdr_request("XPDR-C1", "1", "2",
@@ -357,7 +377,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully', res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-C1-SRG1-SRG1-PP2-TXRXtoXPDR-C1-XPDR1-XPDR1-NETWORK2"),
+            timeout=10, replaces=2))
 
     def test_22_create_eth_service2(self):
         self.cr_serv_sample_data["input"]["service-name"] = "service2"
@@ -366,7 +388,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_23_get_eth_service2(self):
         response = test_utils.get_service_list_request("services/service2")
@@ -418,7 +442,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                                  ele['org-openroadm-network-topology:xpdr-network-attributes']['wavelength'])
             if ele['tp-id'] == 'XPDR1-CLIENT1' or ele['tp-id'] == 'XPDR1-CLIENT2':
                 self.assertNotIn('org-openroadm-network-topology:xpdr-client-attributes', dict.keys(ele))
-        time.sleep(10)
 
     def test_26_check_topo_ROADMA_SRG1(self):
         response = test_utils.get_ordm_topo_request("node/ROADM-A1-SRG1")
@@ -445,7 +468,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 self.assertEqual(freq_map_array[94], 0, "Lambda 2 should not be available")
             if ele['tp-id'] == 'SRG1-PP3-TXRX':
                 self.assertNotIn('org-openroadm-network-topology:pp-attributes', dict.keys(ele))
-        time.sleep(10)
 
     def test_27_check_topo_ROADMA_DEG2(self):
         response = test_utils.get_ordm_topo_request("node/ROADM-A1-DEG2")
@@ -470,7 +492,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 freq_map_array = [int(x) for x in freq_map]
                 self.assertEqual(freq_map_array[95], 0, "Lambda 1 should not be available")
                 self.assertEqual(freq_map_array[94], 0, "Lambda 2 should not be available")
-        time.sleep(10)
 
 #     creation service test on a non-available resource
     def test_28_create_eth_service3(self):
@@ -499,7 +520,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service1"), timeout=20, replaces=20))
 
     def test_31_delete_eth_service2(self):
         response = test_utils.service_delete_request("service2")
@@ -507,7 +528,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service2"), timeout=20, replaces=20))
 
     def test_32_check_no_xc_ROADMA(self):
         response = test_utils.check_netconf_node_request("ROADM-A1", "")
@@ -529,7 +550,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                               dict.keys(ele[u'org-openroadm-network-topology:xpdr-network-attributes']))
                 self.assertNotIn('wavelength', dict.keys(
                     ele[u'org-openroadm-network-topology:xpdr-network-attributes']))
-        time.sleep(10)
 
     def test_34_check_topo_ROADMA_SRG1(self):
         response = test_utils.get_ordm_topo_request("node/ROADM-A1-SRG1")
@@ -556,7 +576,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 self.assertEqual(freq_map_array[94], 255, "Index 2 should  be available")
             else:
                 self.assertNotIn('org-openroadm-network-topology:pp-attributes', dict.keys(ele))
-        time.sleep(10)
 
     def test_35_check_topo_ROADMA_DEG2(self):
         response = test_utils.get_ordm_topo_request("node/ROADM-A1-DEG2")
@@ -581,7 +600,6 @@ class TransportPCEFulltesting(unittest.TestCase):
                 freq_map_array = [int(x) for x in freq_map]
                 self.assertEqual(freq_map_array[95], 255, "Lambda 1 should be available")
                 self.assertEqual(freq_map_array[94], 255, "Lambda 2 should be available")
-        time.sleep(10)
 
 # test service-create for Optical Channel (OC) service from srg-pp to srg-pp
     def test_36_create_oc_service1(self):
@@ -596,7 +614,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_37_get_oc_service1(self):
         response = test_utils.get_service_list_request("services/service1")
@@ -667,7 +687,9 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_41_get_oc_service2(self):
         response = test_utils.get_service_list_request("services/service2")
@@ -716,7 +738,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service1"), timeout=20, replaces=20))
 
     def test_45_delete_oc_service2(self):
         response = test_utils.service_delete_request("service2")
@@ -724,7 +746,7 @@ class TransportPCEFulltesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(20)
+        self.assertTrue(test_utils.wait_for(test_utils.service_deleted("service2"), timeout=20, replaces=20))
 
     def test_46_get_no_oc_services(self):
         print("start test")
@@ -84,11 +84,12 @@ class TransportOlmTesting(unittest.TestCase):
 
     def test_09_create_OTS_ROADMA(self):
         response = test_utils.create_ots_oms_request("ROADM-A1", "DEG1-TTP-TXRX")
-        time.sleep(10)
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertIn('Interfaces OTS-DEG1-TTP-TXRX - OMS-DEG1-TTP-TXRX successfully created on node ROADM-A1',
                       res["output"]["result"])
+        self.assertTrue(test_utils.wait_for(
+            test_utils.device_interface_present("ROADM-A1", "OMS-DEG1-TTP-TXRX"), timeout=10, replaces=10))
 
     def test_10_create_OTS_ROADMC(self):
         response = test_utils.create_ots_oms_request("ROADM-C1", "DEG2-TTP-TXRX")
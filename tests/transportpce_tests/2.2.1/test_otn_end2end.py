@@ -16,6 +16,7 @@ import base64
 import unittest
 import time
 import requests
+from common import async_utils
 from common import test_utils
 
 
@@ -139,28 +140,36 @@ class TransportPCEtesting(unittest.TestCase):
             test_utils.shutdown_process(process)
         print("all processes killed")
 
-    def setUp(self):
-        time.sleep(5)
+    def check_device_reads(self, *checks):
+        # the device reads are independent of each other: fetch them concurrently
+        # and run each check on its own response
+        responses = async_utils.fan_out_check_netconf_node_requests([(node, suffix) for node, suffix, _ in checks])
+        for (_, _, check), response in zip(checks, responses):
+            check(response)
 
     def test_01_connect_spdrA(self):
         response = test_utils.mount_device("SPDR-SA1", 'spdra')
         self.assertEqual(response.status_code,
                          requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("SPDR-SA1")))
 
     def test_02_connect_spdrC(self):
         response = test_utils.mount_device("SPDR-SC1", 'spdrc')
         self.assertEqual(response.status_code,
                          requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("SPDR-SC1")))
 
     def test_03_connect_rdmA(self):
         response = test_utils.mount_device("ROADM-A1", 'roadma')
         self.assertEqual(response.status_code,
                          requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("ROADM-A1")))
 
     def test_04_connect_rdmC(self):
         response = test_utils.mount_device("ROADM-C1", 'roadmc')
         self.assertEqual(response.status_code,
                          requests.codes.created, test_utils.CODE_SHOULD_BE_201)
+        self.assertTrue(test_utils.wait_for(test_utils.netconf_node_connected("ROADM-C1")))
 
     def test_05_connect_sprdA_1_N1_to_roadmA_PP1(self):
         response = test_utils.connect_xpdr_to_rdm_request("SPDR-SA1", "1", "1",
@@ -169,7 +178,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("SPDR-SA1-XPDR1-XPDR1-NETWORK1toROADM-A1-SRG1-SRG1-PP1-TXRX"),
+            timeout=10, replaces=2))
 
     def test_06_connect_roadmA_PP1_to_spdrA_1_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("SPDR-SA1", "1", "1",
@@ -178,7 +189,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-A1-SRG1-SRG1-PP1-TXRXtoSPDR-SA1-XPDR1-XPDR1-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_07_connect_sprdC_1_N1_to_roadmC_PP1(self):
         response = test_utils.connect_xpdr_to_rdm_request("SPDR-SC1", "1", "1",
@@ -187,7 +200,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("SPDR-SC1-XPDR1-XPDR1-NETWORK1toROADM-C1-SRG1-SRG1-PP1-TXRX"),
+            timeout=10, replaces=2))
 
     def test_08_connect_roadmC_PP1_to_spdrC_1_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("SPDR-SC1", "1", "1",
@@ -196,7 +211,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-C1-SRG1-SRG1-PP1-TXRXtoSPDR-SC1-XPDR1-XPDR1-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_09_add_omsAttributes_ROADMA_ROADMC(self):
         # Config ROADMA-ROADMC oms-attributes
@@ -245,7 +262,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_13_get_OCH_OTU4_service1(self):
         response = test_utils.get_service_list_request(
@@ -263,9 +282,15 @@ class TransportPCEtesting(unittest.TestCase):
         time.sleep(2)
 
     # Check correct configuration of devices
-    def test_14_check_interface_och_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-NETWORK1-761:768")
+    def test_14_check_OCH_OTU4_devices(self):
+        self.check_device_reads(
+            ("SPDR-SA1", "interface/XPDR1-NETWORK1-761:768", self.check_interface_och_spdra),
+            ("SPDR-SA1", "interface/XPDR1-NETWORK1-OTU", self.check_interface_OTU4_spdra),
+            ("SPDR-SC1", "interface/XPDR1-NETWORK1-761:768", self.check_interface_och_spdrc),
+            ("SPDR-SC1", "interface/XPDR1-NETWORK1-OTU", self.check_interface_OTU4_spdrc),
+            ("SPDR-SA1", "interface/XPDR1-NETWORK1-ODU4", self.check_no_interface_ODU4_spdra))
+
+    def check_interface_och_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertDictEqual(dict({'name': 'XPDR1-NETWORK1-761:768',
@@ -281,9 +306,7 @@ class TransportPCEtesting(unittest.TestCase):
              u'transmit-power': -5, u'modulation-format': 'dp-qpsk'},
             res['interface'][0]['org-openroadm-optical-channel-interfaces:och'])
 
-    def test_15_check_interface_OTU4_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-NETWORK1-OTU")
+    def check_interface_OTU4_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-NETWORK1-OTU',
@@ -305,9 +328,7 @@ class TransportPCEtesting(unittest.TestCase):
                              res['interface'][0]
                              ['org-openroadm-otn-otu-interfaces:otu'])
 
-    def test_16_check_interface_och_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR1-NETWORK1-761:768")
+    def check_interface_och_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         self.assertDictEqual(dict({'name': 'XPDR1-NETWORK1-761:768',
@@ -323,9 +344,7 @@ class TransportPCEtesting(unittest.TestCase):
              u'transmit-power': -5, u'modulation-format': 'dp-qpsk'},
             res['interface'][0]['org-openroadm-optical-channel-interfaces:och'])
 
-    def test_17_check_interface_OTU4_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR1-NETWORK1-OTU")
+    def check_interface_OTU4_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-NETWORK1-OTU',
@@ -350,9 +369,7 @@ class TransportPCEtesting(unittest.TestCase):
                              res['interface'][0]
                              ['org-openroadm-otn-otu-interfaces:otu'])
 
-    def test_18_check_no_interface_ODU4_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-NETWORK1-ODU4")
+    def check_no_interface_ODU4_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.conflict)
         res = response.json()
         self.assertIn(
@@ -448,7 +465,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_24_get_ODU4_service1(self):
         response = test_utils.get_service_list_request(
@@ -465,9 +484,12 @@ class TransportPCEtesting(unittest.TestCase):
             res['services'][0]['lifecycle-state'], 'planned')
         time.sleep(2)
 
-    def test_25_check_interface_ODU4_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-NETWORK1-ODU4")
+    def test_25_check_ODU4_devices(self):
+        self.check_device_reads(
+            ("SPDR-SA1", "interface/XPDR1-NETWORK1-ODU4", self.check_interface_ODU4_spdra),
+            ("SPDR-SC1", "interface/XPDR1-NETWORK1-ODU4", self.check_interface_ODU4_spdrc))
+
+    def check_interface_ODU4_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-NETWORK1-ODU4',
@@ -494,9 +516,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'payload-type': u'21', u'exp-payload-type': u'21'},
             res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['opu'])
 
-    def test_26_check_interface_ODU4_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR1-NETWORK1-ODU4")
+    def check_interface_ODU4_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-NETWORK1-ODU4',
@@ -587,7 +607,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_30_get_10GE_service1(self):
         response = test_utils.get_service_list_request(
@@ -604,9 +626,20 @@ class TransportPCEtesting(unittest.TestCase):
             res['services'][0]['lifecycle-state'], 'planned')
         time.sleep(2)
 
-    def test_31_check_interface_10GE_CLIENT_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-CLIENT1-ETHERNET10G")
+    def test_31_check_ODU2E_devices(self):
+        self.check_device_reads(
+            ("SPDR-SA1", "interface/XPDR1-CLIENT1-ETHERNET10G", self.check_interface_10GE_CLIENT_spdra),
+            ("SPDR-SA1", "interface/XPDR1-CLIENT1-ODU2e-service1-10GE", self.check_interface_ODU2E_CLIENT_spdra),
+            ("SPDR-SA1", "interface/XPDR1-NETWORK1-ODU2e-service1-10GE", self.check_interface_ODU2E_NETWORK_spdra),
+            ("SPDR-SA1", "odu-connection/XPDR1-CLIENT1-ODU2e-service1-10GE-x-XPDR1-NETWORK1-ODU2e-service1-10GE",
+             self.check_ODU2E_connection_spdra),
+            ("SPDR-SC1", "interface/XPDR1-CLIENT1-ETHERNET10G", self.check_interface_10GE_CLIENT_spdrc),
+            ("SPDR-SC1", "interface/XPDR1-CLIENT1-ODU2e-service1-10GE", self.check_interface_ODU2E_CLIENT_spdrc),
+            ("SPDR-SC1", "interface/XPDR1-NETWORK1-ODU2e-service1-10GE", self.check_interface_ODU2E_NETWORK_spdrc),
+            ("SPDR-SC1", "odu-connection/XPDR1-CLIENT1-ODU2e-service1-10GE-x-XPDR1-NETWORK1-ODU2e-service1-10GE",
+             self.check_ODU2E_connection_spdrc))
+
+    def check_interface_10GE_CLIENT_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict = {'name': 'XPDR1-CLIENT1-ETHERNET10G',
@@ -621,9 +654,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'speed': 10000},
             res['interface'][0]['org-openroadm-ethernet-interfaces:ethernet'])
 
-    def test_32_check_interface_ODU2E_CLIENT_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-CLIENT1-ODU2e-service1-10GE")
+    def check_interface_ODU2E_CLIENT_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-CLIENT1-ODU2e-service1-10GE',
@@ -646,9 +677,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'payload-type': u'03', u'exp-payload-type': u'03'},
             res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['opu'])
 
-    def test_33_check_interface_ODU2E_NETWORK_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR1-NETWORK1-ODU2e-service1-10GE")
+    def check_interface_ODU2E_NETWORK_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-NETWORK1-ODU2e-service1-10GE',
@@ -675,10 +704,7 @@ class TransportPCEtesting(unittest.TestCase):
         self.assertIn(1, res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['parent-odu-allocation']
                       ['trib-slots'])
 
-    def test_34_check_ODU2E_connection_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1",
-            "odu-connection/XPDR1-CLIENT1-ODU2e-service1-10GE-x-XPDR1-NETWORK1-ODU2e-service1-10GE")
+    def check_ODU2E_connection_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {
@@ -694,9 +720,7 @@ class TransportPCEtesting(unittest.TestCase):
         self.assertDictEqual({u'src-if': u'XPDR1-CLIENT1-ODU2e-service1-10GE'},
                              res['odu-connection'][0]['source'])
 
-    def test_35_check_interface_10GE_CLIENT_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR1-CLIENT1-ETHERNET10G")
+    def check_interface_10GE_CLIENT_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict = {'name': 'XPDR1-CLIENT1-ETHERNET10G',
@@ -711,9 +735,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'speed': 10000},
             res['interface'][0]['org-openroadm-ethernet-interfaces:ethernet'])
 
-    def test_36_check_interface_ODU2E_CLIENT_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR1-CLIENT1-ODU2e-service1-10GE")
+    def check_interface_ODU2E_CLIENT_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-CLIENT1-ODU2e-service1-10GE',
@@ -736,9 +758,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'payload-type': u'03', u'exp-payload-type': u'03'},
             res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['opu'])
 
-    def test_37_check_interface_ODU2E_NETWORK_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR1-NETWORK1-ODU2e-service1-10GE")
+    def check_interface_ODU2E_NETWORK_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR1-NETWORK1-ODU2e-service1-10GE',
@@ -769,10 +789,7 @@ class TransportPCEtesting(unittest.TestCase):
                           'org-openroadm-otn-odu-interfaces:odu'][
                           'parent-odu-allocation']['trib-slots'])
 
-    def test_38_check_ODU2E_connection_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1",
-            "odu-connection/XPDR1-CLIENT1-ODU2e-service1-10GE-x-XPDR1-NETWORK1-ODU2e-service1-10GE")
+    def check_ODU2E_connection_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {
@@ -827,7 +844,8 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_deleted("service1-10GE"), timeout=self.WAITING, replaces=self.WAITING))
 
     def test_42_check_service_list(self):
         response = test_utils.get_service_list_request("")
@@ -892,7 +910,8 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_deleted("service1-ODU4"), timeout=self.WAITING, replaces=self.WAITING))
 
     def test_50_check_service_list(self):
         response = test_utils.get_service_list_request("")
@@ -928,7 +947,8 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_deleted("service1-OCH-OTU4"), timeout=self.WAITING, replaces=self.WAITING))
 
     def test_55_get_no_service(self):
         response = test_utils.get_service_list_request("")
@@ -1012,7 +1032,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("SPDR-SA1-XPDR3-XPDR3-NETWORK1toROADM-A1-SRG1-SRG1-PP2-TXRX"),
+            timeout=10, replaces=2))
 
     def test_63_connect_roadmA_PP2_to_spdrA_3_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("SPDR-SA1", "3", "1",
@@ -1021,7 +1043,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-A1-SRG1-SRG1-PP2-TXRXtoSPDR-SA1-XPDR3-XPDR3-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_64_connect_sprdC_3_N1_to_roadmC_PP2(self):
         response = test_utils.connect_xpdr_to_rdm_request("SPDR-SC1", "3", "1",
@@ -1030,7 +1054,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Xponder Roadm Link created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("SPDR-SC1-XPDR3-XPDR3-NETWORK1toROADM-C1-SRG1-SRG1-PP2-TXRX"),
+            timeout=10, replaces=2))
 
     def test_65_connect_roadmC_PP2_to_spdrC_3_N1(self):
         response = test_utils.connect_rdm_to_xpdr_request("SPDR-SC1", "3", "1",
@@ -1039,7 +1065,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Roadm Xponder links created successfully',
                       res["output"]["result"])
-        time.sleep(2)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.topology_link_present("ROADM-C1-SRG1-SRG1-PP2-TXRXtoSPDR-SC1-XPDR3-XPDR3-NETWORK1"),
+            timeout=10, replaces=2))
 
     def test_66_create_OCH_OTU4_service_2(self):
         self.cr_serv_sample_data["input"]["service-name"] = "service2-OCH-OTU4"
@@ -1063,7 +1091,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_67_get_OCH_OTU4_service2(self):
         response = test_utils.get_service_list_request(
@@ -1102,7 +1132,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_69_get_ODU4_service2(self):
         response = test_utils.get_service_list_request(
@@ -1141,7 +1173,9 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('PCE calculation in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_in_service(self.cr_serv_sample_data["input"]["service-name"]),
+            timeout=self.WAITING, replaces=self.WAITING))
 
     def test_71_get_1GE_service1(self):
         response = test_utils.get_service_list_request("services/service1-1GE")
@@ -1157,9 +1191,20 @@ class TransportPCEtesting(unittest.TestCase):
             res['services'][0]['lifecycle-state'], 'planned')
         time.sleep(2)
 
-    def test_72_check_interface_1GE_CLIENT_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR3-CLIENT1-ETHERNET1G")
+    def test_72_check_ODU0_devices(self):
+        self.check_device_reads(
+            ("SPDR-SA1", "interface/XPDR3-CLIENT1-ETHERNET1G", self.check_interface_1GE_CLIENT_spdra),
+            ("SPDR-SA1", "interface/XPDR3-CLIENT1-ODU0-service1-1GE", self.check_interface_ODU0_CLIENT_spdra),
+            ("SPDR-SA1", "interface/XPDR3-NETWORK1-ODU0-service1-1GE", self.check_interface_ODU0_NETWORK_spdra),
+            ("SPDR-SA1", "odu-connection/XPDR3-CLIENT1-ODU0-service1-1GE-x-XPDR3-NETWORK1-ODU0-service1-1GE",
+             self.check_ODU0_connection_spdra),
+            ("SPDR-SC1", "interface/XPDR3-CLIENT1-ETHERNET1G", self.check_interface_1GE_CLIENT_spdrc),
+            ("SPDR-SC1", "interface/XPDR3-CLIENT1-ODU0-service1-1GE", self.check_interface_ODU0_CLIENT_spdrc),
+            ("SPDR-SC1", "interface/XPDR3-NETWORK1-ODU0-service1-1GE", self.check_interface_ODU0_NETWORK_spdrc),
+            ("SPDR-SC1", "odu-connection/XPDR3-CLIENT1-ODU0-service1-1GE-x-XPDR3-NETWORK1-ODU0-service1-1GE",
+             self.check_ODU0_connection_spdrc))
+
+    def check_interface_1GE_CLIENT_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict = {'name': 'XPDR3-CLIENT1-ETHERNET1G',
@@ -1174,9 +1219,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'speed': 1000},
             res['interface'][0]['org-openroadm-ethernet-interfaces:ethernet'])
 
-    def test_73_check_interface_ODU0_CLIENT_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR3-CLIENT1-ODU0-service1-1GE")
+    def check_interface_ODU0_CLIENT_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR3-CLIENT1-ODU0-service1-1GE',
@@ -1199,9 +1242,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'payload-type': u'07', u'exp-payload-type': u'07'},
             res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['opu'])
 
-    def test_74_check_interface_ODU0_NETWORK_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1", "interface/XPDR3-NETWORK1-ODU0-service1-1GE")
+    def check_interface_ODU0_NETWORK_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR3-NETWORK1-ODU0-service1-1GE',
@@ -1228,10 +1269,7 @@ class TransportPCEtesting(unittest.TestCase):
         self.assertIn(1, res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['parent-odu-allocation']
                       ['trib-slots'])
 
-    def test_75_check_ODU0_connection_spdra(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SA1",
-            "odu-connection/XPDR3-CLIENT1-ODU0-service1-1GE-x-XPDR3-NETWORK1-ODU0-service1-1GE")
+    def check_ODU0_connection_spdra(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {
@@ -1247,9 +1285,7 @@ class TransportPCEtesting(unittest.TestCase):
         self.assertDictEqual({u'src-if': u'XPDR3-CLIENT1-ODU0-service1-1GE'},
                              res['odu-connection'][0]['source'])
 
-    def test_76_check_interface_1GE_CLIENT_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR3-CLIENT1-ETHERNET1G")
+    def check_interface_1GE_CLIENT_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict = {'name': 'XPDR3-CLIENT1-ETHERNET1G',
@@ -1264,9 +1300,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'speed': 1000},
             res['interface'][0]['org-openroadm-ethernet-interfaces:ethernet'])
 
-    def test_77_check_interface_ODU0_CLIENT_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR3-CLIENT1-ODU0-service1-1GE")
+    def check_interface_ODU0_CLIENT_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR3-CLIENT1-ODU0-service1-1GE',
@@ -1289,9 +1323,7 @@ class TransportPCEtesting(unittest.TestCase):
             {u'payload-type': u'07', u'exp-payload-type': u'07'},
             res['interface'][0]['org-openroadm-otn-odu-interfaces:odu']['opu'])
 
-    def test_78_check_interface_ODU0_NETWORK_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1", "interface/XPDR3-NETWORK1-ODU0-service1-1GE")
+    def check_interface_ODU0_NETWORK_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {'name': 'XPDR3-NETWORK1-ODU0-service1-1GE',
@@ -1322,10 +1354,7 @@ class TransportPCEtesting(unittest.TestCase):
                           'org-openroadm-otn-odu-interfaces:odu'][
                           'parent-odu-allocation']['trib-slots'])
 
-    def test_79_check_ODU0_connection_spdrc(self):
-        response = test_utils.check_netconf_node_request(
-            "SPDR-SC1",
-            "odu-connection/XPDR3-CLIENT1-ODU0-service1-1GE-x-XPDR3-NETWORK1-ODU0-service1-1GE")
+    def check_ODU0_connection_spdrc(self, response):
         self.assertEqual(response.status_code, requests.codes.ok)
         res = response.json()
         input_dict_1 = {
@@ -1380,7 +1409,8 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_deleted("service1-1GE"), timeout=self.WAITING, replaces=self.WAITING))
 
     def test_83_check_service_list(self):
         response = test_utils.get_service_list_request("")
@@ -1445,7 +1475,8 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_deleted("service2-ODU4"), timeout=self.WAITING, replaces=self.WAITING))
 
     def test_91_delete_OCH_OTU4_service(self):
         response = test_utils.service_delete_request("service2-OCH-OTU4")
@@ -1453,7 +1484,8 @@ class TransportPCEtesting(unittest.TestCase):
         res = response.json()
         self.assertIn('Renderer service delete in progress',
                       res['output']['configuration-response-common']['response-message'])
-        time.sleep(self.WAITING)
+        self.assertTrue(test_utils.wait_for(
+            test_utils.service_deleted("service2-OCH-OTU4"), timeout=self.WAITING, replaces=self.WAITING))
 
     def test_92_disconnect_xponders_from_roadm(self):
         url = "{}/config/ietf-network:networks/network/openroadm-topology/ietf-network-topology:link/"
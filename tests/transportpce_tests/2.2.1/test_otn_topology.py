@@ -17,6 +17,7 @@ import time
 import logging
 import requests
 from common import test_utils
+from common.topology_view import TopologyView
 
 
 class TransportPCEtesting(unittest.TestCase):
@@ -78,45 +79,19 @@ class TransportPCEtesting(unittest.TestCase):
         self.assertNotIn('ietf-network-topology:link', res['network'][0])
 
     def test_05_getNodes_OpenRoadmTopology(self):
-        # pylint: disable=redundant-unittest-assert
         response = test_utils.get_ordm_topo_request("")
-        res = response.json()
         # Tests related to nodes
         self.assertEqual(response.status_code, requests.codes.ok)
-        self.assertIn('node', res['network'][0])
-        if 'node' in res['network'][0]:
-            nbNode = len(res['network'][0]['node'])
-            self.assertEqual(nbNode, 3)
-            listNode = ['SPDR-SA1-XPDR1', 'SPDR-SA1-XPDR2', 'SPDR-SA1-XPDR3']
-            for i in range(0, nbNode):
-                nodeType = res['network'][0]['node'][i]['org-openroadm-common-network:node-type']
-                nodeId = res['network'][0]['node'][i]['node-id']
-                if nodeId not in listNode:
-                    self.assertFalse(True)
-                    continue
-                self.assertIn({'network-ref': 'openroadm-network', 'node-ref': 'SPDR-SA1'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertIn({'network-ref': 'clli-network', 'node-ref': 'NodeSA'},
-                              res['network'][0]['node'][i]['supporting-node'])
-                self.assertEqual(nodeType, 'XPONDER')
-                nbTps = len(res['network'][0]['node'][i]['ietf-network-topology:termination-point'])
-                client = 0
-                network = 0
-                for j in range(0, nbTps):
-                    tpType = (res['network'][0]['node'][i]['ietf-network-topology:termination-point'][j]
-                                 ['org-openroadm-common-network:tp-type'])
-                    if tpType == 'XPONDER-CLIENT':
-                        client += 1
-                    elif tpType == 'XPONDER-NETWORK':
-                        network += 1
-                self.assertTrue(client == 0)
-                if nodeId == 'SPDR-SA1-XPDR1' or nodeId == 'SPDR-SA1-XPDR3':
-                    self.assertTrue(network == 1)
-                else:
-                    # elif nodeId == 'SPDR-SA1-XPDR2':
-                    self.assertTrue(network == 4)
-                listNode.remove(nodeId)
-            self.assertEqual(len(listNode), 0)
+        self.assertIn('node', response.json()['network'][0])
+        topology = TopologyView.from_response(response)
+        self.assertEqual(len(topology.nodes), 3)
+        self.assertEqual(set(topology.nodes), {'SPDR-SA1-XPDR1', 'SPDR-SA1-XPDR2', 'SPDR-SA1-XPDR3'})
+        for node_id, network_nb in (('SPDR-SA1-XPDR1', 1), ('SPDR-SA1-XPDR2', 4), ('SPDR-SA1-XPDR3', 1)):
+            self.assertTrue(topology.supported_by(node_id, 'openroadm-network', 'SPDR-SA1'))
+            self.assertTrue(topology.supported_by(node_id, 'clli-network', 'NodeSA'))
+            self.assertEqual(topology.node_types[node_id], 'XPONDER')
+            self.assertEqual(topology.tp_count(node_id, 'XPONDER-CLIENT'), 0)
+            self.assertEqual(topology.tp_count(node_id, 'XPONDER-NETWORK'), network_nb)
 
     def test_06_getLinks_OtnTopology(self):
         response = test_utils.get_otn_topo_request()
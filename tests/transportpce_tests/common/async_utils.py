@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Asyncio flavour of the test_utils RESTCONF API.
+# Requests are run on a bounded thread pool sharing the test_utils keep-alive
+# session, so that independent reads can be issued concurrently from a test.
+
+import asyncio
+import concurrent.futures
+import functools
+import json
+
+from common import test_utils
+
+_EXECUTOR = None
+
+
+def get_executor():
+    # pylint: disable=global-statement
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=test_utils.HTTP_POOL_SIZE, thread_name_prefix="restconf")
+    return _EXECUTOR
+
+
+def shutdown_executor():
+    # pylint: disable=global-statement
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=True)
+        _EXECUTOR = None
+
+
+async def restconf_request(method: str, url: str, data=None, headers=None):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(),
+        functools.partial(test_utils.restconf_request, method, url, data=data, headers=headers))
+
+
+async def get_request(url):
+    return await restconf_request("GET", url)
+
+
+async def post_request(url, data):
+    if data:
+        return await restconf_request("POST", url, data=json.dumps(data))
+    return await restconf_request("POST", url)
+
+
+async def put_request(url, data):
+    return await restconf_request("PUT", url, data=json.dumps(data))
+
+
+async def delete_request(url):
+    return await restconf_request("DELETE", url)
+
+
+async def check_netconf_node_request(node: str, suffix: str):
+    url = test_utils.URL_CONFIG_NETCONF_TOPO + (
+        "node/" + node + "/yang-ext:mount/org-openroadm-device:org-openroadm-device/" + suffix
+    )
+    return await get_request(url)
+
+
+async def portmapping_request(suffix: str):
+    return await get_request(test_utils.URL_PORTMAPPING + suffix)
+
+
+async def gather_requests(*coroutines, limit=None):
+    # Results are returned in the order of the given coroutines.
+    # 'limit' bounds how many of them are in flight at the same time.
+    if limit is None:
+        return list(await asyncio.gather(*coroutines))
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return list(await asyncio.gather(*(bounded(coroutine) for coroutine in coroutines)))
+
+
+async def gather_get_requests(urls, limit=None):
+    return await gather_requests(*(get_request(url) for url in urls), limit=limit)
+
+
+async def gather_check_netconf_node_requests(node_suffixes, limit=None):
+    return await gather_requests(
+        *(check_netconf_node_request(node, suffix) for node, suffix in node_suffixes), limit=limit)
+
+
+async def gather_portmapping_requests(suffixes, limit=None):
+    return await gather_requests(*(portmapping_request(suffix) for suffix in suffixes), limit=limit)
+
+
+# Synchronous entry points for unittest methods, e.g.
+#   resp_a, resp_c = async_utils.fan_out_check_netconf_node_requests(
+#       [("SPDR-SA1", "interface/XPDR1-NETWORK1-1"), ("SPDR-SC1", "interface/XPDR1-NETWORK1-1")])
+
+def fan_out_get_requests(urls, limit=None):
+    return asyncio.run(gather_get_requests(urls, limit=limit))
+
+
+def fan_out_check_netconf_node_requests(node_suffixes, limit=None):
+    return asyncio.run(gather_check_netconf_node_requests(node_suffixes, limit=limit))
+
+
+def fan_out_portmapping_requests(suffixes, limit=None):
+    return asyncio.run(gather_portmapping_requests(suffixes, limit=limit))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Long-lived harness keeping a warm controller and a pool of simulators.
+# From a transportpce_tests/<version> directory:
+#   python -m common.harness_daemon start xpdra roadma roadmb roadmc xpdrc &
+#   TPCE_USE_HARNESS=True nosetests --with-xunit test_portmapping.py
+#   python -m common.harness_daemon stop
+# Test modules then attach to it in test_utils.start_tpce()/start_sims()
+# instead of spawning their own processes, and the controller state is reset
+# (services deleted, devices unmounted, datastores cleared) at each attach.
+
+import argparse
+import json
+import os
+import signal
+import sys
+
+# the daemon owns the processes and must never attach to itself
+os.environ.pop('TPCE_USE_HARNESS', None)
+
+from common import test_utils  # pylint: disable=wrong-import-position
+from common.notification_receiver import NotificationReceiver  # pylint: disable=wrong-import-position
+
+
+def start(sims):
+    if os.path.isfile(test_utils.HARNESS_STATE_FILE):
+        print("a harness state file already exists: " + test_utils.HARNESS_STATE_FILE)
+        sys.exit(1)
+    stopping = []
+
+    def stop_handler(signum, frame):
+        # pylint: disable=unused-argument
+        stopping.append(signum)
+
+    signal.signal(signal.SIGTERM, stop_handler)
+    signal.signal(signal.SIGINT, stop_handler)
+    test_utils.start_tpce()
+    # the controller and the simulators processes, in test_utils.process_list
+    processes = test_utils.start_sims(sims)
+    # stand-in for the notification-url of the service RPCs, see common/notification_receiver.py
+    receiver = NotificationReceiver().start()
+    state = {'pid': os.getpid(),
+             'restconf': test_utils.RESTCONF_BASE_URL,
+             'samples': os.path.realpath(test_utils.SAMPLES_DIRECTORY),
+             'sims': sims,
+             'registry': {sim: test_utils.SIMS_REGISTRY[sim] for sim in sims},
+             'notifications': receiver.url}
+    with open(test_utils.HARNESS_STATE_FILE, 'w') as state_file:
+        json.dump(state, state_file)
+    print("harness ready, serving simulators " + ", ".join(sims))
+    try:
+        while not stopping:
+            signal.pause()
+    finally:
+        os.remove(test_utils.HARNESS_STATE_FILE)
+        receiver.stop()
+        for process in processes:
+            test_utils.shutdown_process(process)
+        print("harness stopped")
+
+
+def stop():
+    if not os.path.isfile(test_utils.HARNESS_STATE_FILE):
+        print("no harness running")
+        return
+    with open(test_utils.HARNESS_STATE_FILE, 'r') as state_file:
+        os.kill(json.load(state_file)['pid'], signal.SIGTERM)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="warm controller and simulators harness")
+    subparsers = parser.add_subparsers(dest='command')
+    start_parser = subparsers.add_parser('start', help="start the controller and the simulators pool")
+    start_parser.add_argument('sims', nargs='+', choices=sorted(test_utils.SIMS),
+                              help="simulators of simulators.SIMS to keep running")
+    subparsers.add_parser('stop', help="stop a running harness")
+    args = parser.parse_args()
+    if args.command == 'start':
+        start(args.sims)
+    elif args.command == 'stop':
+        stop()
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
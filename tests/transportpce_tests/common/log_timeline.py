@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Post-run provisioning timeline of the services found in karaf.log or odl.log.
+# Service handler, PCE, renderer, OLM and network model log lines are turned
+# into events, correlated by service name (request-ids are reported when the
+# logged inputs carry them), and each service-create/service-delete cycle is
+# split into phases:
+#   create  pce (request -> path computed), renderer (-> OLM power setup start),
+#           olm (-> renderer success), activation (-> service implemented)
+#   delete  renderer (request -> renderer success), cleanup (-> service deleted)
+# The median phase durations can be saved as a baseline and later runs are
+# flagged when a phase regresses beyond the tolerance:
+#   python3 transportpce_tests/common/log_timeline.py karaf.log --save-baseline timeline_baseline.json
+#   python3 transportpce_tests/common/log_timeline.py odl.log --baseline timeline_baseline.json
+
+import argparse
+import collections
+import datetime
+import json
+import re
+import statistics
+import sys
+
+# karaf: "2020-10-01T10:00:00,123 | INFO  | thread | Class | bundle | message"
+# lighty: "2020-10-01 10:00:00,123  INFO [thread] (Class.java:12) - message"
+LINE_PATTERN = re.compile(
+    r"^(?P<time>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2},\d{3})\s*(?:\|\s*)?(?P<level>[A-Z]+)\s*"
+    r"(?:\|[^|]*\|\s*(?P<karaf_class>[^|\s]+)\s*\|[^|]*\|\s*|\[[^\]]*\]\s*\((?P<lighty_class>[^:.)]+)[^)]*\)\s*-\s*)"
+    r"(?P<message>.*)$")
+
+# (event, component, message regexp), the first matching rule wins
+EVENT_RULES = (
+    ('create-received', 'servicehandler', r"RPC serviceCreate received"),
+    ('delete-received', 'servicehandler', r"RPC serviceDelete request received for (?P<service>\S+)"),
+    ('pce-request', 'pce', r"^pathComputationRequest$"),
+    ('pce-response', 'pce', r"^PCE response: "),
+    ('pce', 'pce', r"PCE '[^']*' Notification received : ServicePathRpcResult"),
+    ('render-request', 'renderer', r"Calling service impl request (?P<service>\S+)"),
+    ('render-delete-request', 'renderer', r"Calling service delete request (?P<service>\S+)"),
+    ('olm-power-setup', 'olm', r"Sending notification RendererRpcResultSp\{.*_statusMessage=Olm power setup A-Z"),
+    ('render', 'renderer', r"Sending notification RendererRpcResultSp\{"),
+    ('implemented', 'servicehandler', r"Service implemented !"),
+    ('deleted', 'servicehandler', r"Service '(?P<service>[^']+)' deleted !"),
+    ('service-state-update', 'networkmodel', r"Service=(?P<service>\S+) needs to be updated to (?P<state>\w+)"),
+    ('topology-update', 'networkmodel', r"Topology update notification"))
+RULES = tuple((event, component, re.compile(regexp)) for event, component, regexp in EVENT_RULES)
+# cheap test of every log line before the full parsing
+PREFILTER = re.compile("|".join(re.sub(r"\?P<\w+>", "", regexp.strip('^$')) for _, _, regexp in EVENT_RULES))
+FIELD_PATTERNS = {field: re.compile(r"_" + field + r"=([^,}\]]+)")
+                  for field in ('serviceName', 'requestId', 'status', 'notificationType')}
+
+# Start events without a service name open the cycle of the next named event,
+# the other unnamed events belong to the only open cycle, if any.
+UNNAMED_STARTS = ('create-received', 'pce-request')
+CYCLE_STARTS = {'create-received': 'create', 'delete-received': 'delete', 'pce-request': 'path-computation'}
+CYCLE_ENDS = {'create': ('implemented', 'pce-failed', 'render-implementation-failed'),
+              'delete': ('deleted', 'render-delete-failed'),
+              'path-computation': ('pce-successful', 'pce-failed')}
+# (phase, start events, end event) of each cycle kind, the first start event found is used
+PHASES = {
+    'create': (('pce', ('create-received', 'pce-request'), 'pce-successful'),
+               ('renderer', ('render-request',), 'olm-power-setup'),
+               ('olm', ('olm-power-setup',), 'render-implementation-successful'),
+               ('activation', ('render-implementation-successful',), 'implemented')),
+    'delete': (('renderer', ('delete-received', 'render-delete-request'), 'render-delete-successful'),
+               ('cleanup', ('render-delete-successful',), 'deleted')),
+    'path-computation': (('pce', ('pce-request',), 'pce-successful'),)}
+CYCLE_TOTALS = {'create': ('create-received', 'implemented'), 'delete': ('delete-received', 'deleted')}
+
+
+def parse_time(text):
+    return datetime.datetime.strptime(text.replace('T', ' '), "%Y-%m-%d %H:%M:%S,%f").timestamp()
+
+
+def log_events(lines):
+    # Events of the matching log lines, in log order.
+    for line in lines:
+        if not PREFILTER.search(line):
+            continue
+        parsed = LINE_PATTERN.match(line)
+        if parsed is None:
+            continue
+        message = parsed.group('message')
+        for event, component, pattern in RULES:
+            found = pattern.search(message)
+            if found is None:
+                continue
+            fields = {field: value.group(1).strip() for field, value in
+                      ((field, pattern.search(message)) for field, pattern in FIELD_PATTERNS.items())
+                      if value is not None}
+            if event in ('pce', 'render'):
+                # notification results, e.g. render-delete-successful
+                kind = {'pce': 'pce', 'ServiceDelete': 'render-delete'}.get(
+                    event if event == 'pce' else fields.get('notificationType'), 'render-implementation')
+                event = kind + "-" + fields.get('status', 'unknown').lower()
+            yield {'time': parse_time(parsed.group('time')),
+                   'event': event,
+                   'component': component,
+                   'class': parsed.group('karaf_class') or parsed.group('lighty_class'),
+                   'service': found.groupdict().get('service') or fields.get('serviceName'),
+                   'request-id': fields.get('requestId'),
+                   'message': message[:200]}
+            break
+
+
+def service_cycles(events):
+    # Group the events into service-create/service-delete cycles per service.
+    cycles = []
+    open_cycles = {}
+    pending = []
+    network = []
+    for event in events:
+        if event['component'] == 'networkmodel' and event['service'] is None:
+            network.append(event)
+            continue
+        service = event['service']
+        if service is None:
+            if event['event'] in UNNAMED_STARTS or len(open_cycles) != 1:
+                pending.append(event)
+                continue
+            service = next(iter(open_cycles))
+        starts = [start['event'] for start in pending + [event] if start['event'] in CYCLE_STARTS]
+        cycle = open_cycles.get(service)
+        if cycle is None or starts:
+            cycle = {'service': service, 'kind': CYCLE_STARTS[starts[0]] if starts else 'other',
+                     'request-ids': [], 'events': []}
+            cycles.append(cycle)
+            open_cycles[service] = cycle
+        for previous in pending:
+            previous['service'] = service
+        cycle['events'].extend(pending + [event])
+        pending = []
+        if event['request-id'] and event['request-id'] not in cycle['request-ids']:
+            cycle['request-ids'].append(event['request-id'])
+        if event['event'] in CYCLE_ENDS.get(cycle['kind'], ()):
+            del open_cycles[service]
+    return cycles, network
+
+
+def cycle_phases(cycle):
+    # [(phase, start, duration)] in seconds, start relative to the first cycle event
+    first = {}
+    for event in cycle['events']:
+        first.setdefault(event['event'], event['time'])
+    origin = cycle['events'][0]['time']
+    phases = []
+    for phase, starts, end in PHASES.get(cycle['kind'], ()):
+        start = next((first[name] for name in starts if name in first), None)
+        if start is not None and first.get(end, -1) >= start:
+            phases.append((phase, start - origin, first[end] - start))
+    total = CYCLE_TOTALS.get(cycle['kind'])
+    if total is not None and total[0] in first and first.get(total[1], -1) >= first[total[0]]:
+        phases.append(('total', first[total[0]] - origin, first[total[1]] - first[total[0]]))
+    return phases
+
+
+def phase_statistics(cycles):
+    durations = collections.defaultdict(list)
+    for cycle in cycles:
+        for phase, _, duration in cycle_phases(cycle):
+            durations[cycle['kind'] + ":" + phase].append(duration)
+    return {key: {'count': len(values), 'median_s': statistics.median(values), 'max_s': max(values)}
+            for key, values in sorted(durations.items())}
+
+
+def regressions(current, baseline, tolerance=0.2, min_delta=0.5):
+    # phases whose median grew by more than tolerance and min_delta seconds
+    flagged = {}
+    for key, stats in current.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        delta = stats['median_s'] - reference['median_s']
+        if delta > min_delta and delta > tolerance * reference['median_s']:
+            flagged[key] = {'baseline_s': reference['median_s'], 'current_s': stats['median_s'], 'delta_s': delta}
+    return flagged
+
+
+def print_timeline(cycles, width=60):
+    # One Gantt line per cycle, each phase drawn with its initial.
+    if not cycles:
+        print("no service provisioning found in the log")
+        return
+    print("legend: " + ", ".join(sorted(set(phase[0] + "=" + phase for phases in PHASES.values()
+                                            for phase, _, _ in phases))))
+    for cycle in cycles:
+        phases = [phase for phase in cycle_phases(cycle) if phase[0] != 'total']
+        span = max((start + duration for _, start, duration in phases), default=0) or 1
+        bar = [' '] * width
+        for phase, start, duration in phases:
+            for column in range(int(start / span * width), max(int((start + duration) / span * width), 1)):
+                bar[min(column, width - 1)] = phase[0]
+        total = next((duration for phase, _, duration in cycle_phases(cycle) if phase == 'total'), None)
+        print("{:24.24} {:6} |{}| {}".format(
+            cycle['service'], cycle['kind'], ''.join(bar),
+            "{:.2f}s".format(total) if total is not None else "incomplete"))
+        print("{:31} {}".format('', "  ".join("{} {:.2f}s".format(phase, duration)
+                                             for phase, _, duration in phases)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="service provisioning timeline of a controller log")
+    parser.add_argument('log', help="karaf.log or odl.log")
+    parser.add_argument('--service', default=None, help="only this service")
+    parser.add_argument('--width', type=int, default=60, help="timeline width in characters")
+    parser.add_argument('--json', default=None, help="also write the cycles, phases and statistics to this file")
+    parser.add_argument('--baseline', default=None, help="phase statistics of a previous run to compare with")
+    parser.add_argument('--save-baseline', default=None, help="write the phase statistics of this run")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed relative median increase")
+    parser.add_argument('--min-delta', type=float, default=0.5, help="ignored median increase, in seconds")
+    args = parser.parse_args()
+    with open(args.log, 'r', errors='replace') as log:
+        cycles, network = service_cycles(log_events(log))
+    if args.service is not None:
+        cycles = [cycle for cycle in cycles if cycle['service'] == args.service]
+    print_timeline(cycles, args.width)
+    print(str(len(network)) + " network model topology updates")
+    stats = phase_statistics(cycles)
+    for key, value in stats.items():
+        print("  {:28} {:4d} cycles, median {:7.2f}s, max {:7.2f}s".format(
+            key, value['count'], value['median_s'], value['max_s']))
+    flagged = {}
+    if args.baseline:
+        with open(args.baseline, 'r') as baseline:
+            flagged = regressions(stats, json.load(baseline), args.tolerance, args.min_delta)
+        for key, value in flagged.items():
+            print("REGRESSION {}: median {:.2f}s, baseline {:.2f}s (+{:.2f}s)".format(
+                key, value['current_s'], value['baseline_s'], value['delta_s']))
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as baseline:
+            json.dump(stats, baseline, indent=2)
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump({'cycles': [dict(cycle, phases=cycle_phases(cycle)) for cycle in cycles],
+                       'statistics': stats, 'regressions': flagged}, output, indent=2)
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
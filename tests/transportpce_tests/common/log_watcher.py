@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Long-lived log tail engine.
+# One LogWatcher thread per log file follows the file (inotify when the libc
+# supports it, plain polling otherwise) and dispatches every new line to the
+# regex subscriptions currently registered on it.
+
+import collections
+import concurrent.futures
+import ctypes
+import ctypes.util
+import mmap
+import os
+import re
+import select
+import threading
+import time
+
+POLL_INTERVAL = 0.1
+SCAN_CHUNK_SIZE = 4 * 1024 * 1024
+INOTIFY_SAFETY_INTERVAL = 1.0
+
+_WATCHERS = {}
+_WATCHERS_LOCK = threading.Lock()
+
+
+class _Inotify:
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed on " + directory)
+
+    def wait(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if readable:
+            try:
+                while os.read(self.fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        os.close(self.fd)
+
+
+class Subscription:
+    # One-shot: the future is resolved with the first matching line.
+
+    def __init__(self, watcher, regexp, callback=None):
+        self.watcher = watcher
+        self.pattern = re.compile(regexp)
+        self.callback = callback
+        self.future = concurrent.futures.Future()
+
+    def match(self, line):
+        if self.future.done() or not self.pattern.search(line):
+            return False
+        # the callback has run when wait() returns, and its error is raised
+        # by wait() rather than stopping the watcher thread
+        if self.callback is not None:
+            try:
+                self.callback(line)
+            except Exception as err:  # pylint: disable=broad-except
+                self.future.set_exception(err)
+                return True
+        self.future.set_result(line)
+        return True
+
+    def wait(self, timeout=None):
+        try:
+            return self.future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            return None
+        finally:
+            self.cancel()
+
+    def cancel(self):
+        self.watcher.unsubscribe(self)
+        self.future.cancel()
+
+
+class LogWatcher:
+
+    def __init__(self, log_file):
+        self.log_file = os.path.realpath(log_file)
+        self._subscriptions = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._stream = None
+        self._inode = None
+        self._partial = b''
+        self._inotify = None
+        try:
+            self._inotify = _Inotify(os.path.dirname(self.log_file))
+        except (OSError, AttributeError, TypeError):
+            # No inotify here (non-Linux libc, missing directory, ...): poll instead.
+            self._inotify = None
+        self._open(seek_end=True)
+        self._thread = threading.Thread(target=self._run, name="logwatch-" + os.path.basename(log_file),
+                                        daemon=True)
+        self._thread.start()
+
+    def subscribe(self, regexp, callback=None):
+        subscription = Subscription(self, regexp, callback)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        if self._stream is not None:
+            self._stream.close()
+        if self._inotify is not None:
+            self._inotify.close()
+
+    def _open(self, seek_end=False):
+        try:
+            stream = open(self.log_file, 'rb')
+        except OSError:
+            return
+        if seek_end:
+            stream.seek(0, 2)
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = stream
+        self._inode = os.fstat(stream.fileno()).st_ino
+        self._partial = b''
+
+    def _check_rotation(self):
+        # Honeynode and karaf logs are re-created ('w' mode) at each start:
+        # follow a new inode or a truncation from the beginning of the file.
+        try:
+            stat = os.stat(self.log_file)
+        except OSError:
+            return
+        if self._stream is None or stat.st_ino != self._inode:
+            self._open()
+        elif stat.st_size < self._stream.tell():
+            self._stream.seek(0)
+            self._partial = b''
+
+    def _read_lines(self):
+        self._check_rotation()
+        if self._stream is None:
+            return False
+        data = self._stream.read()
+        if not data:
+            return False
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._dispatch(line.decode('utf-8', errors='replace'))
+        return True
+
+    def _dispatch(self, line):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.match(line):
+                self.unsubscribe(subscription)
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._read_lines():
+                continue
+            if self._inotify is not None:
+                self._inotify.wait(INOTIFY_SAFETY_INTERVAL)
+            else:
+                time.sleep(POLL_INTERVAL)
+
+
+LogBookmark = collections.namedtuple('LogBookmark', ['log_file', 'inode', 'offset'])
+
+
+def bookmark(log_file):
+    # Record where the log currently ends, before triggering the action to wait for.
+    log_file = os.path.realpath(log_file)
+    try:
+        stat = os.stat(log_file)
+    except OSError:
+        return LogBookmark(log_file, None, 0)
+    return LogBookmark(log_file, stat.st_ino, stat.st_size)
+
+
+def scan_from_bookmark(mark, regexp):
+    # Return the first line written after the bookmark matching regexp, or None.
+    # The file is mmap'ed so that the regexp engine walks it without copying;
+    # a chunked read is used instead when the file cannot be mapped.
+    pattern = re.compile(regexp.encode('utf-8') if isinstance(regexp, str) else regexp)
+    try:
+        stream = open(mark.log_file, 'rb')
+    except OSError:
+        return None
+    with stream:
+        stat = os.fstat(stream.fileno())
+        offset = mark.offset
+        if stat.st_ino != mark.inode or stat.st_size < offset:
+            # re-created or truncated since the bookmark: everything is new
+            offset = 0
+        if stat.st_size <= offset:
+            return None
+        try:
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _line_at(mapped, pattern.search(mapped, offset), offset, stat.st_size)
+        except (OSError, ValueError):
+            return _chunked_scan(stream, pattern, offset)
+
+
+def _line_at(buffer, found, lower, upper):
+    if found is None:
+        return None
+    start = buffer.rfind(b'\n', lower, found.start()) + 1 or lower
+    end = buffer.find(b'\n', found.end(), upper)
+    return bytes(buffer[start:upper if end < 0 else end]).decode('utf-8', errors='replace')
+
+
+def _chunked_scan(stream, pattern, offset):
+    # Only whole lines are searched; the trailing partial line is carried over.
+    stream.seek(offset)
+    carry = b''
+    while True:
+        chunk = stream.read(SCAN_CHUNK_SIZE)
+        if not chunk:
+            return _line_at(carry, pattern.search(carry), 0, len(carry)) if carry else None
+        buffer = carry + chunk
+        cut = buffer.rfind(b'\n') + 1
+        found = pattern.search(buffer, 0, cut)
+        if found is not None:
+            return _line_at(buffer, found, 0, cut)
+        carry = buffer[cut:]
+
+
+def get_log_watcher(log_file):
+    key = os.path.realpath(log_file)
+    with _WATCHERS_LOCK:
+        if key not in _WATCHERS:
+            _WATCHERS[key] = LogWatcher(key)
+        return _WATCHERS[key]
+
+
+def stop_log_watchers():
+    with _WATCHERS_LOCK:
+        watchers = list(_WATCHERS.values())
+        _WATCHERS.clear()
+    for watcher in watchers:
+        watcher.stop()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Lightweight asyncio NETCONF-over-SSH stand-in for the honeynode simulators.
+# It serves a sample_configs/openroadm/<version>/oper-*.xml datastore and
+# supports hello (base 1.0/1.1 framing), get, get-config with subtree filters,
+# edit-config, lock/unlock/commit, get-schema from the ordmodels YANG files and
+# create-subscription with OpenROADM change-notifications on edit-config.
+# Usage is the same as honeycomb-tpce: netconf_simulator.py <port> <config-file>
+
+import argparse
+import asyncio
+import copy
+import datetime
+import glob
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+BASE_NS = "urn:ietf:params:xml:ns:netconf:base:1.0"
+NOTIFICATION_NS = "urn:ietf:params:xml:ns:netconf:notification:1.0"
+MONITORING_NS = "urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring"
+DEVICE_NS = "http://org/openroadm/device"
+OPERATION = "{" + BASE_NS + "}operation"
+EOM = b"]]>]]>"
+OK_START_MSG = "Netconf SSH endpoint started successfully at 0.0.0.0"
+
+YANG_DIRECTORIES = [
+    os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                 "..", "..", "..", "ordmodels", models, "src", "main", "yang")
+    for models in ("common", "device")]
+# Most recent model revisions implemented by each OpenROADM device version.
+VERSION_REVISIONS = {'1.2.1': '2017-02-06', '2.2.1': '2018-10-19'}
+BASE_CAPABILITIES = [
+    "urn:ietf:params:netconf:base:1.0",
+    "urn:ietf:params:netconf:base:1.1",
+    "urn:ietf:params:netconf:capability:writable-running:1.0",
+    "urn:ietf:params:netconf:capability:notification:1.0",
+    "urn:ietf:params:netconf:capability:interleave:1.0",
+    MONITORING_NS + "?module=ietf-netconf-monitoring&revision=2010-10-04"]
+# Keys of the device lists edited by the renderer, other elements are matched by tag.
+LIST_KEYS = {'interface': ['name'], 'roadm-connections': ['connection-name'],
+             'odu-connection': ['connection-name'], 'circuit-packs': ['circuit-pack-name'],
+             'ports': ['port-name'], 'degree': ['degree-number'],
+             'shared-risk-group': ['srg-number'], 'connection-map': ['connection-map-number']}
+
+
+class RpcError(Exception):
+    def __init__(self, tag, message, error_type='application'):
+        super().__init__(message)
+        self.tag = tag
+        self.error_type = error_type
+
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def load_yang_modules(version):
+    # {(module, revision): (namespace, path)} for the revisions of this device version
+    cutoff = VERSION_REVISIONS.get(version, max(VERSION_REVISIONS.values()))
+    latest = {}
+    for directory in YANG_DIRECTORIES:
+        for path in glob.glob(os.path.join(directory, "*@*.yang")):
+            module, revision = os.path.basename(path)[:-len(".yang")].split('@')
+            if revision <= cutoff and revision > latest.get(module, ('', None))[0]:
+                latest[module] = (revision, path)
+    modules = {}
+    for module, (revision, path) in latest.items():
+        with open(path, 'r') as yang_file:
+            found = re.search(r'namespace\s+"([^"]+)"', yang_file.read())
+        if found:
+            modules[(module, revision)] = (found.group(1), path)
+    return modules
+
+
+class Datastore:
+
+    def __init__(self, config_file):
+        self.root = ET.parse(config_file).getroot()
+
+    def get(self, filter_element=None):
+        data = ET.Element("{" + BASE_NS + "}data")
+        if filter_element is None or len(filter_element) == 0:
+            data.extend(copy.deepcopy(child) for child in self.root)
+            return data
+        for selector in filter_element:
+            for child in self.root:
+                if child.tag == selector.tag:
+                    selected = select_subtree(child, selector)
+                    if selected is not None:
+                        data.append(selected)
+        return data
+
+    def edit(self, config):
+        edits = []
+        for element in config:
+            apply_edit(self.root, element, 'merge', "/", edits)
+        return edits
+
+
+def text_of(element):
+    return (element.text or '').strip()
+
+
+def select_subtree(node, selector):
+    # RFC 6241 subtree filtering: containment, selection and content match nodes.
+    children = list(selector)
+    if not children:
+        if text_of(selector) and text_of(node) != text_of(selector):
+            return None
+        return copy.deepcopy(node)
+    content = [child for child in children if len(child) == 0 and text_of(child)]
+    for match in content:
+        if not any(child.tag == match.tag and text_of(child) == text_of(match) for child in node):
+            return None
+    others = [child for child in children if child not in content]
+    if not others:
+        return copy.deepcopy(node)
+    result = ET.Element(node.tag, node.attrib)
+    for child in node:
+        if any(child.tag == match.tag for match in content):
+            result.append(copy.deepcopy(child))
+            continue
+        for sub_selector in others:
+            if sub_selector.tag == child.tag:
+                selected = select_subtree(child, sub_selector)
+                if selected is not None:
+                    result.append(selected)
+                    break
+    return result
+
+
+def find_entry(parent, element):
+    keys = LIST_KEYS.get(local_name(element.tag))
+    namespace = element.tag[:element.tag.index('}') + 1] if '}' in element.tag else ''
+    for child in parent:
+        if child.tag != element.tag:
+            continue
+        if keys is None or all(child.findtext(namespace + key) == element.findtext(namespace + key) for key in keys):
+            return child
+    return None
+
+
+def strip_operations(element):
+    for node in element.iter():
+        node.attrib.pop(OPERATION, None)
+    return element
+
+
+def entry_path(parent_path, element):
+    path = parent_path.rstrip('/') + "/d:" + local_name(element.tag)
+    for key in LIST_KEYS.get(local_name(element.tag), []):
+        value = element.findtext("{" + DEVICE_NS + "}" + key)
+        if value is not None:
+            path += "[d:" + key + "='" + value + "']"
+    return path
+
+
+def apply_edit(parent, element, default_operation, parent_path, edits):
+    operation = element.attrib.get(OPERATION, default_operation)
+    existing = find_entry(parent, element)
+    path = entry_path(parent_path, element)
+    if operation in ('delete', 'remove'):
+        if existing is None:
+            if operation == 'delete':
+                raise RpcError('data-missing', "no data to delete at " + path)
+            return
+        parent.remove(existing)
+        edits.append((path, 'delete'))
+        return
+    if operation == 'create' and existing is not None:
+        raise RpcError('data-exists', "data already exists at " + path)
+    if existing is None or operation in ('replace', 'create') or len(element) == 0:
+        new = strip_operations(copy.deepcopy(element))
+        if existing is None:
+            parent.append(new)
+            edits.append((path, 'create'))
+        else:
+            parent[list(parent).index(existing)] = new
+            edits.append((path, operation if operation == 'replace' else 'merge'))
+        return
+    for child in element:
+        apply_edit(existing, child, operation, path, edits)
+
+
+class NetconfSession:
+    SESSION_ID = 0
+
+    def __init__(self, server, reader, writer):
+        NetconfSession.SESSION_ID += 1
+        self.session_id = NetconfSession.SESSION_ID
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.chunked = False
+        self.subscribed = False
+        self.pending_edits = []
+
+    async def run(self):
+        self.send_raw(self.hello())
+        client_hello = await self.read_eom()
+        if client_hello is None:
+            return
+        self.chunked = b"urn:ietf:params:netconf:base:1.1" in client_hello
+        self.server.sessions.append(self)
+        try:
+            while True:
+                message = await (self.read_chunked() if self.chunked else self.read_eom())
+                if message is None:
+                    break
+                if not self.handle(message):
+                    break
+        finally:
+            self.server.sessions.remove(self)
+
+    def hello(self):
+        capabilities = "".join("<capability>" + capability.replace('&', '&amp;') + "</capability>"
+                               for capability in self.server.capabilities)
+        return ('<hello xmlns="' + BASE_NS + '"><capabilities>' + capabilities + '</capabilities><session-id>'
+                + str(self.session_id) + '</session-id></hello>').encode('utf-8')
+
+    async def read_eom(self):
+        try:
+            message = await self.reader.readuntil(EOM)
+        except (asyncio.IncompleteReadError, asyncssh.Error, ConnectionError):
+            return None
+        return message[:-len(EOM)]
+
+    async def read_chunked(self):
+        message = b''
+        try:
+            while True:
+                await self.reader.readuntil(b'\n#')
+                size = (await self.reader.readuntil(b'\n'))[:-1]
+                if size == b'#':
+                    return message
+                message += await self.reader.readexactly(int(size))
+        except (asyncio.IncompleteReadError, asyncssh.Error, ConnectionError, ValueError):
+            return None
+
+    def send_raw(self, payload):
+        if self.chunked:
+            self.writer.write(b"\n#" + str(len(payload)).encode() + b"\n" + payload + b"\n##\n")
+        else:
+            self.writer.write(payload + EOM)
+
+    def reply(self, message_id, body):
+        reply = ET.Element("{" + BASE_NS + "}rpc-reply")
+        if message_id is not None:
+            reply.set("message-id", message_id)
+        reply.append(body)
+        self.send_raw(ET.tostring(reply))
+
+    def handle(self, message):
+        try:
+            rpc = ET.fromstring(message)
+        except ET.ParseError:
+            return True
+        message_id = rpc.get("message-id")
+        if len(rpc) == 0:
+            return True
+        operation = rpc[0]
+        try:
+            body, keep_open = self.dispatch(operation)
+        except RpcError as error:
+            body, keep_open = self.rpc_error(error), True
+        self.reply(message_id, body)
+        if self.pending_edits:
+            self.server.notify_change(self.pending_edits)
+            self.pending_edits = []
+        return keep_open
+
+    def dispatch(self, operation):
+        name = local_name(operation.tag)
+        if name in ('get', 'get-config'):
+            return self.server.datastore.get(operation.find("{" + BASE_NS + "}filter")), True
+        if name == 'edit-config':
+            config = operation.find("{" + BASE_NS + "}config")
+            if config is None:
+                raise RpcError('missing-element', "edit-config without config", 'protocol')
+            self.pending_edits = self.server.datastore.edit(config)
+            return ok(), True
+        if name in ('lock', 'unlock', 'commit', 'validate', 'discard-changes', 'kill-session'):
+            return ok(), True
+        if name == 'close-session':
+            return ok(), False
+        if name == 'create-subscription':
+            self.subscribed = True
+            return ok(), True
+        if name == 'get-schema':
+            return self.get_schema(operation), True
+        raise RpcError('operation-not-supported', name + " is not supported", 'protocol')
+
+    def get_schema(self, operation):
+        identifier = operation.findtext("{" + MONITORING_NS + "}identifier")
+        version = operation.findtext("{" + MONITORING_NS + "}version")
+        for (module, revision), (_, path) in self.server.modules.items():
+            if module == identifier and version in (None, '', revision):
+                data = ET.Element("{" + MONITORING_NS + "}data")
+                with open(path, 'r') as yang_file:
+                    data.text = yang_file.read()
+                return data
+        raise RpcError('invalid-value', "unknown schema " + str(identifier) + "@" + str(version))
+
+    @staticmethod
+    def rpc_error(error):
+        rpc_error = ET.Element("{" + BASE_NS + "}rpc-error")
+        for tag, text in (('error-type', error.error_type), ('error-tag', error.tag),
+                          ('error-severity', 'error'), ('error-message', str(error))):
+            ET.SubElement(rpc_error, "{" + BASE_NS + "}" + tag).text = text
+        return rpc_error
+
+    def notify(self, payload):
+        if self.subscribed:
+            self.send_raw(payload)
+
+
+def ok():
+    return ET.Element("{" + BASE_NS + "}ok")
+
+
+class NetconfSimulator:
+
+    def __init__(self, config_file, version, login="admin", password="admin"):
+        self.datastore = Datastore(config_file)
+        self.modules = load_yang_modules(version)
+        self.capabilities = BASE_CAPABILITIES + sorted(
+            namespace + "?module=" + module + "&revision=" + revision
+            for (module, revision), (namespace, _) in self.modules.items())
+        self.login = login
+        self.password = password
+        self.sessions = []
+
+    def notify_change(self, edits):
+        # OpenROADM change-notification, as sent by the devices on configuration changes
+        if not edits:
+            return
+        now = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        notification = ET.Element("{" + NOTIFICATION_NS + "}notification")
+        ET.SubElement(notification, "{" + NOTIFICATION_NS + "}eventTime").text = now
+        change = ET.SubElement(notification, "{" + DEVICE_NS + "}change-notification")
+        ET.SubElement(change, "{" + DEVICE_NS + "}change-time").text = now
+        for path, operation in edits:
+            edit = ET.SubElement(change, "{" + DEVICE_NS + "}edit")
+            target = ET.SubElement(edit, "{" + DEVICE_NS + "}target")
+            target.set("xmlns:d", DEVICE_NS)
+            target.text = path
+            ET.SubElement(edit, "{" + DEVICE_NS + "}operation").text = operation
+        payload = ET.tostring(notification)
+        for session in self.sessions:
+            session.notify(payload)
+
+    async def handle_process(self, process):
+        if process.subsystem != 'netconf':
+            process.exit(1)
+            return
+        await NetconfSession(self, process.stdin, process.stdout).run()
+        process.exit(0)
+
+    def server_factory(self):
+        simulator = self
+
+        class SSHServer(asyncssh.SSHServer):
+            def begin_auth(self, username):
+                return True
+
+            def password_auth_supported(self):
+                return True
+
+            def validate_password(self, username, password):
+                return username == simulator.login and password == simulator.password
+
+        return SSHServer()
+
+    async def start(self, port, host=''):
+        host_key = asyncssh.generate_private_key('ecdsa-sha2-nistp256')
+        return await asyncssh.create_server(self.server_factory, host, int(port), server_host_keys=[host_key],
+                                            process_factory=self.handle_process, encoding=None, allow_pty=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="lightweight OpenROADM NETCONF device simulator")
+    parser.add_argument('port', help="NETCONF SSH port")
+    parser.add_argument('config_file', help="sample_configs oper-*.xml datastore")
+    parser.add_argument('--openroadm-version', default=None,
+                        help="device models version (default: name of the config file directory)")
+    args = parser.parse_args()
+    if asyncssh is None:
+        print("asyncssh is required by the lightweight NETCONF simulator")
+        sys.exit(2)
+    version = args.openroadm_version or os.path.basename(os.path.dirname(os.path.realpath(args.config_file)))
+    simulator = NetconfSimulator(args.config_file, version)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(simulator.start(args.port))
+    print(OK_START_MSG + ":" + str(args.port), flush=True)
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Stand-in for the notification server of the service RPCs 'notification-url'
+# (http://localhost:8585/NotificationServer/notify).
+# Every notification is recorded with its reception time and request-id:
+# the ones posted on /notify and, since the controller itself only publishes
+# YANG notifications, the PCE/renderer/service handler ones followed through
+# the RESTCONF notification streams (common/notification_stream.py).
+# A client awaits a service state with a long-polling GET:
+#   GET /NotificationServer/wait?service-name=service1&state=inService&since=<epoch>&timeout=60
+#   GET /NotificationServer/events?service-name=service1
+# It is started by the harness daemon, or alone from a transportpce_tests/<version> directory:
+#   python -m common.notification_receiver
+
+import asyncio
+import http
+import json
+import os
+import threading
+import time
+import urllib.parse
+import xml.etree.ElementTree as ET
+
+import requests
+
+from common.notification_stream import NotificationListener, parse_notification
+
+NOTIFICATION_PORT = int(os.environ.get('TPCE_NOTIFICATION_PORT', 8585))
+BASE_PATH = "/NotificationServer"
+
+# (notification, notification-type, status) -> service state reached
+SERVICE_STATES = {
+    ('renderer-rpc-result-sp', 'service-implementation-request', 'Successful'): 'inService',
+    ('renderer-rpc-result-sp', 'service-delete', 'Successful'): 'deleted',
+    ('service-rpc-result-sh', 'service-create-result', 'Successful'): 'inService',
+    ('service-rpc-result-sh', 'service-delete-result', 'Successful'): 'deleted'}
+
+
+def flatten_json(data, leaves=None):
+    # first occurrence of each leaf, module prefixes removed
+    leaves = {} if leaves is None else leaves
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                flatten_json(value, leaves)
+            else:
+                leaves.setdefault(key.rpartition(':')[2], value)
+    elif isinstance(data, list):
+        for item in data:
+            flatten_json(item, leaves)
+    return leaves
+
+
+def service_state(record):
+    if record.get('status') == 'Failed':
+        return 'failed'
+    return SERVICE_STATES.get((record.get('notification'), record.get('notification-type'), record.get('status')),
+                              record.get('operational-state'))
+
+
+class NotificationReceiver:
+
+    def __init__(self, port=NOTIFICATION_PORT, follow_streams=True):
+        self.port = port
+        self.url = "http://localhost:" + str(port) + BASE_PATH
+        self.follow_streams = follow_streams
+        self.records = []
+        self._waiters = []
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._listener = None
+
+    def start(self):
+        # The HTTP server runs on its own asyncio loop in a daemon thread.
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, '0.0.0.0', self.port))
+            started.set()
+            self._loop.run_forever()
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="notification-receiver", daemon=True)
+        self._thread.start()
+        if not started.wait(10):
+            raise ConnectionError("notification receiver could not listen on port " + str(self.port))
+        if self.follow_streams:
+            try:
+                self._listener = NotificationListener(
+                    callback=lambda event: self._loop.call_soon_threadsafe(self.record, dict(event, source='stream')))
+                self._listener.start()
+            except (ConnectionError, requests.exceptions.RequestException) as err:
+                self._listener = None
+                print("controller notification streams not followed: " + str(err))
+        return self
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.stop()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+            self._loop = None
+
+    def record(self, record):
+        # always called from the receiver loop
+        record.setdefault('received', time.time())
+        record.setdefault('request-id', None)
+        record['service-state'] = service_state(record)
+        record['index'] = len(self.records)
+        self.records.append(record)
+        for match, future in list(self._waiters):
+            if not future.done() and match(record):
+                future.set_result(record)
+
+    async def wait_for_state(self, servicename, state, since=0.0, timeout=60.0):
+        # First record since 'since' giving the service this state (or a failure).
+        def match(record):
+            return (record.get('service-name') == servicename and record['received'] >= since
+                    and record['service-state'] in (state, 'failed'))
+
+        found = next((record for record in self.records if match(record)), None)
+        if found is not None:
+            return found
+        future = self._loop.create_future()
+        waiter = (match, future)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._waiters.remove(waiter)
+
+    def _posted_record(self, body, content_type):
+        if 'xml' in content_type:
+            record = parse_notification(body.decode('utf-8'))
+        else:
+            record = flatten_json(json.loads(body.decode('utf-8')) if body else {})
+        record['source'] = 'http'
+        return record
+
+    async def _handle(self, reader, writer):
+        # One request per connection, enough for the test clients.
+        try:
+            method, target, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            url = urllib.parse.urlsplit(target)
+            params = dict(urllib.parse.parse_qsl(url.query))
+            status, payload = await self._route(method, url.path, params, body, headers.get('content-type', ''))
+        except (ValueError, ET.ParseError, asyncio.IncompleteReadError) as err:
+            status, payload = 400, {'error': str(err)}
+        content = json.dumps(payload).encode('utf-8')
+        writer.write(("HTTP/1.1 " + str(status) + " " + http.HTTPStatus(status).phrase
+                      + "\r\nContent-Type: application/json\r\nContent-Length: " + str(len(content))
+                      + "\r\nConnection: close\r\n\r\n").encode('latin-1') + content)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, params, body, content_type):
+        if method == 'POST' and path == BASE_PATH + "/notify":
+            record = self._posted_record(body, content_type)
+            self.record(record)
+            return 200, {'index': record['index']}
+        if method == 'GET' and path == BASE_PATH + "/events":
+            since = float(params.get('since', 0))
+            return 200, [record for record in self.records
+                         if record['received'] >= since
+                         and params.get('service-name', record.get('service-name')) == record.get('service-name')]
+        if method == 'GET' and path == BASE_PATH + "/wait":
+            if 'service-name' not in params:
+                return 400, {'error': "service-name required"}
+            record = await self.wait_for_state(params['service-name'], params.get('state', 'inService'),
+                                               float(params.get('since', 0)), float(params.get('timeout', 60)))
+            return (200, record) if record is not None else (408, {'error': "timeout"})
+        return 404, {'error': "unknown resource " + path}
+
+
+def main():
+    receiver = NotificationReceiver().start()
+    print("notification receiver listening on " + receiver.url + "/notify")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        receiver.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Subscriber to the TransportPCE YANG notifications (PCE, renderer, service
+# handler and network model results) through the RESTCONF notification
+# streams: sal-remote:create-notification-stream, then a websocket opened on
+# the location returned by the streams/stream subscription.
+# NotificationListener runs the websocket clients on an asyncio loop in a
+# background thread and records each notification as a dict:
+#   listener = NotificationListener().start()
+#   event = listener.wait_for_event(lambda event: event.get('service-name') == "service1", timeout=60)
+
+import asyncio
+import base64
+import os
+import struct
+import threading
+import time
+import urllib.parse
+import xml.etree.ElementTree as ET
+
+import requests
+
+from common import test_utils
+
+URL_CREATE_NOTIFICATION_STREAM = "{}/operations/sal-remote:create-notification-stream"
+URL_STREAM = "{}/streams/stream/"
+SAL_REMOTE_NAMESPACE = "urn:opendaylight:params:xml:ns:yang:controller:md:sal:remote"
+
+# (module, namespace, notification) of the transportpce api models
+TRANSPORTPCE_NOTIFICATIONS = (
+    ('transportpce-pce', "http://org/opendaylight/transportpce/pce", 'service-path-rpc-result'),
+    ('transportpce-renderer', "http://org/opendaylight/transportpce/renderer", 'renderer-rpc-result-sp'),
+    ('transportpce-servicehandler', "http://org/opendaylight/transportpce/servicehandler", 'service-rpc-result-sh'),
+    ('transportpce-networkmodel', "http://org/opendaylight/transportpce/networkmodel", 'topology-update-result'))
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+
+def create_notification_stream(module, namespace, notification):
+    data = ('<input xmlns="' + SAL_REMOTE_NAMESPACE + '"><notifications xmlns:' + module + '="' + namespace
+            + '">' + module + ':' + notification + '</notifications></input>')
+    response = test_utils.restconf_request("POST", URL_CREATE_NOTIFICATION_STREAM, data=data,
+                                           headers={'Content-Type': 'application/xml',
+                                                    'Accept': 'application/json'})
+    if response.status_code != requests.codes.ok:
+        raise ConnectionError("cannot create a notification stream for " + notification + ": "
+                              + str(response.status_code))
+    return response.json()['output']['notification-stream-identifier']
+
+
+def subscribe_stream(stream_name):
+    # The RESTCONF subscription answers with the websocket location of the stream.
+    response = test_utils.get_request(URL_STREAM + stream_name)
+    location = response.headers.get('Location')
+    if response.status_code != requests.codes.ok or not location:
+        raise ConnectionError("cannot subscribe to notification stream " + stream_name + ": "
+                              + str(response.status_code))
+    return location
+
+
+def parse_notification(text):
+    # Flatten a notification to a dict of its leaves, e.g.
+    # {'notification': 'renderer-rpc-result-sp', 'service-name': ..., 'status': ..., 'status-message': ...}
+    root = ET.fromstring(text)
+    event = {'received': time.time(), 'monotonic': time.monotonic()}
+    for child in root:
+        name = child.tag.rpartition('}')[2]
+        if name == 'eventTime':
+            event['event-time'] = child.text
+        else:
+            event['notification'] = name
+            for leaf in child.iter():
+                if leaf is not child and len(leaf) == 0 and leaf.text is not None:
+                    event.setdefault(leaf.tag.rpartition('}')[2], leaf.text.strip())
+    return event
+
+
+def websocket_frame(opcode, payload=b''):
+    # Client frames are always masked (RFC 6455 5.3).
+    mask = os.urandom(4)
+    header = bytes([0x80 | opcode])
+    if len(payload) < 126:
+        header += bytes([0x80 | len(payload)])
+    elif len(payload) < 65536:
+        header += bytes([0x80 | 126]) + struct.pack('!H', len(payload))
+    else:
+        header += bytes([0x80 | 127]) + struct.pack('!Q', len(payload))
+    return header + mask + bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+
+
+async def websocket_messages(url):
+    # Minimal RFC 6455 client yielding the text messages of a websocket.
+    parsed = urllib.parse.urlsplit(url)
+    reader, writer = await asyncio.open_connection(parsed.hostname, parsed.port or 80)
+    key = base64.b64encode(os.urandom(16)).decode('ascii')
+    credentials = base64.b64encode((test_utils.ODL_LOGIN + ":" + test_utils.ODL_PWD).encode('utf-8'))
+    writer.write(("GET " + (parsed.path or "/") + ("?" + parsed.query if parsed.query else "") + " HTTP/1.1\r\n"
+                  "Host: " + parsed.netloc + "\r\n"
+                  "Upgrade: websocket\r\n"
+                  "Connection: Upgrade\r\n"
+                  "Sec-WebSocket-Key: " + key + "\r\n"
+                  "Sec-WebSocket-Version: 13\r\n"
+                  "Authorization: Basic " + credentials.decode('ascii') + "\r\n\r\n").encode('ascii'))
+    await writer.drain()
+    try:
+        status = await reader.readline()
+        if b" 101 " not in status:
+            raise ConnectionError("websocket upgrade refused by " + url + ": " + status.decode('ascii', 'replace'))
+        while (await reader.readline()) not in (b'\r\n', b''):
+            pass
+        fragments = []
+        while True:
+            first, second = await reader.readexactly(2)
+            length = second & 0x7f
+            if length == 126:
+                length = struct.unpack('!H', await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack('!Q', await reader.readexactly(8))[0]
+            mask = await reader.readexactly(4) if second & 0x80 else None
+            payload = await reader.readexactly(length)
+            if mask is not None:
+                payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+            opcode = first & 0x0f
+            if opcode in (OPCODE_TEXT, OPCODE_CONTINUATION):
+                fragments.append(payload)
+                if first & 0x80:
+                    yield b''.join(fragments).decode('utf-8')
+                    fragments = []
+            elif opcode == OPCODE_PING:
+                writer.write(websocket_frame(OPCODE_PONG, payload))
+                await writer.drain()
+            elif opcode == OPCODE_CLOSE:
+                writer.write(websocket_frame(OPCODE_CLOSE, payload[:2]))
+                await writer.drain()
+                return
+    except asyncio.IncompleteReadError:
+        return
+    finally:
+        writer.close()
+
+
+class NotificationListener:
+
+    def __init__(self, notifications=TRANSPORTPCE_NOTIFICATIONS, callback=None):
+        self.notifications = notifications
+        self.callback = callback
+        self.events = []
+        self._condition = threading.Condition()
+        self._loop = None
+        self._thread = None
+
+    def start(self, timeout=30):
+        # The streams are created and subscribed synchronously, so that an
+        # unreachable controller or an unsupported stream fails here.
+        locations = [subscribe_stream(create_notification_stream(*notification))
+                     for notification in self.notifications]
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            tasks = [self._loop.create_task(self._follow(location)) for location in locations]
+            started.set()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+        self._thread = threading.Thread(target=run, name="notification-listener", daemon=True)
+        self._thread.start()
+        started.wait(timeout)
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+            self._thread.join(5)
+            self._loop = None
+
+    def _cancel_tasks(self):
+        for task in asyncio.all_tasks():
+            task.cancel()
+
+    async def _follow(self, location):
+        async for message in websocket_messages(location):
+            try:
+                self.record(parse_notification(message))
+            except ET.ParseError:
+                continue
+
+    def record(self, event):
+        with self._condition:
+            self.events.append(event)
+            self._condition.notify_all()
+        if self.callback is not None:
+            self.callback(event)
+
+    def wait_for_event(self, predicate, timeout=60, since=0):
+        # First recorded event (from index 'since' on) matching predicate, or None.
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            index = since
+            while True:
+                while index < len(self.events):
+                    if predicate(self.events[index]):
+                        return self.events[index]
+                    index += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def service_events(self, servicename):
+        with self._condition:
+            return [event for event in self.events if event.get('service-name') == servicename]
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# PCE path-computation load and latency benchmark.
+# Fires test_utils.path_computation_request() calls between XPDR endpoints of
+# the loaded openroadm-topology at one or several concurrency levels, and
+# writes latency percentiles, throughput and success rate of each run as JSON.
+# From a transportpce_tests/<version> directory, with a controller running:
+#   python -m common.pce_benchmark --load-roadms 500 --requests 1000 --concurrency 1 4 16
+#   python -m common.pce_benchmark --requests 1000 --distribution zipf --baseline previous.json
+# With --update-every N (generated topologies only), one ROADM-TO-ROADM link is
+# rewritten before every Nth request, so that the latency of the requests
+# following a topology change (PCE topology cache update) is reported apart
+# from the steady state one:
+#   python -m common.pce_benchmark --load-roadms 500 --requests 1000 --update-every 10
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import datetime
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+import requests
+
+from common import test_utils
+from common.topology_generator import TopologyGenerator
+
+SUCCESS_MESSAGE = "Path is calculated"
+ZIPF_EXPONENT = 1.2
+
+
+def percentile(sorted_values, fraction):
+    # nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def latency_summary(latencies):
+    # latencies in seconds, summary in milliseconds
+    values = sorted(latency * 1000 for latency in latencies)
+    if not values:
+        return {'count': 0}
+    return {'count': len(values),
+            'min': values[0],
+            'mean': sum(values) / len(values),
+            'p50': percentile(values, 0.50),
+            'p95': percentile(values, 0.95),
+            'p99': percentile(values, 0.99),
+            'max': values[-1]}
+
+
+def discover_endpoints():
+    # XPDR nodes of the openroadm-topology with the CLLI of their supporting node
+    response = test_utils.get_request(test_utils.URL_CONFIG_ORDM_TOPO)
+    if response.status_code != requests.codes.ok:
+        return []
+    endpoints = []
+    for node in response.json()['network'][0].get('node', []):
+        if node.get('org-openroadm-common-network:node-type') != 'XPONDER':
+            continue
+        clli = next((supporting['node-ref'] for supporting in node.get('supporting-node', [])
+                     if supporting['network-ref'] == 'clli-network'), node['node-id'])
+        endpoints.append((node['node-id'], clli))
+    return endpoints
+
+
+def generated_endpoints(generator):
+    return [(generator.xpdr_id(roadm, xpdr), generator.clli(roadm))
+            for roadm in range(1, generator.roadms + 1) for xpdr in range(1, generator.xpdrs + 1)]
+
+
+def load_generated_topology(generator):
+    start = time.monotonic()
+    response = test_utils.stream_request("POST", test_utils.URL_FULL_PORTMAPPING, generator.portmapping_chunks())
+    if response.status_code not in (requests.codes.ok, requests.codes.created, requests.codes.no_content):
+        print("portmapping upload failed: " + str(response.status_code))
+        sys.exit(1)
+    response = test_utils.stream_request("PUT", test_utils.URL_CONFIG_ORDM_TOPO, generator.json_chunks())
+    if response.status_code not in (requests.codes.ok, requests.codes.created, requests.codes.no_content):
+        print("topology upload failed: " + str(response.status_code))
+        sys.exit(1)
+    print("{} nodes and {} links loaded in {:.1f}s".format(
+        generator.node_count, generator.link_count, time.monotonic() - start))
+
+
+def span_link_updater(generator):
+    # Each call rewrites the next ROADM-TO-ROADM link with its TE-metric
+    # alternately increased and restored: the paths computed do not change
+    # (TE-metric is not a PCE metric) but the topology version does.
+    spans = [link for link in generator.links()
+             if link["org-openroadm-common-network:link-type"] == "ROADM-TO-ROADM"]
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def update():
+        with lock:
+            index = next(counter)
+        link = dict(spans[index % len(spans)])
+        link["org-openroadm-common-network:TE-metric"] += (index // len(spans) + 1) % 2
+        response = test_utils.put_request(
+            test_utils.URL_CONFIG_ORDM_TOPO + "ietf-network-topology:link/" + link["link-id"],
+            {"ietf-network-topology:link": [link]})
+        return response.status_code in (requests.codes.ok, requests.codes.created, requests.codes.no_content)
+    return update
+
+
+def pair_sampler(endpoints, distribution, rng, pair=None):
+    # 'uniform': any two distinct endpoints, 'zipf': endpoints drawn with a
+    # weight decreasing with their rank (a few hot nodes take most requests),
+    # 'fixed': always the same A/Z pair.
+    if distribution == 'fixed':
+        cllis = dict(endpoints)
+        a_end, z_end = ((node, cllis.get(node, node)) for node in pair)
+        return lambda: (a_end, z_end)
+    if len(endpoints) < 2:
+        raise ValueError("at least 2 XPDR endpoints are needed, " + str(len(endpoints)) + " found")
+    weights = None
+    if distribution == 'zipf':
+        weights = list(1 / (rank ** ZIPF_EXPONENT) for rank in range(1, len(endpoints) + 1))
+
+    def sample():
+        while True:
+            a_end, z_end = rng.choices(endpoints, weights=weights, k=2)
+            if a_end != z_end:
+                return a_end, z_end
+    return sample
+
+
+def service_end(endpoint):
+    node_id, clli = endpoint
+    return {"node-id": node_id, "service-rate": "100", "service-format": "Ethernet", "clli": clli}
+
+
+def timed_path_computation(index, a_end, z_end, update=None, tuning=None):
+    # the topology update, if any, is done before the measured request
+    if update is not None and not update():
+        return 0.0, "topology-update-failed"
+    start = time.perf_counter()
+    try:
+        response = test_utils.path_computation_request(
+            "bench-request-" + str(index), "bench-service-" + str(index), service_end(a_end), service_end(z_end),
+            other_attr=tuning)
+    except requests.exceptions.RequestException as err:
+        return time.perf_counter() - start, type(err).__name__
+    latency = time.perf_counter() - start
+    if response.status_code != requests.codes.ok:
+        return latency, "http-" + str(response.status_code)
+    try:
+        message = response.json()['output']['configuration-response-common']['response-message']
+    except (ValueError, KeyError):
+        return latency, "invalid-response"
+    return latency, None if SUCCESS_MESSAGE in message else message
+
+
+def run_benchmark(endpoints, request_count, concurrency, distribution, seed=0, pair=None, warmup=0,
+                  update=None, update_every=0, tuning=None):
+    # pylint: disable=too-many-arguments,too-many-locals
+    rng = random.Random(seed)
+    sample = pair_sampler(endpoints, distribution, rng, pair)
+    pairs = [sample() for _ in range(warmup + request_count)]
+    test_utils.configure_session(pool_size=max(concurrency, test_utils.HTTP_POOL_SIZE))
+    latencies = []
+    updated_latencies = []
+    failures = collections.Counter()
+    # test_utils.post_request() prints every request body
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for index, (a_end, z_end) in enumerate(pairs[:warmup]):
+            timed_path_computation(index, a_end, z_end, tuning=tuning)
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(timed_path_computation, warmup + index, a_end, z_end,
+                                       update if update_every and index % update_every == 0 else None, tuning):
+                       update_every and index % update_every == 0
+                       for index, (a_end, z_end) in enumerate(pairs[warmup:])}
+            for future in concurrent.futures.as_completed(futures):
+                latency, failure = future.result()
+                (updated_latencies if futures[future] else latencies).append(latency)
+                if failure is not None:
+                    failures[failure] += 1
+        duration = time.perf_counter() - start
+    successes = request_count - sum(failures.values())
+    run = {'concurrency': concurrency,
+            'distribution': distribution,
+            'requests': request_count,
+            'successes': successes,
+            'success_rate': successes / request_count if request_count else 0.0,
+            'failures': dict(failures),
+            'duration_s': duration,
+            'throughput_rps': request_count / duration if duration else 0.0,
+            'latency_ms': latency_summary(latencies + updated_latencies)}
+    if update_every:
+        run['update_every'] = update_every
+        run['steady_latency_ms'] = latency_summary(latencies)
+        run['after_update_latency_ms'] = latency_summary(updated_latencies)
+    return run
+
+
+def print_run(run, baseline=None):
+    latency = run['latency_ms']
+    line = "concurrency {:3d}: {:7.1f} req/s, success {:6.1%}, p50 {:8.1f} ms, p95 {:8.1f} ms, p99 {:8.1f} ms".format(
+        run['concurrency'], run['throughput_rps'], run['success_rate'],
+        latency.get('p50') or 0, latency.get('p95') or 0, latency.get('p99') or 0)
+    if baseline is not None and baseline['latency_ms'].get('p95'):
+        line += " (p95 {:+.1%}, throughput {:+.1%} vs baseline)".format(
+            latency['p95'] / baseline['latency_ms']['p95'] - 1,
+            run['throughput_rps'] / baseline['throughput_rps'] - 1 if baseline['throughput_rps'] else 0)
+    print(line, flush=True)
+    if 'after_update_latency_ms' in run:
+        print("                 p50 {:8.1f} ms steady, {:8.1f} ms after a topology update".format(
+            run['steady_latency_ms'].get('p50') or 0, run['after_update_latency_ms'].get('p50') or 0), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PCE path-computation load and latency benchmark")
+    parser.add_argument('--requests', type=int, default=200, help="path computations per run")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1], help="one run per concurrency level")
+    parser.add_argument('--distribution', choices=('uniform', 'zipf', 'fixed'), default='uniform',
+                        help="how A/Z endpoints are drawn among the XPDRs")
+    parser.add_argument('--pair', nargs=2, metavar=('A_NODE', 'Z_NODE'), help="XPDRs of the 'fixed' distribution")
+    parser.add_argument('--warmup', type=int, default=10, help="requests sent before each run, not measured")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--load-roadms', type=int, default=0,
+                        help="generate and load a topology of that many ROADMs first (see topology_generator.py)")
+    parser.add_argument('--degrees', type=int, default=3)
+    parser.add_argument('--mesh-density', type=float, default=0.5)
+    parser.add_argument('--occupancy', type=float, default=0.0)
+    parser.add_argument('--max-candidate-paths', type=int, default=None,
+                        help="k-shortest candidate paths validated by the PCE for each request")
+    parser.add_argument('--max-hops-per-path', type=int, default=None, help="hop limit of the candidate paths")
+    parser.add_argument('--update-every', type=int, default=0,
+                        help="rewrite a ROADM-TO-ROADM link of the generated topology before every Nth request")
+    parser.add_argument('--start-controller', action='store_true', help="start (and stop) the controller")
+    parser.add_argument('--output', default=None,
+                        help="results file (default: pce_benchmark-<date>.json in the test work directory)")
+    parser.add_argument('--baseline', default=None, help="previous results file to compare the runs with")
+    args = parser.parse_args()
+    if args.distribution == 'fixed' and not args.pair:
+        parser.error("--distribution fixed needs --pair")
+    if args.update_every and not args.load_roadms:
+        parser.error("--update-every needs a generated topology (--load-roadms)")
+    # the request log writes would be measured with the path computations
+    test_utils.REQUEST_LOG = ''
+    processes = test_utils.start_tpce() if args.start_controller else []
+    try:
+        generator = None
+        if args.load_roadms:
+            generator = TopologyGenerator(args.load_roadms, degrees=args.degrees, mesh_density=args.mesh_density,
+                                          occupancy=args.occupancy, seed=args.seed)
+            load_generated_topology(generator)
+            endpoints = generated_endpoints(generator)
+        else:
+            endpoints = discover_endpoints()
+        print(str(len(endpoints)) + " XPDR endpoints")
+        baseline_runs = {}
+        if args.baseline:
+            with open(args.baseline, 'r') as baseline_file:
+                baseline_runs = {(run['concurrency'], run['distribution']): run
+                                 for run in json.load(baseline_file)['runs']}
+        results = {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+                   'restconf': test_utils.RESTCONF_BASE_URL,
+                   'topology': {'endpoints': len(endpoints),
+                                'generated': None if generator is None else {
+                                    'roadms': generator.roadms, 'degrees': generator.degrees,
+                                    'mesh_density': generator.mesh_density, 'occupancy': generator.occupancy,
+                                    'seed': generator.seed, 'nodes': generator.node_count,
+                                    'links': generator.link_count}},
+                   'runs': []}
+        tuning = {key: value for key, value in (('max-candidate-paths', args.max_candidate_paths),
+                                                ('max-hops-per-path', args.max_hops_per_path))
+                  if value is not None}
+        results['pce_tuning'] = tuning
+        for concurrency in args.concurrency:
+            run = run_benchmark(endpoints, args.requests, concurrency, args.distribution,
+                                seed=args.seed, pair=args.pair, warmup=args.warmup,
+                                update=span_link_updater(generator) if args.update_every else None,
+                                update_every=args.update_every, tuning=tuning)
+            results['runs'].append(run)
+            print_run(run, baseline_runs.get((concurrency, args.distribution)))
+    finally:
+        for process in processes:
+            test_utils.shutdown_process(process)
+    os.makedirs(test_utils.WORK_DIRECTORY, exist_ok=True)
+    output = args.output or os.path.join(
+        test_utils.WORK_DIRECTORY, "pce_benchmark-" + time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(output, 'w') as output_file:
+        json.dump(results, output_file, indent=2)
+    print("results written to " + output)
+
+
+if __name__ == "__main__":
+    main()
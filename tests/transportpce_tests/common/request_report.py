@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Slow RPC report of the RESTCONF requests recorded by test_utils.restconf_request()
+# with TPCE_RECORD_REQUESTS=True or by the scheduler workers, in JSONL file(s) of
+# one record per request:
+#   {"time": ..., "suite": ..., "method": "POST", "url": "/operations/transportpce-pce:path-computation-request",
+#    "rpc": "path-computation-request", "status": 200, "request_bytes": ..., "response_bytes": ...,
+#    "elapsed_ms": ...}
+# Requests are grouped by RPC name, or by method and data path for datastore accesses.
+#   python3 transportpce_tests/common/request_report.py restconf_requests-*.jsonl --top 15
+# Kept free of test_utils imports so that scheduler.py can use it directly.
+
+import argparse
+import collections
+import json
+import math
+import urllib.parse
+
+# datastore path segments kept in a data request name, list keys are mostly beyond
+DATA_PATH_DEPTH = 4
+
+
+def request_name(method, url):
+    # "service-path" for an RPC, "GET config/ietf-network:networks/network/openroadm-topology" for data
+    segments = urllib.parse.urlsplit(url).path.strip('/').split('/')
+    if segments[0] == 'restconf':
+        segments = segments[1:]
+    if segments[0] == 'operations' and len(segments) > 1:
+        return segments[1].rpartition(':')[2]
+    return method + " " + "/".join(segments[:DATA_PATH_DEPTH])
+
+
+def read_records(file_names, suite=None):
+    for file_name in file_names:
+        with open(file_name, 'r') as records:
+            for line in records:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # line cut by an interrupted run
+                    continue
+                if suite is None or suite in record.get('suite', ''):
+                    yield record
+
+
+def summarize(records):
+    grouped = collections.defaultdict(list)
+    for record in records:
+        grouped[record['rpc']].append(record)
+    summary = {}
+    for name, group in grouped.items():
+        latencies = sorted(record['elapsed_ms'] for record in group)
+        summary[name] = {'count': len(group),
+                         'total_ms': sum(latencies),
+                         'mean_ms': sum(latencies) / len(latencies),
+                         'p95_ms': latencies[max(math.ceil(0.95 * len(latencies)) - 1, 0)],
+                         'max_ms': latencies[-1],
+                         'errors': sum(1 for record in group
+                                       if not isinstance(record['status'], int) or record['status'] >= 400),
+                         'request_bytes': sum(record['request_bytes'] or 0 for record in group),
+                         'response_bytes': sum(record['response_bytes'] or 0 for record in group),
+                         'suites': sorted(set(record.get('suite', '') for record in group))}
+    return summary
+
+
+def print_report(summary, top=10):
+    if not summary:
+        print("no RESTCONF request recorded")
+        return
+    overall = sum(entry['total_ms'] for entry in summary.values())
+    print("{} RESTCONF requests, {:.1f}s in total".format(
+        sum(entry['count'] for entry in summary.values()), overall / 1000))
+    line = "  {:60.60} {:>6} {:>10} {:>9} {:>9} {:>9} {:>6}"
+    for title, key in (("slowest requests (p95)", 'p95_ms'), ("most total time", 'total_ms')):
+        print(title + ":")
+        print(line.format("request", "count", "total s", "mean ms", "p95 ms", "max ms", "errors"))
+        for name, entry in sorted(summary.items(), key=lambda item: -item[1][key])[:top]:
+            print(line.format(name, entry['count'], "{:.1f}".format(entry['total_ms'] / 1000),
+                              "{:.1f}".format(entry['mean_ms']), "{:.1f}".format(entry['p95_ms']),
+                              "{:.1f}".format(entry['max_ms']), entry['errors']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="slowest RESTCONF requests of recorded test runs")
+    parser.add_argument('files', nargs='+', help="JSONL request logs (TPCE_REQUEST_LOG)")
+    parser.add_argument('--top', type=int, default=10, help="requests listed per ranking")
+    parser.add_argument('--suite', default=None, help="only the requests of the suites containing this string")
+    parser.add_argument('--json', default=None, help="also write the per request summary to this file")
+    args = parser.parse_args()
+    summary = summarize(read_records(args.files, args.suite))
+    print_report(summary, args.top)
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump(summary, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Parallel scheduler for the functional test modules.
+# Each worker slot owns a copy of the controller build with its own ports, a
+# RESTCONF port, a simulators port range and a working directory for the logs,
+# all passed to test_utils through the environment. Modules are dispatched
+# longest first, using the durations recorded by the previous runs.
+# From the transportpce_tests directory, once the controller and honeynodes are built:
+#   python3 -m common.scheduler --jobs 4
+
+import argparse
+import glob
+import json
+import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from common import request_report
+
+TESTS_DIRECTORY = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", ".."))
+ROOT_DIRECTORY = os.path.dirname(TESTS_DIRECTORY)
+KARAF_ASSEMBLY = os.path.join(ROOT_DIRECTORY, "karaf", "target", "assembly")
+LIGHTY_ASSEMBLY = os.path.join(ROOT_DIRECTORY, "lighty", "target", "tpce")
+REFLECTWARN = os.path.join(TESTS_DIRECTORY, "reflectwarn.sh")
+
+# Same order as the py3 tox environment, test_gnpy.py needs a GNPy container.
+MODULES = [
+    "transportpce_tests/1.2.1/test_portmapping.py",
+    "transportpce_tests/1.2.1/test_topo_portmapping.py",
+    "transportpce_tests/1.2.1/test_topology.py",
+    "transportpce_tests/1.2.1/test_renderer_service_path_nominal.py",
+    "transportpce_tests/1.2.1/test_pce.py",
+    "transportpce_tests/1.2.1/test_olm.py",
+    "transportpce_tests/2.2.1/test_portmapping.py",
+    "transportpce_tests/2.2.1/test_topology.py",
+    "transportpce_tests/2.2.1/test_otn_topology.py",
+    "transportpce_tests/2.2.1/test_flex_grid.py",
+    "transportpce_tests/2.2.1/test_renderer_service_path_nominal.py",
+    "transportpce_tests/2.2.1/test_otn_renderer.py",
+    "transportpce_tests/2.2.1/test_otn_sh_renderer.py",
+    "transportpce_tests/2.2.1/test_olm.py",
+    "transportpce_tests/2.2.1/test_tapi.py",
+    "transportpce_tests/2.2.1/test_otn_end2end.py",
+    "transportpce_tests/1.2.1/test_end2end.py",
+    "transportpce_tests/2.2.1/test_end2end.py"]
+
+# Default ports of the controller, shifted by PORT_STRIDE * slot in each worker copy.
+CONTROLLER_PORTS = (8181, 8185, 8101, 1099, 44444, 2550)
+# Settings holding these ports in the assembly configuration files: only their
+# values are shifted, any other occurrence of the numbers is left as is.
+PORT_SETTINGS = (
+    # etc/*.cfg "key = value" and akka.conf "port = 2550"
+    re.compile(r'^(\s*(?:org\.osgi\.service\.http\.port|sshPort|rmiRegistryPort|rmiServerPort|websocket-port|port)'
+               r'\s*[=:]\s*)(\d+)\b', re.MULTILINE),
+    # akka.conf seed-nodes, which must follow the akka port of the member
+    re.compile(r'(akka\.tcp://[^@"]+@[^:"]+:)(\d+)\b'),
+    # etc/jetty.xml <Property name="jetty.port" default="8181"/>
+    re.compile(r'(<Property\s+name="jetty\.port"\s+default=")(\d+)(?=")'),
+)
+RESTCONF_PORT = 8181
+PORT_STRIDE = 1000
+CONTROLLER_CONFIG_FILES = ("etc/*.cfg", "etc/*.xml", "configuration/initial/akka.conf")
+# RESTCONF requests of all the workers, reported at the end of the run
+REQUEST_LOG = "restconf_requests.jsonl"
+
+
+def shift_ports(file_name, offset):
+    with open(file_name, 'r') as config:
+        content = config.read()
+    shifted = content
+    for setting in PORT_SETTINGS:
+        shifted = setting.sub(
+            lambda match: match.group(1) + (str(int(match.group(2)) + offset)
+                                            if int(match.group(2)) in CONTROLLER_PORTS else match.group(2)),
+            shifted)
+    if shifted != content:
+        with open(file_name, 'w') as config:
+            config.write(shifted)
+
+
+def prepare_karaf(worker_directory, offset):
+    karaf_home = os.path.join(worker_directory, "karaf")
+    if not os.path.isdir(karaf_home):
+        shutil.copytree(KARAF_ASSEMBLY, karaf_home, symlinks=True,
+                        ignore=shutil.ignore_patterns("data"))
+        for pattern in CONTROLLER_CONFIG_FILES:
+            for file_name in glob.glob(os.path.join(karaf_home, pattern)):
+                shift_ports(file_name, offset)
+        # tox sources reflectwarn.sh relatively to the original assembly location
+        executable = os.path.join(karaf_home, "bin", "karaf")
+        with open(executable, 'r') as script:
+            content = script.read()
+        with open(executable, 'w') as script:
+            script.write(content.replace("$(dirname $0)/../../../../tests/reflectwarn.sh", REFLECTWARN))
+    return {'TPCE_KARAF_HOME': karaf_home}
+
+
+def prepare_lighty(worker_directory, offset):
+    lighty_home = os.path.join(worker_directory, "lighty")
+    if not os.path.isdir(lighty_home):
+        shutil.copytree(LIGHTY_ASSEMBLY, lighty_home, symlinks=True)
+    config_file = os.path.join(worker_directory, "restconf.json")
+    with open(config_file, 'w') as config:
+        json.dump({"restconf": {"inetAddress": "0.0.0.0",
+                                "httpPort": RESTCONF_PORT + offset,
+                                "webSocketPort": 8185 + offset,
+                                "restconfServletContextPath": "/restconf",
+                                "jsonRestconfServiceType": "DRAFT_02"}}, config)
+    return {'TPCE_LIGHTY_HOME': lighty_home, 'TPCE_LIGHTY_CONFIG': config_file}
+
+
+class Worker(threading.Thread):
+
+    def __init__(self, slot, work_directory, modules, results):
+        super().__init__(name="worker-" + str(slot), daemon=True)
+        self.slot = slot
+        self.offset = PORT_STRIDE * slot
+        self.directory = os.path.join(work_directory, "worker-" + str(slot))
+        self.request_log = os.path.join(work_directory, REQUEST_LOG)
+        self.modules = modules
+        self.results = results
+
+    def environment(self):
+        env = dict(os.environ)
+        env.update({'TPCE_RESTCONF_PORT': str(RESTCONF_PORT + self.offset),
+                    'TPCE_SIM_PORT_OFFSET': str(self.offset),
+                    'TPCE_WORK_DIRECTORY': self.directory,
+                    'TPCE_REQUEST_LOG': self.request_log})
+        if self.slot:
+            # slot 0 keeps the original build and the default ports
+            if env.get('USE_LIGHTY') == 'True':
+                env.update(prepare_lighty(self.directory, self.offset))
+            else:
+                env.update(prepare_karaf(self.directory, self.offset))
+        return env
+
+    def run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        env = self.environment()
+        while True:
+            try:
+                module = self.modules.get_nowait()
+            except queue.Empty:
+                return
+            name = module.replace("transportpce_tests/", "").replace("/", "_")[:-len(".py")]
+            print("[" + self.name + "] starting " + module, flush=True)
+            start = time.monotonic()
+            with open(os.path.join(self.directory, name + ".out"), 'w') as output:
+                returncode = subprocess.call(
+                    [sys.executable, "-m", "nose", "--with-xunit",
+                     "--xunit-file=" + os.path.join(self.directory, name + ".xml"), module],
+                    cwd=TESTS_DIRECTORY, env=dict(env, TPCE_SUITE=module), stdout=output, stderr=subprocess.STDOUT)
+            duration = time.monotonic() - start
+            self.results[module] = {'worker': self.slot, 'returncode': returncode, 'duration': duration}
+            print("[" + self.name + "] " + module + (" passed" if returncode == 0 else " FAILED")
+                  + " in {:.0f}s".format(duration), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="run the functional test modules in parallel workers")
+    parser.add_argument('modules', nargs='*', default=MODULES, help="test modules (default: the py3 tox list)")
+    parser.add_argument('--jobs', '-j', type=int, default=max(os.cpu_count() // 4, 1),
+                        help="number of worker slots, each running its own controller")
+    parser.add_argument('--work-directory', default=os.path.join(TESTS_DIRECTORY, "parallel_run"),
+                        help="where worker copies, logs and xunit reports are written")
+    args = parser.parse_args()
+    # clean-start-controller.sh changes to its own directory before starting lighty
+    args.work_directory = os.path.abspath(args.work_directory)
+    os.makedirs(args.work_directory, exist_ok=True)
+    durations_file = os.path.join(args.work_directory, "durations.json")
+    durations = {}
+    if os.path.isfile(durations_file):
+        with open(durations_file, 'r') as previous:
+            durations = json.load(previous)
+    modules = queue.Queue()
+    for module in sorted(args.modules, key=lambda module: -durations.get(module, float('inf'))):
+        modules.put(module)
+    results = {}
+    request_log = os.path.join(args.work_directory, REQUEST_LOG)
+    if os.path.isfile(request_log):
+        os.remove(request_log)
+    start = time.monotonic()
+    workers = [Worker(slot, args.work_directory, modules, results) for slot in range(args.jobs)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.monotonic() - start
+    durations.update({module: result['duration'] for module, result in results.items()})
+    with open(durations_file, 'w') as current:
+        json.dump(durations, current, indent=2)
+    failed = sorted(module for module, result in results.items() if result['returncode'] != 0)
+    print("{} modules in {:.0f}s with {} workers (sequential sum {:.0f}s)".format(
+        len(results), elapsed, args.jobs, sum(result['duration'] for result in results.values())))
+    if os.path.isfile(request_log):
+        request_report.print_report(request_report.summarize(request_report.read_records([request_log])))
+    for module in failed:
+        print("FAILED: " + module)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
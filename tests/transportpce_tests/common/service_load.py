@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Concurrent service-create/service-delete load driver.
+# Uniquely named copies of the cr_serv_sample_data template of an end2end
+# suite are created, then deleted, by concurrent workers. The provisioning
+# time of each service is split into stages using the PCE and renderer
+# notifications (common/notification_stream.py) and the service list:
+#   pce       service-create sent -> path computation result
+#   renderer  path computation result -> "Olm power setup" renderer notification
+#   olm       OLM power setup start -> renderer service implementation result
+#   activate  renderer result -> inService in the service list
+# Services provisioned at the same time must not compete for the same ports:
+# the services are spread over the endpoint pairs of an --endpoints JSON file,
+# a list of [service-a-end, service-z-end] objects whose fields replace the
+# template ones, e.g.
+#   [[{"node-id": "XPDR-A1", "clli": "NodeA"}, {"node-id": "XPDR-C1", "clli": "NodeC"}], ...]
+# Without it, all the services use the template ends.
+# From a transportpce_tests/<version> directory, once the end2end suite setup
+# (devices mounted, XPDR-ROADM links created) is in place:
+#   python -m common.service_load --template test_end2end --services 20 --concurrency 5 --endpoints pairs.json
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import datetime
+import importlib
+import json
+import os
+import time
+import uuid
+
+import requests
+
+from common import test_utils
+from common.notification_stream import NotificationListener
+from common.pce_benchmark import latency_summary
+
+POLL_INTERVAL = 0.2
+CREATE_STAGES = ('pce', 'renderer', 'olm', 'activate', 'total')
+DELETE_STAGES = ('renderer', 'removed', 'total')
+
+
+def load_template(module_name):
+    # cr_serv_sample_data class attribute of the test case of an end2end suite
+    module = importlib.import_module(module_name)
+    for value in vars(module).values():
+        if isinstance(value, type) and hasattr(value, 'cr_serv_sample_data'):
+            return value.cr_serv_sample_data
+    raise ValueError("no cr_serv_sample_data template found in " + module_name)
+
+
+def load_endpoints(file_name):
+    with open(file_name, 'r') as endpoints_file:
+        return [(a_end, z_end) for a_end, z_end in json.load(endpoints_file)]
+
+
+def service_request(template, servicename, endpoints=None):
+    data = copy.deepcopy(template)
+    data["input"]["service-name"] = servicename
+    data["input"]["sdnc-request-header"]["request-id"] = str(uuid.uuid4())
+    if endpoints is not None:
+        data["input"]["service-a-end"].update(copy.deepcopy(endpoints[0]))
+        data["input"]["service-z-end"].update(copy.deepcopy(endpoints[1]))
+    return data
+
+
+def service_state(servicename):
+    response = test_utils.get_service_list_request("services/" + servicename)
+    if response.status_code != requests.codes.ok:
+        return None
+    return response.json()['services'][0].get('operational-state')
+
+
+class ServiceLoad:
+
+    def __init__(self, template, listener=None, timeout=300, hold=0, delete=True, endpoints=None):
+        # pylint: disable=too-many-arguments
+        self.template = template
+        # the i-th service uses the (i modulo number of pairs)-th endpoint pair
+        self.endpoints = endpoints or [None]
+        self.listener = listener
+        self.timeout = timeout
+        self.hold = hold
+        self.delete = delete
+
+    def _event_time(self, servicename, notification, since, **fields):
+        if self.listener is None:
+            return None
+        event = self.listener.wait_for_event(
+            lambda event: (event.get('service-name') == servicename and event.get('notification') == notification
+                           and all(event.get(key) == value or (callable(value) and value(event.get(key)))
+                                   for key, value in fields.items())),
+            timeout=0, since=since)
+        return None if event is None else event['monotonic']
+
+    def _create_failed(self, servicename, since):
+        return lambda: (
+            self._event_time(servicename, 'service-path-rpc-result', since, status='Failed',
+                             **{'notification-type': 'path-computation-request'}) is not None
+            or self._event_time(servicename, 'renderer-rpc-result-sp', since, status='Failed',
+                                **{'notification-type': 'service-implementation-request'}) is not None)
+
+    def _state_reached(self, servicename, predicate, deadline, failed):
+        # Time at which predicate(operational-state) held, None on timeout or
+        # as soon as failed() reports a failure notification.
+        while time.monotonic() < deadline:
+            if predicate(service_state(servicename)):
+                return time.monotonic()
+            if failed():
+                return None
+            time.sleep(POLL_INTERVAL)
+        return None
+
+    def create(self, servicename, endpoints=None):
+        since = len(self.listener.events) if self.listener is not None else 0
+        start = time.monotonic()
+        response = test_utils.service_create_request(service_request(self.template, servicename, endpoints))
+        result = {'service-name': servicename, 'create': {}, 'delete': {}}
+        if response.status_code != requests.codes.ok:
+            result['failure'] = "service-create http-" + str(response.status_code)
+            return result
+        in_service = self._state_reached(servicename, lambda state: state == 'inService',
+                                         start + self.timeout,
+                                         self._create_failed(servicename, since))
+        pce_done = self._event_time(servicename, 'service-path-rpc-result', since,
+                                    **{'notification-type': 'path-computation-request'})
+        olm_start = self._event_time(servicename, 'renderer-rpc-result-sp', since,
+                                     **{'status-message': lambda message: (message or "").startswith("Olm power")})
+        rendered = self._event_time(servicename, 'renderer-rpc-result-sp', since, status='Successful',
+                                    **{'notification-type': 'service-implementation-request'})
+        result['create'] = self._stages(start, (('pce', pce_done), ('renderer', olm_start), ('olm', rendered),
+                                                ('activate', in_service)), in_service)
+        if in_service is None:
+            result['failure'] = "service-create did not reach inService"
+        return result
+
+    def remove(self, servicename, result):
+        since = len(self.listener.events) if self.listener is not None else 0
+        start = time.monotonic()
+        response = test_utils.service_delete_request(servicename)
+        if response.status_code != requests.codes.ok:
+            result['failure'] = "service-delete http-" + str(response.status_code)
+            return result
+        removed = self._state_reached(servicename, lambda state: state is None, start + self.timeout,
+                                      lambda: False)
+        rendered = self._event_time(servicename, 'renderer-rpc-result-sp', since, status='Successful',
+                                    **{'notification-type': 'service-delete'})
+        result['delete'] = self._stages(start, (('renderer', rendered), ('removed', removed)), removed)
+        if removed is None:
+            result['failure'] = "service-delete did not remove the service"
+        return result
+
+    @staticmethod
+    def _stages(start, milestones, end):
+        # Each stage lasts from the previous known milestone to its own one.
+        stages = {}
+        previous = start
+        for stage, milestone in milestones:
+            if milestone is not None:
+                stages[stage] = milestone - previous
+                previous = milestone
+        if end is not None:
+            stages['total'] = end - start
+        return stages
+
+    def run_service(self, servicename, endpoints=None):
+        result = self.create(servicename, endpoints)
+        if 'failure' not in result:
+            time.sleep(self.hold)
+        if self.delete and result['create'].get('total') is not None:
+            self.remove(servicename, result)
+        return result
+
+    def run(self, count, concurrency, prefix):
+        results = []
+        start = time.monotonic()
+        # test_utils.post_request() prints every request body
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(self.run_service, prefix + "-" + str(index),
+                                           self.endpoints[index % len(self.endpoints)])
+                           for index in range(count)]
+                for future in concurrent.futures.as_completed(futures):
+                    results.append(future.result())
+        duration = time.monotonic() - start
+        return summarize(results, count, concurrency, duration)
+
+
+def summarize(results, count, concurrency, duration):
+    failures = collections.Counter(result['failure'] for result in results if 'failure' in result)
+    created = [result for result in results if result['create'].get('total') is not None]
+    return {'services': count,
+            'concurrency': concurrency,
+            'duration_s': duration,
+            'created': len(created),
+            'success_rate': (count - sum(failures.values())) / count if count else 0.0,
+            'failures': dict(failures),
+            'create_throughput_sps': len(created) / duration if duration else 0.0,
+            'create_stages_ms': {stage: latency_summary([result['create'][stage] for result in created
+                                                         if stage in result['create']])
+                                 for stage in CREATE_STAGES},
+            'delete_stages_ms': {stage: latency_summary([result['delete'][stage] for result in results
+                                                         if stage in result['delete']])
+                                 for stage in DELETE_STAGES},
+            'per_service': sorted(results, key=lambda result: result['service-name'])}
+
+
+def print_summary(summary):
+    print("{created}/{services} services created with concurrency {concurrency} in {duration_s:.1f}s "
+          "({create_throughput_sps:.2f} services/s)".format(**summary))
+    for kind in ('create_stages_ms', 'delete_stages_ms'):
+        for stage, latency in summary[kind].items():
+            if latency['count']:
+                print("  {:6} {:8} p50 {:9.1f} ms  p95 {:9.1f} ms  p99 {:9.1f} ms  max {:9.1f} ms".format(
+                    kind.split('_')[0], stage, latency['p50'], latency['p95'], latency['p99'], latency['max']))
+    for failure, number in summary['failures'].items():
+        print("  {} x {}".format(number, failure))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="concurrent service-create/service-delete load driver")
+    parser.add_argument('--template', default="test_end2end",
+                        help="test module providing the cr_serv_sample_data service template")
+    parser.add_argument('--services', type=int, default=10, help="number of services to create")
+    parser.add_argument('--concurrency', type=int, default=5, help="services provisioned at the same time")
+    parser.add_argument('--hold', type=float, default=0, help="seconds a service is kept before its deletion")
+    parser.add_argument('--no-delete', action='store_true', help="keep the created services")
+    parser.add_argument('--timeout', type=float, default=300, help="per service create or delete timeout")
+    parser.add_argument('--prefix', default="load-" + time.strftime("%H%M%S"), help="service names prefix")
+    parser.add_argument('--no-notifications', action='store_true',
+                        help="only use the service list, stages other than 'total' are then not reported")
+    parser.add_argument('--endpoints', default=None,
+                        help="JSON file of the [service-a-end, service-z-end] pairs the services are spread over")
+    parser.add_argument('--output', default=None,
+                        help="results file (default: service_load-<date>.json in the work directory)")
+    args = parser.parse_args()
+    endpoints = load_endpoints(args.endpoints) if args.endpoints else None
+    distinct = len(set(json.dumps(pair, sort_keys=True) for pair in endpoints)) if endpoints else 1
+    if args.concurrency > distinct:
+        print("warning: concurrency {} above the {} distinct endpoint pair(s), concurrent services share their "
+              "ports and mostly measure path computation failures".format(args.concurrency, distinct))
+    listener = None
+    if not args.no_notifications:
+        try:
+            listener = NotificationListener().start()
+        except (ConnectionError, requests.exceptions.RequestException) as err:
+            print("notifications unavailable, only the service list is used: " + str(err))
+    test_utils.configure_session(pool_size=max(2 * args.concurrency, test_utils.HTTP_POOL_SIZE))
+    try:
+        load = ServiceLoad(load_template(args.template), listener, args.timeout, args.hold, not args.no_delete,
+                           endpoints)
+        summary = load.run(args.services, args.concurrency, args.prefix)
+    finally:
+        if listener is not None:
+            listener.stop()
+    summary['date'] = datetime.datetime.now().isoformat(timespec='seconds')
+    summary['notifications'] = listener is not None
+    summary['endpoint_pairs'] = distinct
+    print_summary(summary)
+    if args.output is None:
+        os.makedirs(test_utils.WORK_DIRECTORY, exist_ok=True)
+    output = args.output or os.path.join(
+        test_utils.WORK_DIRECTORY, "service_load-" + time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(output, 'w') as output_file:
+        json.dump(summary, output_file, indent=2)
+    print("results written to " + output)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,29 +11,50 @@
 
 # pylint: disable=no-member
 
+import atexit
+import hashlib
 import json
 import os
 import sys
 import re
 import signal
+import socket
 import subprocess
+import tempfile
+import threading
 import time
+import zlib
 
 import psutil
 import requests
+from urllib3.util.retry import Retry
 
 import simulators
+from common import log_watcher
+from common import request_report
 
 SIMS = simulators.SIMS
 HONEYNODE_EXECUTABLE = simulators.HONEYNODE_EXECUTABLE
 SAMPLES_DIRECTORY = simulators.SAMPLES_DIRECTORY
+# 'honeynode' or 'lightweight' (common/netconf_simulator.py), can be overridden per SIMS entry
+SIMULATOR = os.environ.get('TPCE_SIMULATOR', 'honeynode')
+LIGHTWEIGHT_SIMULATOR_EXECUTABLE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "netconf_simulator.py")
 
 HONEYNODE_OK_START_MSG = "Netconf SSH endpoint started successfully at 0.0.0.0"
 KARAF_OK_START_MSG = re.escape(
     "Blueprint container for bundle org.opendaylight.netconf.restconf")+".* was successfully created"
 LIGHTY_OK_START_MSG = re.escape("lighty.io and RESTCONF-NETCONF started")
 
-RESTCONF_BASE_URL = "http://localhost:8181/restconf"
+# A parallel worker (common/scheduler.py) gets its own RESTCONF port, simulators
+# port offset, controller copy and working directory through the environment.
+RESTCONF_PORT = int(os.environ.get('TPCE_RESTCONF_PORT', 8181))
+SIM_PORT_OFFSET = int(os.environ.get('TPCE_SIM_PORT_OFFSET', 0))
+# 'static' uses the SIMS ports (shifted by SIM_PORT_OFFSET), 'dynamic' asks the
+# system for free ones so that several fleets can share a host, see allocate_sim().
+PORT_ALLOCATION = os.environ.get('TPCE_PORT_ALLOCATION', 'static')
+# Not a constant: changed by set_restconf_base_url() when attaching to a harness
+# or starting lighty on a dynamically allocated port.
+RESTCONF_BASE_URL = "http://localhost:" + str(RESTCONF_PORT) + "/restconf"
 ODL_LOGIN = "admin"
 ODL_PWD = "admin"
 NODES_LOGIN = "admin"
@@ -51,54 +72,191 @@ URL_SERVICE_PATH = "{}/operations/transportpce-device-renderer:service-path"
 URL_OTN_SERVICE_PATH = "{}/operations/transportpce-device-renderer:otn-service-path"
 URL_CREATE_OTS_OMS = "{}/operations/transportpce-device-renderer:create-ots-oms"
 URL_PATH_COMPUTATION_REQUEST = "{}/operations/transportpce-pce:path-computation-request"
+URL_PATH_COMPUTATION_BATCH_REQUEST = "{}/operations/transportpce-pce:path-computation-batch-request"
 URL_FULL_PORTMAPPING = "{}/config/transportpce-portmapping:network"
 
+GET_CACHE_URLS = (URL_CONFIG_ORDM_TOPO, URL_CONFIG_OTN_TOPO, URL_CONFIG_CLLI_NET, URL_CONFIG_ORDM_NET,
+                  URL_FULL_PORTMAPPING)
+
 TYPE_APPLICATION_JSON = {'Content-Type': 'application/json', 'Accept': 'application/json'}
 TYPE_APPLICATION_XML = {'Content-Type': 'application/xml', 'Accept': 'application/xml'}
 
 CODE_SHOULD_BE_200 = 'Http status code should be 200'
 CODE_SHOULD_BE_201 = 'Http status code should be 201'
 
-LOG_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
-
-KARAF_LOG = os.path.join(
+HTTP_POOL_SIZE = int(os.environ.get('TPCE_HTTP_POOL_SIZE', 10))
+HTTP_RETRIES = int(os.environ.get('TPCE_HTTP_RETRIES', 3))
+HTTP_BACKOFF = float(os.environ.get('TPCE_HTTP_BACKOFF', 0.3))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Opt-in cache of the successful GETs of the topologies and portmapping, dropped
+# by any other request, by mount/unmount and whenever a wait_for() ends since the
+# controller may then have changed them on its own. The decoded JSON of a
+# cached response is shared by all its readers and must not be modified.
+GET_CACHE = os.environ.get('TPCE_GET_CACHE', 'False') == 'True'
+GET_CACHE_TTL = float(os.environ.get('TPCE_GET_CACHE_TTL', 30))
+UPLOAD_GZIP = os.environ.get('TPCE_UPLOAD_GZIP', 'False') == 'True'
+# Base URL of a common/notification_receiver.py instance, taken from the harness
+# daemon when attaching to it. The service state predicates then long-poll it
+# before reading the service list.
+NOTIFICATION_RECEIVER = os.environ.get('TPCE_NOTIFICATION_RECEIVER')
+NOTIFICATION_POLL_TIMEOUT = 5
+
+LOG_DIRECTORY = os.environ.get('TPCE_WORK_DIRECTORY', os.path.dirname(os.path.realpath(__file__)))
+HARNESS_STATE_FILE = os.path.join(LOG_DIRECTORY, "harness.json")
+# Files kept by the helpers between requests or runs (upload cache, request log,
+# load and benchmark results), out of the source tree unless a work directory is given.
+WORK_DIRECTORY = os.environ.get('TPCE_WORK_DIRECTORY', os.path.join(tempfile.gettempdir(), "transportpce_tests"))
+# Opt-in: with TPCE_RECORD_REQUESTS=True, every restconf_request() is appended to
+# a JSONL file of this run in WORK_DIRECTORY, see common/request_report.py. The
+# scheduler gives the log of its run to all its workers in TPCE_REQUEST_LOG and
+# reports it itself. The suite is given by the scheduler or taken from the
+# nosetests command line.
+REQUEST_LOG = os.environ.get('TPCE_REQUEST_LOG') or (
+    os.path.join(WORK_DIRECTORY, "restconf_requests-{}-{}.jsonl".format(time.strftime("%Y%m%d-%H%M%S"), os.getpid()))
+    if os.environ.get('TPCE_RECORD_REQUESTS') == 'True' else '')
+# a log given by the scheduler is reported by the scheduler
+REQUEST_LOG_REPORT = 'TPCE_REQUEST_LOG' not in os.environ
+REQUEST_SUITE = os.environ.get('TPCE_SUITE') or next(
+    (arg for arg in reversed(sys.argv) if arg.endswith(".py")), os.path.basename(sys.argv[0]))
+UPLOAD_CACHE_DIRECTORY = os.environ.get('TPCE_UPLOAD_CACHE', os.path.join(WORK_DIRECTORY, "upload_cache"))
+ODL_LOG = os.path.join(os.environ.get('TPCE_WORK_DIRECTORY', ''), 'odl.log')
+
+KARAF_HOME = os.environ.get('TPCE_KARAF_HOME', os.path.join(
     os.path.dirname(os.path.realpath(__file__)),
-    "..", "..", "..", "karaf", "target", "assembly", "data", "log", "karaf.log")
+    "..", "..", "..", "karaf", "target", "assembly"))
+LIGHTY_HOME = os.environ.get('TPCE_LIGHTY_HOME', os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "..", "..", "..", "lighty", "target", "tpce"))
+LIGHTY_CONFIG = os.environ.get('TPCE_LIGHTY_CONFIG')
+KARAF_LOG = os.path.join(KARAF_HOME, "data", "log", "karaf.log")
 
 process_list = []
+# sim name -> {'port': ..., 'logfile': ...} actually used by this run
+SIMS_REGISTRY = {}
+_ALLOCATED_PORTS = set()
+_SESSION = None
+WAIT_STATS = {'count': 0, 'waited': 0.0, 'replaced': 0.0, 'saved': 0.0}
+# formatted url and headers -> (monotonic time, response)
+_GET_CACHE = {}
+_GET_CACHE_LOCK = threading.Lock()
+GET_CACHE_STATS = {'hits': 0, 'misses': 0, 'invalidations': 0, 'saved_bytes': 0, 'writes': 0}
+_REQUEST_LOG_LOCK = threading.Lock()
+_REQUEST_LOG_FILE = None
+# service name -> time of its last service-create or service-delete request
+SERVICE_REQUEST_TIMES = {}
+# (service name, state, request time) long-polled in vain, not long-polled again
+_NOTIFICATION_MISSES = set()
 
 if "USE_LIGHTY" in os.environ and os.environ['USE_LIGHTY'] == 'True':
-    TPCE_LOG = 'odl.log'
+    TPCE_LOG = ODL_LOG
 else:
     TPCE_LOG = KARAF_LOG
 
 
-def start_sims(sims_list):
+def free_port():
+    # The port is only reserved for this process: another one may still grab it
+    # before the simulator binds it, which start_sims() reports as a start failure.
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('', 0))
+            port = sock.getsockname()[1]
+        if port not in _ALLOCATED_PORTS:
+            _ALLOCATED_PORTS.add(port)
+            return port
+
+
+def allocate_sim(sim):
+    if sim not in SIMS_REGISTRY:
+        if PORT_ALLOCATION == 'dynamic':
+            port = str(free_port())
+            root, extension = os.path.splitext(SIMS[sim]['logfile'])
+            log_file = os.path.join(LOG_DIRECTORY, root + "-" + port + extension)
+        else:
+            port = str(int(SIMS[sim]['port']) + SIM_PORT_OFFSET)
+            log_file = os.path.join(LOG_DIRECTORY, SIMS[sim]['logfile'])
+        SIMS_REGISTRY[sim] = {'port': port, 'logfile': log_file}
+    return SIMS_REGISTRY[sim]
+
+
+def sim_port(sim):
+    return allocate_sim(sim)['port']
+
+
+def sim_log_file(sim):
+    return allocate_sim(sim)['logfile']
+
+
+def set_restconf_base_url(url):
+    # pylint: disable=global-statement
+    global RESTCONF_BASE_URL
+    RESTCONF_BASE_URL = url
+
+
+def start_sims(sims_list, time_to_wait=100):
+    # All simulators are launched at once and their start-up messages awaited
+    # concurrently against a single deadline.
+    harness = get_harness()
+    if harness is not None:
+        # simulators of the harness pool are already running
+        SIMS_REGISTRY.update(harness['registry'])
+        sims_list = [sim for sim in sims_list if sim not in harness['sims']]
+    starting = {}
+    timings = {}
     for sim in sims_list:
         print("starting simulator for " + sim + "...")
-        log_file = os.path.join(LOG_DIRECTORY, SIMS[sim]['logfile'])
-        process = start_honeynode(log_file, SIMS[sim]['port'], SIMS[sim]['configfile'])
-        if wait_until_log_contains(log_file, HONEYNODE_OK_START_MSG, 100):
-            print("simulator for " + sim + " started")
+        log_file = sim_log_file(sim)
+        launch_time = time.monotonic()
+        if SIMS[sim].get('simulator', SIMULATOR) == 'lightweight':
+            process = start_lightweight_simulator(log_file, sim_port(sim), SIMS[sim]['configfile'])
         else:
+            process = start_honeynode(log_file, sim_port(sim), SIMS[sim]['configfile'])
+        # start_honeynode re-creates the log file: all of its content is new
+        bookmark = log_watcher.LogBookmark(os.path.realpath(log_file), None, 0)
+        subscription = subscribe_log(
+            log_file, HONEYNODE_OK_START_MSG,
+            lambda line, sim=sim, launch_time=launch_time: timings.setdefault(sim, time.monotonic() - launch_time))
+        starting[sim] = (process, bookmark, subscription, launch_time)
+    deadline = time.monotonic() + time_to_wait
+    failed = []
+    for sim, (process, bookmark, subscription, launch_time) in starting.items():
+        if log_watcher.scan_from_bookmark(bookmark, HONEYNODE_OK_START_MSG) is not None:
+            subscription.cancel()
+            timings.setdefault(sim, time.monotonic() - launch_time)
+        elif subscription.wait(timeout=max(deadline - time.monotonic(), 0)) is None:
+            failed.append(sim)
+        else:
+            timings.setdefault(sim, time.monotonic() - launch_time)
+    for sim in sims_list:
+        if sim in failed:
             print("simulator for " + sim + " failed to start")
+        else:
+            print("simulator for " + sim + " started in {:.1f}s".format(timings[sim]))
+    if failed:
+        for process, _, _, _ in starting.values():
             shutdown_process(process)
-            for pid in process_list:
-                shutdown_process(pid)
-            sys.exit(3)
-        process_list.append(process)
+        for pid in process_list:
+            shutdown_process(pid)
+        sys.exit(3)
+    process_list.extend(process for process, _, _, _ in starting.values())
     return process_list
 
 
 def start_tpce():
+    harness = get_harness()
+    if harness is not None:
+        print("attaching to the OpenDaylight instance of harness daemon " + str(harness['pid']) + "...")
+        set_restconf_base_url(harness['restconf'])
+        set_notification_receiver(harness.get('notifications'))
+        reset_controller_state()
+        return process_list
     print("starting OpenDaylight...")
     if "USE_LIGHTY" in os.environ and os.environ['USE_LIGHTY'] == 'True':
+        subscription = subscribe_log(TPCE_LOG, LIGHTY_OK_START_MSG)
         process = start_lighty()
-        start_msg = LIGHTY_OK_START_MSG
     else:
+        subscription = subscribe_log(TPCE_LOG, KARAF_OK_START_MSG)
         process = start_karaf()
-        start_msg = KARAF_OK_START_MSG
-    if wait_until_log_contains(TPCE_LOG, start_msg, time_to_wait=60):
+    if wait_for_log_subscription(subscription, time_to_wait=60):
         print("OpenDaylight started !")
     else:
         print("OpenDaylight failed to start !")
@@ -110,106 +268,417 @@ def start_tpce():
     return process_list
 
 
+def get_harness():
+    # Warm controller and simulators kept by common/harness_daemon.py, only used
+    # when TPCE_USE_HARNESS=True and the daemon serves the same simulators version.
+    if os.environ.get('TPCE_USE_HARNESS') != 'True' or not os.path.isfile(HARNESS_STATE_FILE):
+        return None
+    with open(HARNESS_STATE_FILE, 'r') as state_file:
+        harness = json.load(state_file)
+    if not psutil.pid_exists(harness['pid']) or harness['samples'] != os.path.realpath(SAMPLES_DIRECTORY):
+        return None
+    return harness
+
+
+def reset_controller_state():
+    # Bring a reused controller back to a freshly started state between test modules.
+    response = get_service_list_request("")
+    if response.status_code == requests.codes.ok:
+        for service in response.json()['service-list'].get('services', []):
+            service_delete_request(service['service-name'])
+            wait_for(service_deleted(service['service-name']), timeout=60)
+    response = get_request(URL_CONFIG_NETCONF_TOPO)
+    if response.status_code == requests.codes.ok:
+        for node in response.json()['topology'][0].get('node', []):
+            unmount_device(node['node-id'])
+    for url in (URL_CONFIG_ORDM_TOPO, URL_CONFIG_OTN_TOPO, URL_CONFIG_CLLI_NET, URL_CONFIG_ORDM_NET):
+        response = get_request(url)
+        if response.status_code == requests.codes.ok:
+            network = response.json()['network'][0]
+            network.pop('node', None)
+            network.pop('ietf-network-topology:link', None)
+            put_request(url, {'network': [network]})
+    delete_request(URL_FULL_PORTMAPPING)
+    print("controller state reset")
+
+
+SNAPSHOT_NETWORK_URLS = (URL_CONFIG_ORDM_NET, URL_CONFIG_CLLI_NET, URL_CONFIG_ORDM_TOPO, URL_CONFIG_OTN_TOPO)
+
+
+def snapshot_datastores():
+    # Capture the controller config state so that an expensive setup (devices
+    # mounted, XPDR-ROADM links created...) can be restored instead of replayed.
+    snapshot = {}
+    for url in (URL_CONFIG_NETCONF_TOPO, URL_FULL_PORTMAPPING, URL_OPER_SERV_LIST) + SNAPSHOT_NETWORK_URLS:
+        response = get_request(url)
+        snapshot[url] = response.json() if response.status_code == requests.codes.ok else None
+    return snapshot
+
+
+def save_snapshot(snapshot, file_name):
+    with open(file_name, 'w') as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+
+
+def load_snapshot(file_name):
+    with open(file_name, 'r') as snapshot_file:
+        return json.load(snapshot_file)
+
+
+def restore_datastores(snapshot):
+    # The service list lives in the operational datastore and cannot be written
+    # through RESTCONF: services created since the snapshot are deleted, the ones
+    # deleted since then can only be reported.
+    current = get_request(URL_OPER_SERV_LIST)
+    current_services = (set(service['service-name'] for service in current.json()['service-list'].get('services', []))
+                        if current.status_code == requests.codes.ok else set())
+    saved_services = (set(service['service-name']
+                          for service in snapshot[URL_OPER_SERV_LIST]['service-list'].get('services', []))
+                      if snapshot[URL_OPER_SERV_LIST] else set())
+    for servicename in current_services - saved_services:
+        service_delete_request(servicename)
+        wait_for(service_deleted(servicename), timeout=60)
+    for servicename in saved_services - current_services:
+        print("service " + servicename + " cannot be restored from a snapshot", end='... ', flush=True)
+    # Only the devices mounted or unmounted since the snapshot are touched.
+    current = get_request(URL_CONFIG_NETCONF_TOPO)
+    current_nodes = (set(node['node-id'] for node in current.json()['topology'][0].get('node', []))
+                     if current.status_code == requests.codes.ok else set())
+    saved_nodes = ({node['node-id']: node for node in snapshot[URL_CONFIG_NETCONF_TOPO]['topology'][0].get('node', [])}
+                   if snapshot[URL_CONFIG_NETCONF_TOPO] else {})
+    for node_id in current_nodes - set(saved_nodes):
+        unmount_device(node_id)
+    for node_id in set(saved_nodes) - current_nodes:
+        put_request(URL_CONFIG_NETCONF_TOPO + "node/" + node_id, {"node": [saved_nodes[node_id]]})
+        wait_for(netconf_node_connected(node_id), timeout=60)
+    for url in (URL_FULL_PORTMAPPING,) + SNAPSHOT_NETWORK_URLS:
+        if snapshot[url] is None:
+            delete_request(url)
+        else:
+            put_request(url, snapshot[url])
+
+
 def start_karaf():
     print("starting KARAF TransportPCE build...")
-    executable = os.path.join(
-        os.path.dirname(os.path.realpath(__file__)),
-        "..", "..", "..", "karaf", "target", "assembly", "bin", "karaf")
-    with open('odl.log', 'w') as outfile:
+    executable = os.path.join(KARAF_HOME, "bin", "karaf")
+    with open(ODL_LOG, 'w') as outfile:
         return subprocess.Popen(
             ["sh", executable, "server"], stdout=outfile, stderr=outfile, stdin=None)
 
 
 def start_lighty():
     print("starting LIGHTY.IO TransportPCE build...")
-    executable = os.path.join(
-        os.path.dirname(os.path.realpath(__file__)),
-        "..", "..", "..", "lighty", "target", "tpce",
-        "clean-start-controller.sh")
-    with open('odl.log', 'w') as outfile:
+    executable = os.path.join(LIGHTY_HOME, "clean-start-controller.sh")
+    config_file = LIGHTY_CONFIG
+    if config_file is None and PORT_ALLOCATION == 'dynamic':
+        config_file = write_lighty_config(os.path.join(LOG_DIRECTORY, "restconf.json"), free_port(), free_port())
+    with open(ODL_LOG, 'w') as outfile:
         return subprocess.Popen(
-            ["sh", executable], stdout=outfile, stderr=outfile, stdin=None)
+            ["sh", executable] + ([config_file] if config_file else []),
+            stdout=outfile, stderr=outfile, stdin=None)
+
+
+def write_lighty_config(config_file, http_port, websocket_port):
+    # Karaf reads its ports from the assembly etc/ files, only lighty can be
+    # moved to other ports at start-up.
+    with open(config_file, 'w') as config:
+        json.dump({"restconf": {"inetAddress": "0.0.0.0",
+                                "httpPort": http_port,
+                                "webSocketPort": websocket_port,
+                                "restconfServletContextPath": "/restconf",
+                                "jsonRestconfServiceType": "DRAFT_02"}}, config)
+    set_restconf_base_url("http://localhost:" + str(http_port) + "/restconf")
+    return config_file
 
 
 def install_karaf_feature(feature_name: str):
     print("installing feature " + feature_name)
-    executable = os.path.join(
-        os.path.dirname(os.path.realpath(__file__)),
-        "..", "..", "..", "karaf", "target", "assembly", "bin", "client")
+    executable = os.path.join(KARAF_HOME, "bin", "client")
     return subprocess.run([executable],
                           input='feature:install ' + feature_name + '\n feature:list | grep '
                           + feature_name + ' \n logout \n',
                           universal_newlines=True, check=False)
 
 
+def get_session():
+    # pylint: disable=global-statement
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = configure_session()
+    return _SESSION
+
+
+def configure_session(pool_size=HTTP_POOL_SIZE, retries=HTTP_RETRIES, backoff=HTTP_BACKOFF):
+    # pylint: disable=global-statement
+    global _SESSION
+    # Only connection errors are retried: RESTCONF RPCs are not idempotent and
+    # must never be replayed once the request has reached the controller.
+    retry = Retry(total=retries, connect=retries, read=0, redirect=0, backoff_factor=backoff)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                            max_retries=retry)
+    session = requests.Session()
+    session.auth = (ODL_LOGIN, ODL_PWD)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if _SESSION is not None:
+        _SESSION.close()
+    _SESSION = session
+    return session
+
+
+def close_session():
+    # pylint: disable=global-statement
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+
+
+def restconf_request(method: str, url: str, data=None, headers=None):
+    if method != "GET":
+        invalidate_get_cache()
+    elif GET_CACHE and url.startswith(GET_CACHE_URLS):
+        return cached_get_request(url, headers)
+    return send_request(method, url, data, headers)
+
+
+def send_request(method: str, url: str, data=None, headers=None):
+    if not REQUEST_LOG:
+        return get_session().request(
+            method, url.format(RESTCONF_BASE_URL),
+            data=data,
+            headers=TYPE_APPLICATION_JSON if headers is None else headers)
+    sent = [0]
+    if isinstance(data, (str, bytes)):
+        sent[0] = len(data.encode('utf-8') if isinstance(data, str) else data)
+    elif data is not None:
+        data = counted_chunks(data, sent)
+    start = time.perf_counter()
+    try:
+        response = get_session().request(
+            method, url.format(RESTCONF_BASE_URL),
+            data=data,
+            headers=TYPE_APPLICATION_JSON if headers is None else headers)
+    except requests.exceptions.RequestException as err:
+        record_request(method, url, type(err).__name__, sent[0], None, time.perf_counter() - start)
+        raise
+    record_request(method, url, response.status_code, sent[0], len(response.content), time.perf_counter() - start)
+    return response
+
+
+def cached_get_request(url: str, headers=None):
+    key = (url.format(RESTCONF_BASE_URL), json.dumps(headers, sort_keys=True))
+    with _GET_CACHE_LOCK:
+        if not GET_CACHE_STATS['hits'] + GET_CACHE_STATS['misses']:
+            atexit.register(report_get_cache)
+        cached = _GET_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < GET_CACHE_TTL:
+            GET_CACHE_STATS['hits'] += 1
+            GET_CACHE_STATS['saved_bytes'] += len(cached[1].content)
+            return cached[1]
+        GET_CACHE_STATS['misses'] += 1
+        writes = GET_CACHE_STATS['writes']
+    response = send_request("GET", url, headers=headers)
+    if response.status_code != requests.codes.ok:
+        return response
+    decoded = response.json()
+    response.json = lambda **kwargs: decoded
+    with _GET_CACHE_LOCK:
+        # not kept if the data may have changed while it was read
+        if GET_CACHE_STATS['writes'] == writes:
+            _GET_CACHE[key] = (time.monotonic(), response)
+    return response
+
+
+def invalidate_get_cache():
+    with _GET_CACHE_LOCK:
+        GET_CACHE_STATS['writes'] += 1
+        if _GET_CACHE:
+            GET_CACHE_STATS['invalidations'] += 1
+            _GET_CACHE.clear()
+
+
+def report_get_cache():
+    requests_count = GET_CACHE_STATS['hits'] + GET_CACHE_STATS['misses']
+    print("\nGET cache: {} hits out of {} cacheable GETs ({:.1%}), {} invalidations, {:.1f} KB not transferred".format(
+        GET_CACHE_STATS['hits'], requests_count, GET_CACHE_STATS['hits'] / requests_count if requests_count else 0,
+        GET_CACHE_STATS['invalidations'], GET_CACHE_STATS['saved_bytes'] / 1024))
+
+
+def counted_chunks(chunks, sent):
+    for chunk in chunks:
+        sent[0] += len(chunk)
+        yield chunk
+
+
+def record_request(method, url, status, request_bytes, response_bytes, elapsed):
+    # pylint: disable=global-statement,too-many-arguments
+    global _REQUEST_LOG_FILE
+    path = url.replace("{}", "", 1).replace(RESTCONF_BASE_URL, "", 1)
+    record = {'time': time.time(),
+              'suite': REQUEST_SUITE,
+              'method': method,
+              'url': path,
+              'rpc': request_report.request_name(method, path),
+              'status': status,
+              'request_bytes': request_bytes,
+              'response_bytes': response_bytes,
+              'elapsed_ms': elapsed * 1000}
+    with _REQUEST_LOG_LOCK:
+        if _REQUEST_LOG_FILE is None:
+            os.makedirs(os.path.dirname(os.path.abspath(REQUEST_LOG)), exist_ok=True)
+            _REQUEST_LOG_FILE = open(REQUEST_LOG, 'a', buffering=1)  # pylint: disable=consider-using-with
+            if REQUEST_LOG_REPORT:
+                atexit.register(report_requests)
+        _REQUEST_LOG_FILE.write(json.dumps(record) + "\n")
+
+
+def report_requests(top=5):
+    print()
+    request_report.print_report(request_report.summarize(request_report.read_records([REQUEST_LOG])), top)
+    print("all requests recorded in " + REQUEST_LOG)
+
+
+def benchmark_session(url=URL_CONFIG_NETCONF_TOPO, iterations=50):
+    # Compare the per-call latency of a bare requests.request (new TCP connection
+    # and basic auth each time) with the pooled keep-alive session.
+    full_url = url.format(RESTCONF_BASE_URL)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        requests.request("GET", full_url, headers=TYPE_APPLICATION_JSON, auth=(ODL_LOGIN, ODL_PWD))
+    bare = (time.perf_counter() - start) / iterations
+    restconf_request("GET", url)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        restconf_request("GET", url)
+    pooled = (time.perf_counter() - start) / iterations
+    result = {'iterations': iterations,
+              'bare_ms': bare * 1000,
+              'pooled_ms': pooled * 1000,
+              'saved_ms': (bare - pooled) * 1000,
+              'saved_pct': (bare - pooled) * 100 / bare if bare else 0.0}
+    print("bare request: {bare_ms:.2f} ms/call, pooled session: {pooled_ms:.2f} ms/call, "
+          "saved {saved_ms:.2f} ms/call ({saved_pct:.1f}%) over {iterations} calls".format(**result))
+    return result
+
+
 def get_request(url):
-    return requests.request(
-        "GET", url.format(RESTCONF_BASE_URL),
-        headers=TYPE_APPLICATION_JSON,
-        auth=(ODL_LOGIN, ODL_PWD))
+    return restconf_request("GET", url)
 
 
 def post_request(url, data):
     if data:
         print(json.dumps(data))
-        return requests.request(
-            "POST", url.format(RESTCONF_BASE_URL),
-            data=json.dumps(data),
-            headers=TYPE_APPLICATION_JSON,
-            auth=(ODL_LOGIN, ODL_PWD))
-
-    return requests.request(
-        "POST", url.format(RESTCONF_BASE_URL),
-        headers=TYPE_APPLICATION_JSON,
-        auth=(ODL_LOGIN, ODL_PWD))
+        return restconf_request("POST", url, data=json.dumps(data))
+    return restconf_request("POST", url)
 
 
 def post_xmlrequest(url, data):
     if data:
-        return requests.request(
-            "POST", url.format(RESTCONF_BASE_URL),
-            data=data,
-            headers=TYPE_APPLICATION_XML,
-            auth=(ODL_LOGIN, ODL_PWD))
+        return restconf_request("POST", url, data=data, headers=TYPE_APPLICATION_XML)
     return None
 
 
 def put_request(url, data):
-    return requests.request(
-        "PUT", url.format(RESTCONF_BASE_URL),
-        data=json.dumps(data),
-        headers=TYPE_APPLICATION_JSON,
-        auth=(ODL_LOGIN, ODL_PWD))
+    return restconf_request("PUT", url, data=json.dumps(data))
 
 
 def put_xmlrequest(url, data):
-    return requests.request(
-        "PUT", url.format(RESTCONF_BASE_URL),
-        data=data,
-        headers=TYPE_APPLICATION_XML,
-        auth=(ODL_LOGIN, ODL_PWD))
+    return restconf_request("PUT", url, data=data, headers=TYPE_APPLICATION_XML)
 
 
 def rawput_request(url, data):
-    return requests.request(
-        "PUT", url.format(RESTCONF_BASE_URL),
-        data=data,
-        headers=TYPE_APPLICATION_JSON,
-        auth=(ODL_LOGIN, ODL_PWD))
+    return restconf_request("PUT", url, data=data)
+
 
 def rawpost_request(url, data):
-    return requests.request(
-        "POST", url.format(RESTCONF_BASE_URL),
-        data=data,
-        headers=TYPE_APPLICATION_JSON,
-        auth=(ODL_LOGIN, ODL_PWD))
+    return restconf_request("POST", url, data=data)
 
 
 def delete_request(url):
-    return requests.request(
-        "DELETE", url.format(RESTCONF_BASE_URL),
-        headers=TYPE_APPLICATION_JSON,
-        auth=(ODL_LOGIN, ODL_PWD))
+    return restconf_request("DELETE", url)
+
+
+def file_chunks(file_name, chunk_size=UPLOAD_CHUNK_SIZE):
+    with open(file_name, 'rb') as source:
+        chunk = source.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = source.read(chunk_size)
+
+
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_request(method: str, url: str, source, headers=None, compress=None):
+    # Send a file path or a generator of bytes as a chunked request body, never
+    # holding the whole payload in memory. The body is gzip-encoded unless the
+    # server was found not to accept it; a file path is then re-sent in clear.
+    # pylint: disable=global-statement
+    global UPLOAD_GZIP
+    compress = UPLOAD_GZIP if compress is None else compress
+    headers = dict(TYPE_APPLICATION_JSON if headers is None else headers)
+    chunks = file_chunks(source) if isinstance(source, str) else source
+    if not compress:
+        return restconf_request(method, url, data=chunks, headers=headers)
+    response = restconf_request(method, url, data=gzip_chunks(chunks),
+                                headers=dict(headers, **{'Content-Encoding': 'gzip'}))
+    if response.status_code in (requests.codes.bad_request, requests.codes.unsupported_media_type) and \
+            isinstance(source, str):
+        UPLOAD_GZIP = False
+        response = restconf_request(method, url, data=file_chunks(source), headers=headers)
+    return response
+
+
+def controller_build():
+    # Build of the controller started by start_tpce(), identified by the
+    # creation of its TransportPCE artifacts. None when it cannot be found.
+    if "USE_LIGHTY" in os.environ and os.environ['USE_LIGHTY'] == 'True':
+        artifact = os.path.join(LIGHTY_HOME, "tpce.jar")
+    else:
+        artifact = os.path.join(KARAF_HOME, "system", "org", "opendaylight", "transportpce")
+    try:
+        return "{}|{}".format(os.path.realpath(artifact), os.stat(artifact).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def upload_cache_file(url: str, file_name: str, build: str):
+    stat = os.stat(file_name)
+    key = "{}|{}|{}|{}|{}".format(url, os.path.realpath(file_name), stat.st_mtime_ns, stat.st_size, build)
+    return os.path.join(UPLOAD_CACHE_DIRECTORY, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json")
+
+
+def put_file_request(url: str, file_name: str):
+    # XML sample files are converted once to their JSON form by the controller
+    # itself (read back after the first upload) and kept on disk, keyed by the
+    # source file mtime and the controller build, so that later runs stream the
+    # cached JSON instead. Without a known build, the XML file is always sent.
+    if not file_name.endswith(".xml"):
+        return stream_request("PUT", url, file_name)
+    build = controller_build()
+    if build is None:
+        return stream_request("PUT", url, file_name, headers=TYPE_APPLICATION_XML)
+    cache_file = upload_cache_file(url, file_name, build)
+    if os.path.isfile(cache_file):
+        return stream_request("PUT", url, cache_file)
+    response = stream_request("PUT", url, file_name, headers=TYPE_APPLICATION_XML)
+    if response.status_code in (requests.codes.ok, requests.codes.created, requests.codes.no_content):
+        converted = get_session().get(url.format(RESTCONF_BASE_URL), headers=TYPE_APPLICATION_JSON, stream=True)
+        if converted.status_code == requests.codes.ok:
+            os.makedirs(UPLOAD_CACHE_DIRECTORY, exist_ok=True)
+            with open(cache_file + ".tmp", 'wb') as cache:
+                for chunk in converted.iter_content(UPLOAD_CHUNK_SIZE):
+                    cache.write(chunk)
+            os.replace(cache_file + ".tmp", cache_file)
+        converted.close()
+    return response
 
 
 def mount_device(node_id, sim):
@@ -219,27 +688,33 @@ def mount_device(node_id, sim):
         "netconf-node-topology:username": NODES_LOGIN,
         "netconf-node-topology:password": NODES_PWD,
         "netconf-node-topology:host": "127.0.0.1",
-        "netconf-node-topology:port": SIMS[sim]['port'],
+        "netconf-node-topology:port": sim_port(sim),
         "netconf-node-topology:tcp-only": "false",
         "netconf-node-topology:pass-through": {}}]}
+    bookmark = log_bookmark(TPCE_LOG)
     response = put_request(url, body)
-    if wait_until_log_contains(TPCE_LOG, re.escape("Triggering notification stream NETCONF for node " + node_id), 60):
+    if wait_until_log_contains(TPCE_LOG, re.escape("Triggering notification stream NETCONF for node " + node_id), 60,
+                               bookmark=bookmark):
         print("Node " + node_id + " correctly added to tpce topology", end='... ', flush=True)
     else:
         print("Node " + node_id + " still not added to tpce topology", end='... ', flush=True)
         if response.status_code == requests.codes.ok:
             print("It was probably loaded at start-up", end='... ', flush=True)
         # TODO an else-clause to abort test would probably be nice here
+    # portmapping and topologies were updated by the controller while it connected
+    invalidate_get_cache()
     return response
 
 
 def unmount_device(node_id):
     url = URL_CONFIG_NETCONF_TOPO + "node/" + node_id
+    bookmark = log_bookmark(TPCE_LOG)
     response = delete_request(url)
-    if wait_until_log_contains(TPCE_LOG, re.escape("onDeviceDisConnected: " + node_id), 60):
+    if wait_until_log_contains(TPCE_LOG, re.escape("onDeviceDisConnected: " + node_id), 60, bookmark=bookmark):
         print("Node " + node_id + " correctly deleted from tpce topology", end='... ', flush=True)
     else:
         print("Node " + node_id + " still not deleted from tpce topology", end='... ', flush=True)
+    invalidate_get_cache()
     return response
 
 
@@ -342,7 +817,13 @@ def get_service_list_request(suffix: str):
     return get_request(url)
 
 
+def set_notification_receiver(url):
+    global NOTIFICATION_RECEIVER  # pylint: disable=global-statement
+    NOTIFICATION_RECEIVER = os.environ.get('TPCE_NOTIFICATION_RECEIVER', url)
+
+
 def service_create_request(attr):
+    SERVICE_REQUEST_TIMES[attr["input"]["service-name"]] = time.time()
     return post_request(URL_SERV_CREATE, attr)
 
 
@@ -358,6 +839,7 @@ def service_delete_request(servicename: str,
         "service-delete-req-info": {
             "service-name": servicename,
             "tail-retention": "no"}}}
+    SERVICE_REQUEST_TIMES[servicename] = time.time()
     return post_request(URL_SERV_DELETE, attr)
 
 
@@ -415,6 +897,148 @@ def path_computation_request(requestid: str, servicename: str, serviceaend, serv
     return post_request(URL_PATH_COMPUTATION_REQUEST, {"input": attr})
 
 
+def path_computation_batch_request(requestid: str, pathrequests, reserve_in_sequence=False):
+    # pathrequests: list of dicts with the path_computation_request arguments
+    # (servicename, serviceaend, servicezend and optionally hardconstraints,
+    # softconstraints, metric and other_attr), all computed against the same
+    # topology snapshot
+    requests_list = []
+    for pathrequest in pathrequests:
+        attr = {"service-name": pathrequest['servicename'],
+                "service-a-end": pathrequest['serviceaend'],
+                "service-z-end": pathrequest['servicezend'],
+                "pce-metric": pathrequest.get('metric', "hop-count")}
+        if pathrequest.get('hardconstraints'):
+            attr.update({"hard-constraints": pathrequest['hardconstraints']})
+        if pathrequest.get('softconstraints'):
+            attr.update({"soft-constraints": pathrequest['softconstraints']})
+        if pathrequest.get('other_attr'):
+            attr.update(pathrequest['other_attr'])
+        requests_list.append(attr)
+    return post_request(URL_PATH_COMPUTATION_BATCH_REQUEST,
+                        {"input": {"service-handler-header": {"request-id": requestid},
+                                   "reserve-in-sequence": reserve_in_sequence,
+                                   "path-request": requests_list}})
+
+
+def wait_for(predicate, timeout=60, interval=0.2, max_interval=2.0, description=None, replaces=None):
+    # Poll predicate with an exponential backoff until it returns a truthy value
+    # or the deadline expires. 'replaces' is the fixed sleep this wait stands for,
+    # used to report how many seconds of blind sleeping a suite no longer spends.
+    description = description or getattr(predicate, '__name__', 'condition')
+    print("Waiting for " + description, end='... ', flush=True)
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = interval
+    while True:
+        try:
+            result = predicate()
+        except (requests.exceptions.RequestException, ValueError, KeyError, IndexError):
+            result = None
+        now = time.monotonic()
+        if result or now >= deadline:
+            break
+        time.sleep(min(delay, deadline - now))
+        delay = min(delay * 2, max_interval)
+    elapsed = time.monotonic() - start
+    _record_wait(elapsed, replaces)
+    invalidate_get_cache()
+    if result:
+        print("reached after {:.1f}s".format(elapsed), end=' ', flush=True)
+    else:
+        print("not reached after " + str(timeout), end=" seconds! ", flush=True)
+    return result
+
+
+def _record_wait(elapsed, replaces):
+    if not WAIT_STATS['count']:
+        atexit.register(report_waits)
+    WAIT_STATS['count'] += 1
+    WAIT_STATS['waited'] += elapsed
+    if replaces is not None:
+        WAIT_STATS['replaced'] += replaces
+        WAIT_STATS['saved'] += max(replaces - elapsed, 0)
+
+
+def report_waits():
+    print("\nwait_for: {count} waits, {waited:.1f}s spent waiting, "
+          "{saved:.1f}s saved out of {replaced:.1f}s of replaced fixed sleeps".format(**WAIT_STATS))
+
+
+def netconf_node_connected(node: str):
+    def predicate():
+        response = get_netconf_oper_request(node)
+        return (response.status_code == requests.codes.ok and
+                response.json()['node'][0]['netconf-node-topology:connection-status'] == 'connected')
+    predicate.__name__ = "netconf node " + node + " connected"
+    return predicate
+
+
+def service_notified(servicename: str, state: str):
+    # Block until the notification receiver has recorded the service reaching
+    # state (or failing) since its last request, for at most NOTIFICATION_POLL_TIMEOUT.
+    # The service list stays the reference: a missed notification only costs
+    # one poll timeout per request, the next polls of the same wait skip it.
+    if NOTIFICATION_RECEIVER is None:
+        return None
+    since = SERVICE_REQUEST_TIMES.get(servicename, 0)
+    if (servicename, state, since) in _NOTIFICATION_MISSES:
+        return None
+    try:
+        response = get_session().get(
+            NOTIFICATION_RECEIVER + "/wait",
+            params={'service-name': servicename, 'state': state, 'since': since,
+                    'timeout': NOTIFICATION_POLL_TIMEOUT},
+            timeout=NOTIFICATION_POLL_TIMEOUT + 5)
+    except requests.exceptions.RequestException:
+        _NOTIFICATION_MISSES.add((servicename, state, since))
+        return None
+    if response.status_code != requests.codes.ok:
+        _NOTIFICATION_MISSES.add((servicename, state, since))
+        return None
+    record = response.json()
+    print("(" + record['service-state'] + " notified {:.1f}s after the request)".format(
+        record['received'] - since), end=' ', flush=True)
+    return record
+
+
+def service_in_state(servicename: str, state='inService'):
+    def predicate():
+        service_notified(servicename, state)
+        response = get_service_list_request("services/" + servicename)
+        return (response.status_code == requests.codes.ok and
+                response.json()['services'][0]['operational-state'] == state)
+    predicate.__name__ = "service " + servicename + " operational-state " + state
+    return predicate
+
+
+def service_in_service(servicename: str):
+    return service_in_state(servicename, 'inService')
+
+
+def service_deleted(servicename: str):
+    def predicate():
+        service_notified(servicename, 'deleted')
+        response = get_service_list_request("services/" + servicename)
+        return response.status_code in (requests.codes.not_found, requests.codes.conflict)
+    predicate.__name__ = "service " + servicename + " deleted"
+    return predicate
+
+
+def topology_link_present(link: str, url=URL_CONFIG_ORDM_TOPO):
+    def predicate():
+        return get_request(url + "ietf-network-topology:link/" + link).status_code == requests.codes.ok
+    predicate.__name__ = "topology link " + link + " present"
+    return predicate
+
+
+def device_interface_present(node: str, interface: str):
+    def predicate():
+        return check_netconf_node_request(node, "interface/" + interface).status_code == requests.codes.ok
+    predicate.__name__ = "interface " + interface + " present on " + node
+    return predicate
+
+
 def shutdown_process(process):
     if process is not None:
         for child in psutil.Process(process.pid).children():
@@ -432,53 +1056,43 @@ def start_honeynode(log_file: str, node_port: str, node_config_file_name: str):
     return None
 
 
-def wait_until_log_contains(log_file, regexp, time_to_wait=20):
-    # pylint: disable=lost-exception
-    stringfound = False
-    filefound = False
-    line = None
-    try:
-        with TimeOut(seconds=time_to_wait):
-            while not os.path.exists(log_file):
-                time.sleep(0.2)
-            filelogs = open(log_file, 'r')
-            filelogs.seek(0, 2)
-            filefound = True
-            print("Searching for pattern '" + regexp + "' in " + os.path.basename(log_file), end='... ', flush=True)
-            compiled_regexp = re.compile(regexp)
-            while True:
-                line = filelogs.readline()
-                if compiled_regexp.search(line):
-                    print("Pattern found!", end=' ')
-                    stringfound = True
-                    break
-                if not line:
-                    time.sleep(0.1)
-    except TimeoutError:
+def start_lightweight_simulator(log_file: str, node_port: str, node_config_file_name: str):
+    with open(log_file, 'w') as outfile:
+        return subprocess.Popen(
+            [sys.executable, LIGHTWEIGHT_SIMULATOR_EXECUTABLE, node_port,
+             os.path.join(SAMPLES_DIRECTORY, node_config_file_name)],
+            stdout=outfile, stderr=outfile)
+
+
+def subscribe_log(log_file, regexp, callback=None):
+    # The subscription future is resolved by the shared tail engine of log_file
+    # with the first line matching regexp, so that several waits can run concurrently.
+    return log_watcher.get_log_watcher(log_file).subscribe(regexp, callback)
+
+
+def wait_for_log_subscription(subscription, time_to_wait=20):
+    print("Searching for pattern '" + subscription.pattern.pattern + "' in "
+          + os.path.basename(subscription.watcher.log_file), end='... ', flush=True)
+    if subscription.wait(timeout=time_to_wait) is None:
         print("Pattern not found after " + str(time_to_wait), end=" seconds! ", flush=True)
-    except PermissionError:
-        print("Permission Error when trying to access the log file", end=" ... ", flush=True)
-    finally:
-        if filefound:
-            filelogs.close()
-        else:
+        if not os.path.exists(subscription.watcher.log_file):
             print("log file does not exist or is not accessible... ", flush=True)
-        return stringfound
-
+        return False
+    print("Pattern found!", end=' ')
+    return True
 
-class TimeOut:
-    def __init__(self, seconds=1, error_message='Timeout'):
-        self.seconds = seconds
-        self.error_message = error_message
 
-    def handle_timeout(self, signum, frame):
-        raise TimeoutError(self.error_message)
+def log_bookmark(log_file=TPCE_LOG):
+    return log_watcher.bookmark(log_file)
 
-    def __enter__(self):
-        signal.signal(signal.SIGALRM, self.handle_timeout)
-        signal.alarm(self.seconds)
 
-    def __exit__(self, type, value, traceback):
-        # pylint: disable=W0622
-        signal.alarm(0)
+def wait_until_log_contains(log_file, regexp, time_to_wait=20, bookmark=None):
+    # With a bookmark taken before the triggering request, lines already written
+    # since then are found too instead of only the ones appended after this call.
+    subscription = subscribe_log(log_file, regexp)
+    if bookmark is not None and log_watcher.scan_from_bookmark(bookmark, regexp) is not None:
+        subscription.cancel()
+        print("Pattern '" + regexp + "' found in " + os.path.basename(log_file) + " since bookmark!", end=' ')
+        return True
+    return wait_for_log_subscription(subscription, time_to_wait)
 
@@ -0,0 +1,376 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Synthetic openroadm-topology generator for scale testing.
+# Produces networks shaped like sample_configs/NW-for-test-5-4.xml (XML or
+# RESTCONF JSON) and the matching pce_portmapping_121.json-like portmapping.
+# Nodes and links are serialized one at a time, so that the output of a 10k+
+# ROADMs network can be written to disk or given as a body generator to
+# test_utils.stream_request() without being held in memory:
+#   python3 topology_generator.py --roadms 10000 --output topo.json --portmapping portmapping.json
+#   generator = TopologyGenerator(roadms=500, occupancy=0.3)
+#   test_utils.stream_request("PUT", test_utils.URL_CONFIG_ORDM_TOPO, generator.json_chunks())
+
+import argparse
+import base64
+import json
+import random
+import sys
+import time
+from xml.sax.saxutils import escape
+
+NAMESPACES = {
+    'ietf-network': "urn:ietf:params:xml:ns:yang:ietf-network",
+    'ietf-network-topology': "urn:ietf:params:xml:ns:yang:ietf-network-topology",
+    'org-openroadm-common-network': "http://org/openroadm/common/network",
+    'org-openroadm-network-topology': "http://org/openroadm/network/topology",
+    'transportpce-topology': "http://transportpce/topology"}
+
+# C-band flexgrid map, see GridConstant: 768 slots of 6.25GHz, one bit per
+# slot set when available, 8 slots per 50GHz fixed grid channel.
+EFFECTIVE_BITS = 768
+SLOTS_PER_CHANNEL = 8
+START_EDGE_FREQUENCY = 191.325
+GRANULARITY = 6.25
+FIBER_ATTENUATION = 0.2
+# candidates examined when pairing mesh degrees, see TopologyGenerator._pair_degrees()
+PAIRING_WINDOW = 8
+
+
+def xml_element(key, value, namespace=None):
+    # RESTCONF JSON conventions: a 'module:' prefix only where the namespace
+    # changes, lists for repeated elements.
+    module, _, name = key.rpartition(':')
+    attribute = ""
+    if module and NAMESPACES[module] != namespace:
+        namespace = NAMESPACES[module]
+        attribute = ' xmlns="' + namespace + '"'
+    if isinstance(value, list):
+        return "".join(xml_element(key, item, namespace) for item in value)
+    if isinstance(value, dict):
+        content = "".join(xml_element(child, item, namespace) for child, item in value.items())
+    elif isinstance(value, bool):
+        content = "true" if value else "false"
+    else:
+        content = escape(str(value))
+    return "<" + name + attribute + ">" + content + "</" + name + ">"
+
+
+class TopologyGenerator:
+
+    def __init__(self, roadms, degrees=3, srgs=1, pps=4, xpdrs=1, xpdr_ports=4, mesh_density=0.5,
+                 occupancy=0.0, span_length=(20, 100), openroadm_version="1.2.1", seed=0):
+        # pylint: disable=too-many-arguments
+        if degrees < 2 and roadms > 2:
+            raise ValueError("at least 2 degrees per ROADM are needed to build the ring")
+        if xpdrs * xpdr_ports > srgs * pps:
+            raise ValueError("not enough SRG add/drop ports for the " + str(xpdrs * xpdr_ports) + " XPDR ports")
+        self.roadms = roadms
+        self.degrees = degrees
+        self.srgs = srgs
+        self.pps = pps
+        self.xpdrs = xpdrs
+        self.xpdr_ports = xpdr_ports
+        self.mesh_density = mesh_density
+        self.occupancy = occupancy
+        self.span_length = span_length
+        self.openroadm_version = openroadm_version
+        self.seed = seed
+        self.spans = self._pair_degrees()
+        self.node_count = roadms * (degrees + srgs + xpdrs)
+        self.link_count = (roadms * (degrees * (degrees - 1) + 2 * degrees * srgs + 2 * xpdrs * xpdr_ports)
+                           + 2 * len(self.spans))
+
+    @staticmethod
+    def roadm_id(roadm):
+        return "OpenROADM-" + str(roadm)
+
+    @staticmethod
+    def clli(roadm):
+        return "clli" + str(roadm)
+
+    @staticmethod
+    def xpdr_id(roadm, xpdr):
+        return "XPONDER-" + str(roadm) + "-" + str(xpdr)
+
+    def _pair_degrees(self):
+        # The ROADMs are chained in a ring over DEG1/DEG2 so that the network is
+        # connected, then each other degree is wired with a probability of
+        # mesh_density to a degree of another, not yet adjacent, ROADM.
+        # Only these (roadm, degree, roadm, degree, length) spans are kept in memory.
+        rng = random.Random(self.seed)
+        spans = []
+        adjacent = set()
+        if self.roadms == 2:
+            spans.append((1, 1, 2, 1, rng.uniform(*self.span_length)))
+            adjacent.add((1, 2))
+        elif self.roadms > 2:
+            for roadm in range(1, self.roadms + 1):
+                peer = roadm % self.roadms + 1
+                spans.append((roadm, 1, peer, 2, rng.uniform(*self.span_length)))
+                adjacent.add((min(roadm, peer), max(roadm, peer)))
+        slots = [(roadm, degree) for roadm in range(1, self.roadms + 1) for degree in range(3, self.degrees + 1)
+                 if rng.random() < self.mesh_density]
+        rng.shuffle(slots)
+        pending = []
+        for roadm, degree in slots:
+            for index in range(len(pending) - 1, max(len(pending) - PAIRING_WINDOW, 0) - 1, -1):
+                peer, peer_degree = pending[index]
+                pair = (min(roadm, peer), max(roadm, peer))
+                if peer != roadm and pair not in adjacent:
+                    del pending[index]
+                    adjacent.add(pair)
+                    spans.append((roadm, degree, peer, peer_degree, rng.uniform(*self.span_length)))
+                    break
+            else:
+                pending.append((roadm, degree))
+        return spans
+
+    def _freq_map(self, rng):
+        # one byte per 50GHz channel
+        freq_map = bytearray(b'\xff' * (EFFECTIVE_BITS // SLOTS_PER_CHANNEL))
+        for channel in range(len(freq_map)):
+            if rng.random() < self.occupancy:
+                freq_map[channel] = 0
+        return {"avail-freq-maps": [{
+            "map-name": "cband",
+            "start-edge-freq": START_EDGE_FREQUENCY,
+            "freq-map-granularity": GRANULARITY,
+            "effective-bits": EFFECTIVE_BITS,
+            "freq-map": base64.b64encode(bytes(freq_map)).decode('ascii')}]}
+
+    @staticmethod
+    def _tp(tp_id, tp_type, **extra):
+        termination_point = {"tp-id": tp_id,
+                             "org-openroadm-common-network:tp-type": tp_type,
+                             "org-openroadm-common-network:administrative-state": "inService",
+                             "org-openroadm-common-network:operational-state": "inService"}
+        termination_point.update(extra)
+        return termination_point
+
+    @staticmethod
+    def _node(node_id, node_type, supporting_node, clli, termination_points, **attributes):
+        node = {"node-id": node_id,
+                "org-openroadm-common-network:node-type": node_type,
+                "org-openroadm-common-network:administrative-state": "inService",
+                "org-openroadm-common-network:operational-state": "inService",
+                "supporting-node": [{"network-ref": "openroadm-network", "node-ref": supporting_node},
+                                    {"network-ref": "clli-network", "node-ref": clli}],
+                "ietf-network-topology:termination-point": termination_points}
+        node.update(attributes)
+        return node
+
+    def nodes(self):
+        rng = random.Random(self.seed + 1)
+        for roadm in range(1, self.roadms + 1):
+            roadm_id = self.roadm_id(roadm)
+            clli = self.clli(roadm)
+            for degree in range(1, self.degrees + 1):
+                prefix = "DEG" + str(degree)
+                yield self._node(
+                    roadm_id + "-" + prefix, "DEGREE", roadm_id, clli,
+                    [self._tp(prefix + "-CTP-TX", "DEGREE-TX-CTP"), self._tp(prefix + "-CTP-RX", "DEGREE-RX-CTP"),
+                     self._tp(prefix + "-TTP-RX", "DEGREE-RX-TTP"), self._tp(prefix + "-TTP-TX", "DEGREE-TX-TTP")],
+                    **{"org-openroadm-network-topology:degree-attributes": self._freq_map(rng)})
+            for srg in range(1, self.srgs + 1):
+                prefix = "SRG" + str(srg)
+                termination_points = [self._tp(prefix + "-CP-RX", "SRG-RX-CP"),
+                                      self._tp(prefix + "-CP-TX", "SRG-TX-CP")]
+                for pp_num in range(1, self.pps + 1):
+                    termination_points.append(self._tp(prefix + "-PP" + str(pp_num) + "-RX", "SRG-RX-PP"))
+                    termination_points.append(self._tp(prefix + "-PP" + str(pp_num) + "-TX", "SRG-TX-PP"))
+                yield self._node(roadm_id + "-" + prefix, "SRG", roadm_id, clli, termination_points,
+                                 **{"org-openroadm-network-topology:srg-attributes": self._freq_map(rng)})
+            for xpdr in range(1, self.xpdrs + 1):
+                xpdr_id = self.xpdr_id(roadm, xpdr)
+                termination_points = []
+                for port in range(1, self.xpdr_ports + 1):
+                    for direction in ("RX", "TX"):
+                        termination_points.append(self._tp(
+                            "XPDR-NW" + str(port) + "-" + direction, "XPONDER-NETWORK",
+                            **{"transportpce-topology:associated-connection-map-port": "Client-" + str(port)}))
+                yield self._node(xpdr_id, "XPONDER", xpdr_id, clli, termination_points)
+
+    @staticmethod
+    def _link(link_id, opposite_link, link_type, source, destination, **attributes):
+        link = {"link-id": link_id,
+                "source": {"source-node": source[0], "source-tp": source[1]},
+                "destination": {"dest-node": destination[0], "dest-tp": destination[1]},
+                "org-openroadm-common-network:opposite-link": opposite_link,
+                "org-openroadm-common-network:link-type": link_type,
+                "org-openroadm-common-network:administrative-state": "inService",
+                "org-openroadm-common-network:operational-state": "inService"}
+        link.update(attributes)
+        return link
+
+    def _tp_link(self, link_type, source, source_suffix, destination, destination_suffix):
+        # source and destination are (node-id, tp-id prefix) couples, the
+        # opposite link goes from the destination TX to the source RX.
+        source_tp = source[1] + source_suffix
+        destination_tp = destination[1] + destination_suffix
+        return self._link(
+            source[0] + "-" + source_tp + "to" + destination[0] + "-" + destination_tp,
+            destination[0] + "-" + destination_tp.replace("RX", "TX") + "to" + source[0] + "-"
+            + source_tp.replace("TX", "RX"),
+            link_type, (source[0], source_tp), (destination[0], destination_tp))
+
+    def _internal_links(self, roadm):
+        # Same link-id conventions as the openroadm-topology built by the controller.
+        roadm_id = self.roadm_id(roadm)
+        for degree in range(1, self.degrees + 1):
+            deg_node = (roadm_id + "-DEG" + str(degree), "DEG" + str(degree))
+            for other in range(1, self.degrees + 1):
+                if other != degree:
+                    yield self._tp_link("EXPRESS-LINK", deg_node, "-CTP-TX",
+                                        (roadm_id + "-DEG" + str(other), "DEG" + str(other)), "-CTP-RX")
+            for srg in range(1, self.srgs + 1):
+                srg_node = (roadm_id + "-SRG" + str(srg), "SRG" + str(srg))
+                yield self._tp_link("ADD-LINK", srg_node, "-CP-TX", deg_node, "-CTP-RX")
+                yield self._tp_link("DROP-LINK", deg_node, "-CTP-TX", srg_node, "-CP-RX")
+        for xpdr in range(1, self.xpdrs + 1):
+            xpdr_id = self.xpdr_id(roadm, xpdr)
+            for port in range(1, self.xpdr_ports + 1):
+                # XPDR network ports are spread over the SRGs add/drop ports
+                index = (xpdr - 1) * self.xpdr_ports + port - 1
+                srg = "SRG" + str(index % self.srgs + 1)
+                pp_prefix = srg + "-PP" + str(index // self.srgs + 1)
+                srg_node = roadm_id + "-" + srg
+                output_id = xpdr_id + "XPDR-NW" + str(port) + "-TX-to" + srg_node + "-" + pp_prefix + "-RX"
+                input_id = srg_node + "-" + pp_prefix + "-TX-to-" + xpdr_id + "XPDR-NW" + str(port) + "-RX"
+                yield self._link(output_id, input_id, "XPONDER-OUTPUT", (xpdr_id, "XPDR-NW" + str(port) + "-TX"),
+                                 (srg_node, pp_prefix + "-RX"))
+                yield self._link(input_id, output_id, "XPONDER-INPUT", (srg_node, pp_prefix + "-TX"),
+                                 (xpdr_id, "XPDR-NW" + str(port) + "-RX"))
+
+    def _span_links(self, span):
+        roadm, degree, peer, peer_degree, length = span
+        ends = ((self.roadm_id(roadm) + "-DEG" + str(degree), "DEG" + str(degree)),
+                (self.roadm_id(peer) + "-DEG" + str(peer_degree), "DEG" + str(peer_degree)))
+        spanloss = round(length * FIBER_ATTENUATION, 1)
+        oms_attributes = {"span": {
+            "auto-spanloss": True,
+            "spanloss-base": spanloss,
+            "spanloss-current": spanloss,
+            "engineered-spanloss": round(spanloss + 0.2, 1),
+            "link-concatenation": [{"SRLG-Id": 0, "fiber-type": "smf", "SRLG-length": int(length * 1000),
+                                    "pmd": 0.5}]}}
+        for source, destination in (ends, ends[::-1]):
+            yield self._link(
+                source[0] + "-to-" + destination[0], destination[0] + "-to-" + source[0], "ROADM-TO-ROADM",
+                (source[0], source[1] + "-TTP-TX"), (destination[0], destination[1] + "-TTP-RX"),
+                **{"org-openroadm-common-network:clfi": "fiber" + str(roadm) + "-" + str(peer),
+                   "org-openroadm-common-network:TE-metric": max(int(length), 1),
+                   "org-openroadm-network-topology:OMS-attributes": oms_attributes})
+
+    def links(self):
+        for roadm in range(1, self.roadms + 1):
+            yield from self._internal_links(roadm)
+        for span in self.spans:
+            yield from self._span_links(span)
+
+    def xml_chunks(self):
+        # Equivalent of the sample files: one line per node or link.
+        namespace = NAMESPACES['ietf-network']
+        yield ('<network xmlns="' + namespace + '">\n<network-id>openroadm-topology</network-id>\n').encode('utf-8')
+        for node in self.nodes():
+            yield (xml_element("node", node, namespace) + "\n").encode('utf-8')
+        for link in self.links():
+            yield (xml_element("ietf-network-topology:link", link, namespace) + "\n").encode('utf-8')
+        yield b'</network>\n'
+
+    def json_chunks(self):
+        yield b'{"network": [{"network-id": "openroadm-topology", "node": ['
+        separator = b'\n'
+        for node in self.nodes():
+            yield separator + json.dumps(node).encode('utf-8')
+            separator = b',\n'
+        yield b'],\n"ietf-network-topology:link": ['
+        separator = b'\n'
+        for link in self.links():
+            yield separator + json.dumps(link).encode('utf-8')
+            separator = b',\n'
+        yield b']}]}\n'
+
+    def portmapping_chunks(self):
+        # Shaped like sample_configs/pce_portmapping_121.json, to be posted on
+        # test_utils.URL_FULL_PORTMAPPING.
+        yield b'{"nodes": ['
+        separator = b'\n'
+        for roadm in range(1, self.roadms + 1):
+            node_ids = [(self.roadm_id(roadm), "rdm")] + \
+                [(self.xpdr_id(roadm, xpdr), "xpdr") for xpdr in range(1, self.xpdrs + 1)]
+            for node_id, node_type in node_ids:
+                yield separator + json.dumps({
+                    "node-id": node_id,
+                    "node-info": {"node-type": node_type,
+                                  "openroadm-version": self.openroadm_version,
+                                  "node-clli": self.clli(roadm),
+                                  "node-vendor": "vendorA",
+                                  "node-model": "model1",
+                                  "node-ip-address": "1.2.3.4"},
+                    "mapping": [],
+                    "mc-capabilities": [],
+                    "cp-to-degree": [],
+                    "switching-pool-lcp": []}).encode('utf-8')
+                separator = b',\n'
+        yield b']}\n'
+
+
+def write_chunks(chunks, file_name):
+    if file_name == "-":
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.flush()
+        return
+    with open(file_name, 'wb') as output:
+        for chunk in chunks:
+            output.write(chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="generate a synthetic openroadm-topology network")
+    parser.add_argument('--roadms', type=int, required=True, help="number of ROADMs")
+    parser.add_argument('--degrees', type=int, default=3, help="degrees per ROADM")
+    parser.add_argument('--srgs', type=int, default=1, help="SRGs per ROADM")
+    parser.add_argument('--pps', type=int, default=4, help="add/drop ports per SRG")
+    parser.add_argument('--xpdrs', type=int, default=1, help="XPDRs per ROADM")
+    parser.add_argument('--xpdr-ports', type=int, default=4, help="network ports per XPDR")
+    parser.add_argument('--mesh-density', type=float, default=0.5,
+                        help="probability for a degree above DEG2 to be wired to another ROADM")
+    parser.add_argument('--occupancy', type=float, default=0.0,
+                        help="probability for a 50GHz channel to be already used on a DEG/SRG")
+    parser.add_argument('--span-length', type=float, nargs=2, default=(20, 100), metavar=('MIN', 'MAX'),
+                        help="span length range in km")
+    parser.add_argument('--openroadm-version', default="1.2.1", help="portmapping openroadm-version")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--format', choices=('xml', 'json'), default=None,
+                        help="topology format (default: from the output file extension, else json)")
+    parser.add_argument('--output', default="-", help="topology file, '-' for stdout")
+    parser.add_argument('--portmapping', default=None, help="portmapping file to write as well")
+    args = parser.parse_args()
+    try:
+        generator = TopologyGenerator(args.roadms, args.degrees, args.srgs, args.pps, args.xpdrs, args.xpdr_ports,
+                                      args.mesh_density, args.occupancy, tuple(args.span_length),
+                                      args.openroadm_version, args.seed)
+    except ValueError as err:
+        parser.error(str(err))
+    output_format = args.format or ('xml' if args.output.endswith(".xml") else 'json')
+    start = time.monotonic()
+    write_chunks(generator.xml_chunks() if output_format == 'xml' else generator.json_chunks(), args.output)
+    if args.portmapping:
+        write_chunks(generator.portmapping_chunks(), args.portmapping)
+    print("{} nodes and {} links ({} ROADM spans) generated in {:.1f}s".format(
+        generator.node_count, generator.link_count, len(generator.spans), time.monotonic() - start),
+        file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
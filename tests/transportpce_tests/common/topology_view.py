@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright (c) 2020 Orange, Inc. and others.  All rights reserved.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Indexed view of an ietf-network network (openroadm-topology, otn-topology,
+# openroadm-network...) as returned by RESTCONF, built in one pass so that
+# test assertions look nodes, termination points and links up by id or type
+# instead of walking the lists:
+#   topology = TopologyView.from_response(test_utils.get_ordm_topo_request(""))
+#   self.assertEqual(topology.node_types['ROADM-A1-SRG1'], 'SRG')
+#   self.assertEqual(topology.tp_count('XPDR-A1-XPDR1', 'XPONDER-CLIENT'), 2)
+#   self.assertEqual(topology.link_ids('ROADM-TO-ROADM'), {...})
+# The view only indexes the decoded JSON, node, tp and link dicts are not copied.
+
+import collections
+
+NODE_TYPE = 'org-openroadm-common-network:node-type'
+TP_TYPE = 'org-openroadm-common-network:tp-type'
+LINK_TYPE = 'org-openroadm-common-network:link-type'
+TERMINATION_POINT = 'ietf-network-topology:termination-point'
+LINK = 'ietf-network-topology:link'
+
+
+class TopologyView:
+    __slots__ = ('network_id', 'nodes', 'node_types', 'nodes_by_type', 'tps', 'tp_types', 'supporting',
+                 'links', 'link_types')
+
+    def __init__(self, network):
+        self.network_id = network.get('network-id')
+        # node-id -> node, node-type and (network-ref, node-ref) of its supporting nodes
+        self.nodes = {}
+        self.node_types = {}
+        self.nodes_by_type = collections.defaultdict(set)
+        self.supporting = {}
+        # node-id -> {tp-id: tp} and Counter of the tp-types
+        self.tps = {}
+        self.tp_types = {}
+        # link-id -> link, link-type -> link-ids
+        self.links = {}
+        self.link_types = collections.defaultdict(set)
+        for node in network.get('node', ()):
+            node_id = node['node-id']
+            self.nodes[node_id] = node
+            self.node_types[node_id] = node.get(NODE_TYPE)
+            self.nodes_by_type[node.get(NODE_TYPE)].add(node_id)
+            self.supporting[node_id] = frozenset(
+                (supporting['network-ref'], supporting['node-ref']) for supporting in node.get('supporting-node', ()))
+            tps = node.get(TERMINATION_POINT, ())
+            self.tps[node_id] = {tp['tp-id']: tp for tp in tps}
+            self.tp_types[node_id] = collections.Counter(tp.get(TP_TYPE) for tp in tps)
+        for link in network.get(LINK, ()):
+            self.links[link['link-id']] = link
+            self.link_types[link.get(LINK_TYPE)].add(link['link-id'])
+
+    @classmethod
+    def from_response(cls, response):
+        return cls(response.json()['network'][0])
+
+    def supported_by(self, node_id, network_ref, node_ref):
+        return (network_ref, node_ref) in self.supporting[node_id]
+
+    def tp(self, node_id, tp_id):
+        return self.tps[node_id].get(tp_id)
+
+    def tp_count(self, node_id, tp_type=None):
+        if tp_type is None:
+            return len(self.tps[node_id])
+        return self.tp_types[node_id][tp_type]
+
+    def link_ids(self, link_type=None):
+        if link_type is None:
+            return set(self.links)
+        return self.link_types.get(link_type, set())
+
+    def links_by_type(self):
+        # {link-type: {link-id, ...}}, comparable to an expected dict of sets
+        return {link_type: set(link_ids) for link_type, link_ids in self.link_types.items()}